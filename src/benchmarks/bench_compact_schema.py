@@ -0,0 +1,116 @@
+"""
+Benchmark: memory / on-disk size of processed tables, default wide dtypes vs. `src.core.schema`.
+
+    python -m src.benchmarks.bench_compact_schema --stations 100 --years 20 --fires 200000
+
+Synthetic weather_labeled (station x day) and fire_events frames are built
+with the dtypes the pipeline produced before the compact schema (float64
+features, nullable Int64 ids/codes, int64 label, object region names), then
+cast with `apply_schema`. Reports in-memory size (deep) and parquet size
+(snappy, single file) for both, plus per-column detail with --columns.
+"""
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+import pandas as pd
+
+from src.benchmarks.synthetic import REGIONS
+from src.core.schema import apply_schema, dtype_report, memory_mb
+
+
+def make_wide_labeled(n_stations: int, n_years: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2000-01-01", periods=n_years * 365, freq="D")
+    n = n_stations * len(dates)
+    season = np.tile(np.sin(2 * np.pi * (dates.dayofyear.to_numpy() - 105) / 365.25), n_stations)
+    wd = rng.uniform(0, 2 * np.pi, n)
+    sky = pd.array(rng.integers(1, 5, n), dtype="Int64")
+    sky[rng.random(n) < 0.01] = pd.NA
+    return pd.DataFrame({
+        "station_id": pd.array(np.repeat(90 + np.arange(n_stations), len(dates)), dtype="Int64"),
+        "date": np.tile(dates.to_numpy(), n_stations),
+        "TA": np.round(12 + 13 * season + rng.normal(0, 3, n), 1),
+        "TA_dtr": np.round(np.abs(rng.normal(8, 3, n)), 1),
+        "POP": np.round(np.clip(35 + 25 * season + rng.normal(0, 20, n), 0, 100), 1),
+        "is_precip": pd.array(rng.integers(0, 2, n), dtype="Int64"),
+        "WD_sin": np.sin(wd),
+        "WD_cos": np.cos(wd),
+        "SKY": sky,
+        "fire_label": (rng.random(n) < 0.02).astype("int64"),
+    })
+
+
+def make_wide_fires(n_fires: int, n_stations: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng([seed, 1])
+    region = rng.integers(0, len(REGIONS), n_fires)
+    ts = pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 20 * 365 * 24 * 60, n_fires), unit="m")
+    return pd.DataFrame({
+        "fire_id": np.arange(n_fires),
+        "fire_datetime": ts,
+        "fire_date": ts.normalize(),
+        "CTPRV_NM": np.array([REGIONS[r][0] for r in region], dtype=object),
+        "SGNG_NM": np.array([REGIONS[r][1][rng.integers(len(REGIONS[r][1]))] for r in region], dtype=object),
+        "station_id": pd.array(90 + rng.integers(0, n_stations, n_fires), dtype="Int64"),
+        "dist_m": rng.gamma(2.0, 4000.0, n_fires),
+        "lon": rng.uniform(126.3, 129.4, n_fires),
+        "lat": rng.uniform(34.6, 38.3, n_fires),
+    })
+
+
+def _parquet_mb(df: pd.DataFrame, tmp_dir: str, name: str) -> float:
+    path = os.path.join(tmp_dir, f"{name}.parquet")
+    df.to_parquet(path, index=False)
+    return os.path.getsize(path) / 2**20
+
+
+def compare_table(name: str, wide: pd.DataFrame, tmp_dir: str, show_columns: bool = False) -> dict:
+    t0 = time.perf_counter()
+    compact = apply_schema(wide.copy())
+    cast_s = time.perf_counter() - t0
+
+    row = {
+        "table": name,
+        "rows": len(wide),
+        "mem_mb_wide": memory_mb(wide),
+        "mem_mb_compact": memory_mb(compact),
+        "disk_mb_wide": _parquet_mb(wide, tmp_dir, f"{name}_wide"),
+        "disk_mb_compact": _parquet_mb(compact, tmp_dir, f"{name}_compact"),
+        "cast_s": cast_s,
+    }
+    row["mem_saved_pct"] = 100 * (1 - row["mem_mb_compact"] / row["mem_mb_wide"])
+    row["disk_saved_pct"] = 100 * (1 - row["disk_mb_compact"] / row["disk_mb_wide"])
+    if show_columns:
+        print(f"\n[{name}]")
+        print(dtype_report(wide, compact).to_string(float_format="{:.2f}".format))
+    return row
+
+
+def run(n_stations: int = 100, n_years: int = 20, n_fires: int = 200_000, show_columns: bool = False) -> pd.DataFrame:
+    tables = {
+        "weather_labeled": make_wide_labeled(n_stations, n_years),
+        "fire_events": make_wide_fires(n_fires, n_stations),
+    }
+    with tempfile.TemporaryDirectory(prefix="firecast_schema_") as tmp_dir:
+        rows = [compare_table(name, df, tmp_dir, show_columns) for name, df in tables.items()]
+
+    result = pd.DataFrame(rows).set_index("table")
+    print()
+    print(result.to_string(float_format="{:.2f}".format))
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Memory / parquet size of wide vs. compact dtypes.")
+    parser.add_argument("--stations", type=int, default=100)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--fires", type=int, default=200_000)
+    parser.add_argument("--columns", action="store_true", help="print per-column dtype / size detail")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.stations, args.years, args.fires, args.columns)
@@ -0,0 +1,144 @@
+"""
+Benchmark: compiled NumPy scorer vs. the joblib/sklearn model.
+
+    python -m src.benchmarks.bench_compiled_scoring --repeat 5
+
+Needs a trained model in MODEL_DIR (base_lr.joblib + base_lr.compiled.json;
+`python -m src.models.compiled_model` exports the latter from an older model).
+
+- cold start: fresh interpreter -> load the model -> score one row, median
+  wall time over `--repeat`, for the bare scorer and for
+  predict_daily_base.load_model (which also imports pandas / pyarrow)
+- per batch: median predict_proba latency at several batch sizes
+- parity: max |difference| of P(fire) on random feature rows
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.config.paths import ROOT
+
+# 새 인터프리터에서 실행: import + load + 1행 점수까지의 시간과 sklearn import 여부를 출력
+COLD_START = {
+    "compiled (numpy only)": (
+        "from src.models.compiled_model import load_compiled\n"
+        "m = load_compiled()\n"
+        "p = m.predict_prob([[0.0] * len(m.features)])\n"
+    ),
+    "joblib (sklearn)": (
+        "import joblib\n"
+        "from src.config.paths import MODEL_DIR\n"
+        "m = joblib.load(MODEL_DIR / 'base_lr.joblib')\n"
+        "p = m.predict_proba([[0.0] * m.n_features_in_])\n"
+    ),
+    "load_model(scorer='compiled')": (
+        "from src.models.predict_daily_base import load_model\n"
+        "m = load_model('compiled')\n"
+    ),
+    "load_model(scorer='sklearn')": (
+        "from src.models.predict_daily_base import load_model\n"
+        "m = load_model('sklearn')\n"
+    ),
+}
+_WRAP = (
+    "import time, sys, json, warnings\n"
+    "warnings.simplefilter('ignore')\n"
+    "t0 = time.perf_counter()\n"
+    "{body}"
+    "print(json.dumps({{'in_process_s': time.perf_counter() - t0, 'sklearn': 'sklearn' in sys.modules}}))\n"
+)
+BATCH_SIZES = (1, 64, 4096, 262_144)
+
+
+def cold_start(repeat: int) -> pd.DataFrame:
+    env = dict(os.environ, FIRECAST_TELEMETRY="0")
+    rows = []
+    for name, body in COLD_START.items():
+        walls, inproc, sk = [], [], None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, "-c", _WRAP.format(body=body)],
+                cwd=Path(ROOT).parent, env=env, check=True, capture_output=True, text=True,
+            )
+            walls.append(time.perf_counter() - t0)
+            res = json.loads(out.stdout.strip().splitlines()[-1])
+            inproc.append(res["in_process_s"])
+            sk = res["sklearn"]
+        rows.append({
+            "target": name,
+            "wall_ms": statistics.median(walls) * 1000,
+            "import_load_score_ms": statistics.median(inproc) * 1000,
+            "imports_sklearn": sk,
+        })
+    return pd.DataFrame(rows).set_index("target")
+
+
+def _median_s(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def batch_latency(model, compiled, repeat: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n in BATCH_SIZES:
+        X = pd.DataFrame(rng.normal(size=(n, len(compiled.features))), columns=compiled.features).astype("float32")
+        Xa = X.to_numpy(dtype="float64")
+        reps = max(3, repeat * (20 if n <= 4096 else 1))
+        sk = _median_s(lambda: model.predict_proba(X), reps)
+        cf = _median_s(lambda: compiled.predict_proba(X), reps)
+        ca = _median_s(lambda: compiled.predict_prob(Xa), reps)
+        rows.append({
+            "batch": n,
+            "sklearn_ms": sk * 1000,
+            "compiled_frame_ms": cf * 1000,
+            "compiled_ndarray_ms": ca * 1000,
+            "speedup_frame": sk / cf,
+            "max_abs_diff": float(np.max(np.abs(model.predict_proba(X)[:, 1] - compiled.predict_prob(X)))),
+        })
+    return pd.DataFrame(rows).set_index("batch")
+
+
+def run(repeat: int = 5) -> dict:
+    import joblib
+
+    from src.config.paths import MODEL_DIR
+    from src.models.compiled_model import load_compiled
+    from src.models.predict_daily_base import MODEL_NAME
+
+    model = joblib.load(MODEL_DIR / MODEL_NAME)
+    compiled = load_compiled()
+    print(f"[compiled] {compiled.source.get('estimator')} over {compiled.features}")
+
+    cold = cold_start(repeat)
+    print("\ncold start (median of fresh interpreters):")
+    print(cold.to_string(float_format="{:.1f}".format))
+
+    batch = batch_latency(model, compiled, repeat)
+    print("\nper-batch predict_proba latency (median):")
+    print(batch.to_string(float_format="{:.4g}".format))
+    return {"cold_start": cold, "batch": batch}
+
+
+def parse_args():
+    parser = ArgumentParser(description="Compiled NumPy scorer vs. joblib/sklearn: cold start + batch latency.")
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.repeat)
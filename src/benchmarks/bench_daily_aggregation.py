@@ -0,0 +1,198 @@
+"""
+Benchmark: single-pass `preprocess_weather` vs. the previous merge-per-column version.
+
+    python -m src.benchmarks.bench_daily_aggregation --stations 50 --years 10
+
+Synthetic hourly input (stations x years x 24h). All generated stations are
+treated as targets so the aggregation itself is measured, not the station filter.
+"""
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+import pandas as pd
+
+import src.core.weather_daily as weather_daily
+from src.core.weather_daily import (
+    SKY_MAP,
+    TARGET_HOURS,
+    parse_obs_datetime,
+    pick_column,
+    preprocess_weather,
+)
+
+
+def make_hourly_frame(n_stations: int, n_years: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    tm = pd.date_range("2010-01-01", periods=n_years * 365 * 24, freq="h").strftime("%Y%m%d%H%M")
+    n = len(tm) * n_stations
+
+    ta = np.round(rng.normal(12, 9, n), 1)
+    ta[rng.random(n) < 0.02] = -99
+    wd = rng.uniform(0, 2 * np.pi, n)
+    return pd.DataFrame({
+        "STN": np.repeat(np.arange(100, 100 + n_stations), len(tm)),
+        "TM": np.tile(np.asarray(tm, dtype=np.int64), n_stations),
+        "TA": ta,
+        "POP": rng.integers(0, 100, n),
+        "is_precip": rng.integers(0, 2, n),
+        "WD_sin": np.sin(wd),
+        "WD_cos": np.cos(wd),
+        "SKY": rng.choice(["DB01", "DB02", "DB03", "DB04"], n),
+    })
+
+
+# --- 이전 구현 (비교용) ---------------------------------------------------
+
+def _mode_or_na(series: pd.Series):
+    s = series.dropna().astype("string")
+    if s.empty:
+        return pd.NA
+    mode = s.mode()
+    if mode.empty:
+        return s.iloc[0]
+    return mode.iloc[0]
+
+
+def _dtr_0012(series: pd.Series):
+    s = pd.to_numeric(series, errors="coerce").dropna()
+    if len(s) < 2:
+        return pd.NA
+    return float(abs(s.max() - s.min()))
+
+
+def preprocess_weather_legacy(weather_raw: pd.DataFrame) -> pd.DataFrame:
+    cols = {
+        "station_id": pick_column(weather_raw.columns, ["STN", "stn", "지점", "지점번호"]),
+        "obs_datetime": pick_column(weather_raw.columns, ["TM", "일시", "datetime", "date"]),
+        "TA": pick_column(weather_raw.columns, ["TA", "평균기온", "평균기온(°C)"]),
+        "POP": pick_column(weather_raw.columns, ["POP", "강수확률"]),
+        "is_precip": pick_column(weather_raw.columns, ["is_precip", "IS_PRECIP"]),
+        "WD_sin": pick_column(weather_raw.columns, ["WD_sin", "wd_sin"]),
+        "WD_cos": pick_column(weather_raw.columns, ["WD_cos", "wd_cos"]),
+        "SKY": pick_column(weather_raw.columns, ["SKY", "sky"]),
+    }
+    cols = {k: v for k, v in cols.items() if v is not None}
+    weather = weather_raw[list(cols.values())].copy().rename(columns={v: k for k, v in cols.items()})
+
+    for col in ["station_id", "TA", "POP", "is_precip", "WD_sin", "WD_cos"]:
+        if col in weather.columns:
+            weather[col] = pd.to_numeric(weather[col], errors="coerce")
+            weather[col] = weather[col].replace([-99, -999, -9999], pd.NA)
+    if "SKY" in weather.columns:
+        weather["SKY"] = weather["SKY"].astype("string").str.strip().str.upper()
+
+    weather["obs_datetime"] = parse_obs_datetime(weather["obs_datetime"])
+    weather["date"] = weather["obs_datetime"].dt.normalize()
+    weather["hour"] = weather["obs_datetime"].dt.hour
+    weather = weather[weather["station_id"].isin(weather_daily.TARGET_STATIONS)]
+    weather = weather[weather["date"].notna()]
+
+    w_0012 = weather[weather["hour"].isin(TARGET_HOURS)].copy()
+    if w_0012.empty:
+        w_0012 = weather.copy()
+
+    keys = ["station_id", "date"]
+    out = w_0012[keys].drop_duplicates().sort_values(keys).reset_index(drop=True)
+    out = out.merge(w_0012.groupby(keys, as_index=False)["TA"].mean(), on=keys, how="left")
+    out = out.merge(
+        w_0012.groupby(keys, as_index=False)["TA"].agg(_dtr_0012).rename(columns={"TA": "TA_dtr"}),
+        on=keys, how="left",
+    )
+    out = out.merge(w_0012.groupby(keys, as_index=False)["POP"].mean(), on=keys, how="left")
+    out = out.merge(w_0012.groupby(keys, as_index=False)["is_precip"].max(), on=keys, how="left")
+    out = out.merge(w_0012.groupby(keys, as_index=False)["WD_sin"].mean(), on=keys, how="left")
+    out = out.merge(w_0012.groupby(keys, as_index=False)["WD_cos"].mean(), on=keys, how="left")
+
+    sky_daily = w_0012.groupby(keys, as_index=False)["SKY"].agg(_mode_or_na)
+    sky_num = sky_daily["SKY"].map(SKY_MAP)
+    sky_daily["SKY"] = sky_num.fillna(pd.to_numeric(sky_daily["SKY"], errors="coerce")).astype("Int64")
+    out = out.merge(sky_daily, on=keys, how="left")
+
+    out["is_precip"] = out["is_precip"].fillna(0).astype("Int64")
+    return out
+
+
+# -------------------------------------------------------------------------
+
+# weather 값은 float32 schema 로 저장되므로 (legacy 는 float64) 정확히 같지 않음:
+# float32 반올림 (상대 ~6e-8) 보다 충분히 넓고 실제 로직 차이 (>= 0.01) 는 잡는 허용 오차
+RTOL = 1e-5
+ATOL = 1e-6
+
+
+def _mismatched(a: pd.DataFrame, b: pd.DataFrame) -> dict:
+    """Column -> number of rows not within RTOL/ATOL (NaN must match NaN; dates exactly)."""
+    bad = {}
+    for col in a.columns:
+        if col == "date":
+            n = int((a[col] != b[col]).sum())
+        else:
+            x = pd.to_numeric(a[col].astype("object"), errors="coerce").astype(float).to_numpy()
+            y = pd.to_numeric(b[col].astype("object"), errors="coerce").astype(float).to_numpy()
+            n = int((~np.isclose(x, y, rtol=RTOL, atol=ATOL, equal_nan=True)).sum())
+        if n:
+            bad[col] = n
+    return bad
+
+
+def _max_abs_diff(a: pd.DataFrame, b: pd.DataFrame) -> dict:
+    diffs = {}
+    for col in a.columns:
+        if col == "date":
+            diffs[col] = float((a[col] != b[col]).sum())
+            continue
+        x = pd.to_numeric(a[col].astype("object"), errors="coerce").astype(float).to_numpy()
+        y = pd.to_numeric(b[col].astype("object"), errors="coerce").astype(float).to_numpy()
+        if not np.array_equal(np.isnan(x), np.isnan(y)):
+            diffs[col] = float("inf")
+        else:
+            both = ~np.isnan(x)
+            diffs[col] = float(np.abs(x[both] - y[both]).max()) if both.any() else 0.0
+    return diffs
+
+
+def run(n_stations: int, n_years: int, repeat: int = 1) -> dict:
+    raw = make_hourly_frame(n_stations, n_years)
+    print(f"hourly rows: {len(raw):,}")
+
+    old_targets = weather_daily.TARGET_STATIONS
+    weather_daily.TARGET_STATIONS = list(range(100, 100 + n_stations))
+    try:
+        timings = {}
+        results = {}
+        for name, fn in [("legacy", preprocess_weather_legacy), ("single_pass", preprocess_weather)]:
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                results[name] = fn(raw)
+                best = min(best, time.perf_counter() - t0)
+            timings[name] = best
+            print(f"{name:>12}: {best:8.2f}s  ({len(raw) / best:,.0f} rows/s)")
+    finally:
+        weather_daily.TARGET_STATIONS = old_targets
+
+    legacy, new = results["legacy"], results["single_pass"]
+    if list(legacy.columns) != list(new.columns) or len(legacy) != len(new):
+        raise AssertionError("Output schema/rows differ from legacy implementation")
+    diffs = _max_abs_diff(legacy, new)
+    print("max |legacy - single_pass| per column:", diffs)
+    bad = _mismatched(legacy, new)
+    if bad:
+        raise AssertionError(f"Values differ from legacy beyond rtol={RTOL:g}/atol={ATOL:g}: {bad}")
+    print(f"legacy == single_pass within rtol={RTOL:g}, atol={ATOL:g}")
+    print(f"speedup: {timings['legacy'] / timings['single_pass']:.1f}x")
+    return {"rows": len(raw), "timings": timings, "max_abs_diff": diffs}
+
+
+def parse_args():
+    parser = ArgumentParser(description="Benchmark daily weather aggregation.")
+    parser.add_argument("--stations", type=int, default=20)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=1)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.stations, args.years, repeat=args.repeat)
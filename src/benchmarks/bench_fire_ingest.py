@@ -0,0 +1,88 @@
+"""
+Benchmark: multi-province fire ingestion wall time vs. number of worker processes.
+
+    python -m src.benchmarks.bench_fire_ingest --workdir /tmp/firecast_fires --provinces 6 --fires 500000 --workers 1 2 4 8
+
+Synthetic fires (`synthetic.make_fires`) are split into one shapefile per
+시도 under <workdir>/data/raw/fires/<dataset>/ (every other one in
+EPSG:5179, so CRS normalization is exercised). For each worker count the
+fire store is removed and `ingest_fire_events` runs in a child process with
+FIRECAST_DATA_DIR pointing at the workdir (shapefile -> store -> nearest
+station -> fire_events). Reports wall time and speedup over 1 worker.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+import pandas as pd
+
+from src.config.paths import ROOT
+
+_CHILD = (
+    "from src.core.fire_events import ingest_fire_events\n"
+    "ingest_fire_events(workers={workers})\n"
+)
+
+
+def write_inputs(workdir: Path, n_provinces: int, n_fires: int, n_stations: int, n_years: int) -> None:
+    from src.benchmarks.synthetic import REGIONS, make_fires, make_stations
+
+    raw = workdir / "data" / "raw"
+    if (raw / "fires").exists():
+        shutil.rmtree(raw / "fires")
+    (raw / "meta").mkdir(parents=True, exist_ok=True)
+    stations = make_stations(n_stations)
+    stations.drop(columns=["region"]).to_csv(raw / "meta" / "stations.csv", index=False, encoding="utf-8")
+
+    fires = make_fires(stations, n_fires, 2000, n_years)
+    for i, (ctprv, _) in enumerate(REGIONS[:n_provinces]):
+        part = fires[fires["CTPRV_NM"] == ctprv]
+        out_dir = raw / "fires" / f"FRT000102_{41 + i}"
+        out_dir.mkdir(parents=True)
+        (part.to_crs("EPSG:5179") if i % 2 else part).to_file(out_dir / "fires.shp", encoding="utf-8")
+        print(f"[bench] {ctprv}: {len(part):,} fires -> {out_dir}")
+
+
+def run(workdir, n_provinces: int = 6, n_fires: int = 500_000, n_stations: int = 60, n_years: int = 20,
+        worker_counts=(1, 2, 4), reuse: bool = False) -> pd.DataFrame:
+    workdir = Path(workdir)
+    if not reuse or not (workdir / "data" / "raw" / "fires").exists():
+        write_inputs(workdir, n_provinces, n_fires, n_stations, n_years)
+
+    env = dict(os.environ, FIRECAST_DATA_DIR=str(workdir / "data"), FIRECAST_TELEMETRY="0")
+    rows = []
+    for workers in worker_counts:
+        shutil.rmtree(workdir / "data" / "processed" / "fire_store", ignore_errors=True)
+        t0 = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", _CHILD.format(workers=workers)],
+            cwd=Path(ROOT).parent, env=env, check=True, capture_output=True, text=True,
+        )
+        rows.append({"workers": workers, "wall_s": time.perf_counter() - t0})
+
+    result = pd.DataFrame(rows).set_index("workers")
+    result["speedup"] = result["wall_s"].iloc[0] / result["wall_s"]
+    print(f"\n{n_fires:,} fires in {n_provinces} province shapefiles, {os.cpu_count()} CPUs")
+    print(result.to_string(float_format="{:.2f}".format))
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Multi-province fire ingestion: wall time vs. worker processes.")
+    parser.add_argument("--workdir", required=True)
+    parser.add_argument("--provinces", type=int, default=6)
+    parser.add_argument("--fires", type=int, default=500_000)
+    parser.add_argument("--stations", type=int, default=60)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--reuse", action="store_true", help="keep existing synthetic shapefiles")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.workdir, args.provinces, args.fires, args.stations, args.years, args.workers, args.reuse)
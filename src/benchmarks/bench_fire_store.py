@@ -0,0 +1,97 @@
+"""
+Benchmark: filtered fire reads, raw shapefile vs. the GeoParquet fire store.
+
+    python -m src.benchmarks.bench_fire_store --fires 1000000 --years 20
+
+Writes a synthetic fire shapefile (`synthetic.make_fires`, EPSG:5186) to a
+temp dir, converts it once with `convert_fire_shapefiles`, then times the
+query "one county (시군구) in one year" three ways (median of --repeat):
+
+- shapefile: gpd.read_file + pandas filter (the old loaders)
+- shapefile_where: gpd.read_file(where=...) (OGR SQL filter, still scans the DBF)
+- fire_store: load_fires(years=, sgng=) (index + row-group pruning)
+
+plus a bbox query (~20 km square around the county) on the store.
+"""
+import statistics
+import tempfile
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+
+from src.benchmarks.synthetic import make_fires, make_stations
+from src.core.fire_store import convert_fire_shapefiles, load_fires
+
+
+def _median_s(fn, repeat: int):
+    times, out = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    return out, statistics.median(times)
+
+
+def run(n_fires: int = 1_000_000, n_years: int = 20, n_stations: int = 60, repeat: int = 3) -> pd.DataFrame:
+    start_year = 2000
+    year, sgng = start_year + n_years // 2, "강릉시"
+    with tempfile.TemporaryDirectory(prefix="firecast_fire_store_") as tmp:
+        raw_dir, store_dir = Path(tmp) / "raw", Path(tmp) / "store"
+        raw_dir.mkdir()
+        fires = make_fires(make_stations(n_stations), n_fires, start_year, n_years)
+        shp = raw_dir / "fires.shp"
+        fires.to_file(shp, encoding="utf-8")
+        del fires
+
+        t0 = time.perf_counter()
+        convert_fire_shapefiles(raw_dir, store_dir)
+        convert_s = time.perf_counter() - t0
+
+        def from_shapefile():
+            gdf = gpd.read_file(shp)
+            return gdf[(gdf["OCCRR_DTM"].astype(str).str[:4] == str(year)) & (gdf["SGNG_NM"] == sgng)]
+
+        where = f"SGNG_NM = '{sgng}' AND OCCRR_DTM LIKE '{year}%'"
+        cases = {
+            "shapefile": from_shapefile,
+            "shapefile_where": lambda: gpd.read_file(shp, where=where),
+            "fire_store": lambda: load_fires(years=[year], sgng=[sgng], raw_dir=raw_dir, store_dir=store_dir),
+        }
+        rows, results = [], {}
+        for name, fn in cases.items():
+            results[name], sec = _median_s(fn, repeat)
+            rows.append({"read": name, "rows": len(results[name]), "seconds": sec})
+
+        # 강릉시 산불 중심 20 km 사각형
+        county = results["fire_store"]
+        cx, cy = county.geometry.x.median(), county.geometry.y.median()
+        bbox = (cx - 10_000, cy - 10_000, cx + 10_000, cy + 10_000)
+        out, sec = _median_s(lambda: load_fires(bbox=bbox, raw_dir=raw_dir, store_dir=store_dir), repeat)
+        rows.append({"read": "fire_store_bbox_20km", "rows": len(out), "seconds": sec})
+        shp_bytes = sum(p.stat().st_size for p in raw_dir.iterdir())
+        store_bytes = sum(p.stat().st_size for p in store_dir.rglob("*.parquet"))
+
+    result = pd.DataFrame(rows).set_index("read")
+    result["speedup"] = result.loc["shapefile", "seconds"] / result["seconds"]
+    print(f"[fire_store] {n_fires:,} fires, {n_years} years: convert {convert_s:.1f}s, "
+          f"shapefile {shp_bytes / 2**20:.1f} MB -> store {store_bytes / 2**20:.1f} MB")
+    print(f"query: SGNG_NM={sgng}, year={year}")
+    print(result.to_string(float_format="{:.3f}".format))
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Filtered fire reads: shapefile + Python filter vs. GeoParquet store.")
+    parser.add_argument("--fires", type=int, default=1_000_000)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--stations", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.fires, args.years, args.stations, args.repeat)
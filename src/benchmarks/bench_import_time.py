@@ -0,0 +1,89 @@
+"""
+Benchmark: process start-up cost of CLI entry points and core modules.
+
+    python -m src.benchmarks.bench_import_time --repeat 5 --top 10
+
+Each target runs in a fresh interpreter (median wall time over `--repeat`).
+`--top` lists the heaviest imports of the slowest target from `-X importtime`.
+"""
+import statistics
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+from src.config.paths import ROOT
+
+TARGETS = {
+    "python (baseline)": ["-c", "pass"],
+    "firecast --help": ["-m", "src", "--help"],
+    "firecast predict --help": ["-m", "src", "predict", "--help"],
+    "import src.config.paths": ["-c", "import src.config.paths"],
+    "import src.core.datasets": ["-c", "import src.core.datasets"],
+    "import src.models.predict_daily_base": ["-c", "import src.models.predict_daily_base"],
+    "import src.core.stations": ["-c", "import src.core.stations"],
+    "import src.models.evaluate": ["-c", "import src.models.evaluate"],
+}
+
+
+def _run(args, extra=()) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *extra, *args],
+        cwd=Path(ROOT).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def time_target(args, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _run(args)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def heaviest_imports(args, top: int):
+    """`-X importtime` 의 cumulative 기준 상위 top 개 (src 제외, 최상위 패키지 단위)."""
+    stderr = _run(args, extra=("-X", "importtime")).stderr
+    cum = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self_us | cumulative_us | <들여쓰기>name"
+        _, cum_us, name = line.split("|")
+        name = name.strip()
+        if "." in name or name == "src":
+            continue
+        cum[name] = max(cum.get(name, 0), int(cum_us))
+    return sorted(((us, name) for name, us in cum.items()), reverse=True)[:top]
+
+
+def run(repeat: int = 5, top: int = 10) -> dict:
+    results = {name: time_target(args, repeat) for name, args in TARGETS.items()}
+    base = results["python (baseline)"]
+    print(f"{'target':40s} {'wall_ms':>9s} {'over_baseline_ms':>17s}")
+    for name, t in results.items():
+        print(f"{name:40s} {t * 1000:9.1f} {(t - base) * 1000:17.1f}")
+
+    if top:
+        slowest = max(results, key=results.get)
+        print(f"\nheaviest imports in '{slowest}' (cumulative ms):")
+        for cum_us, name in heaviest_imports(TARGETS[slowest], top):
+            print(f"  {name:30s} {cum_us / 1000:8.1f}")
+    return results
+
+
+def parse_args():
+    parser = ArgumentParser(description="Measure interpreter start-up + import cost of entry points.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(repeat=args.repeat, top=args.top)
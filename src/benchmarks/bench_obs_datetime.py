@@ -0,0 +1,75 @@
+"""
+Benchmark: `parse_obs_datetime` (layout detection + integer decode + memoization)
+vs. the generic `_parse_obs_datetime_slow` path, per TM format.
+
+    python -m src.benchmarks.bench_obs_datetime --stations 100 --days 365
+
+Note: str_YYYYMMDD is not identical on purpose. The slow path's first
+format (%Y%m%d%H%M) accepts non-padded fields, so e.g. "20151231" became
+2015-01-02 03:01; the fixed-width decoder returns 2015-12-31.
+"""
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+import pandas as pd
+
+import src.core.weather_daily as weather_daily
+from src.core.weather_daily import _parse_obs_datetime_slow, parse_obs_datetime
+
+
+FORMATS = {
+    "int_YYYYMMDDHHMM": lambda tm: pd.Series(tm.strftime("%Y%m%d%H%M").astype("int64")),
+    "str_YYYYMMDDHHMM": lambda tm: pd.Series(tm.strftime("%Y%m%d%H%M"), dtype="string"),
+    "str_YYYYMMDDHHMMSS": lambda tm: pd.Series(tm.strftime("%Y%m%d%H%M%S"), dtype="string"),
+    "str_YYYYMMDD": lambda tm: pd.Series(tm.normalize().strftime("%Y%m%d"), dtype="string"),
+    "str_ISO": lambda tm: pd.Series(tm.strftime("%Y-%m-%d %H:%M"), dtype="string"),
+}
+
+
+def _rows_per_sec(fn, values: pd.Series, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        weather_daily._SLOW_PATH_CACHE.clear()
+        t0 = time.perf_counter()
+        out = fn(values)
+        best = min(best, time.perf_counter() - t0)
+    return len(values) / best, out
+
+
+def run(n_stations: int, n_days: int, repeat: int = 3) -> pd.DataFrame:
+    tm = pd.date_range("2015-01-01", periods=n_days * 24, freq="h")
+    # 관측소마다 같은 시각이 반복되는 실제 hourly 데이터 형태
+    tm = pd.DatetimeIndex(np.tile(tm.to_numpy(), n_stations))
+
+    rows = []
+    for name, make in FORMATS.items():
+        values = make(tm)
+        fast_rps, fast = _rows_per_sec(parse_obs_datetime, values, repeat)
+        slow_rps, slow = _rows_per_sec(_parse_obs_datetime_slow, values, 1)
+        same = bool(fast.reset_index(drop=True).equals(slow.reset_index(drop=True)))
+        rows.append({
+            "format": name,
+            "rows": len(values),
+            "fast_rows_per_s": round(fast_rps),
+            "slow_rows_per_s": round(slow_rps),
+            "speedup": round(fast_rps / slow_rps, 1),
+            "identical": same,
+        })
+
+    result = pd.DataFrame(rows)
+    print(result.to_string(index=False))
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Benchmark TM timestamp parsing per format.")
+    parser.add_argument("--stations", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.stations, args.days, repeat=args.repeat)
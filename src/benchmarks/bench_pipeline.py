@@ -0,0 +1,209 @@
+"""
+Benchmark: pipeline stages end to end on synthetic inputs.
+
+    python -m src.benchmarks.bench_pipeline --workdir /tmp/firecast_bench --stations 20 --years 3 --fires 5000
+    python -m src.benchmarks.bench_pipeline --workdir /tmp/firecast_bench --reuse --baseline old.json
+
+Inputs come from src.benchmarks.synthetic. The stages run in a child
+process with FIRECAST_DATA_DIR / FIRECAST_MODEL_DIR pointing at the workdir,
+so the real data/ and models/ are never touched. Per stage: wall time,
+rows in/out, throughput and peak RSS (sampled from /proc/self/statm; the
+delta is relative to RSS when the stage started). Results go to
+<workdir>/bench_pipeline.json; with --baseline each stage is compared
+against a previous JSON.
+"""
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+from argparse import SUPPRESS, ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from src.config.paths import ROOT
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # /proc 가 없으면 프로세스 최대 RSS (Linux KB / macOS bytes) 로 대체
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+class RssSampler:
+    """Peak RSS while the block runs (background thread polling every `interval` s)."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.start_rss = self.peak_rss = 0
+        self._stop = threading.Event()
+
+    def _poll(self):
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, _rss_bytes())
+
+    def __enter__(self):
+        self.start_rss = self.peak_rss = _rss_bytes()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, _rss_bytes())
+
+
+def _stage(results: List[dict], name: str, fn: Callable, rows_in: Optional[int] = None):
+    with RssSampler() as rss:
+        t0 = time.perf_counter()
+        out = fn()
+        wall = time.perf_counter() - t0
+    rows_out = len(out) if hasattr(out, "__len__") else None
+    rows = rows_in if rows_in is not None else rows_out
+    rec = {
+        "stage": name,
+        "wall_s": round(wall, 4),
+        "rows_in": rows_in,
+        "rows_out": rows_out,
+        "rows_per_s": round(rows / wall, 1) if rows and wall > 0 else None,
+        "peak_rss_mb": round(rss.peak_rss / 2**20, 1),
+        "rss_delta_mb": round((rss.peak_rss - rss.start_rss) / 2**20, 1),
+    }
+    results.append(rec)
+    print(f"[bench] {name:28s} {wall:8.2f}s  rows/s={rec['rows_per_s']}  peak_rss={rec['peak_rss_mb']} MB")
+    return out
+
+
+def run_stages(holdout_days: int) -> List[dict]:
+    """Runs inside the child process (paths already redirected via environment)."""
+    import geopandas as gpd
+    import pandas as pd
+
+    import src.core.weather_daily as weather_daily
+    from src.config.paths import FIRE_RAW_DIR, PROC_DIR, ensure_dirs
+    from src.core.datasets import write_dataset
+    from src.core.fire_events import normalize_fire_events
+    from src.core.labeling import build_labels
+    from src.core.stations import WeatherStationRegistry, attach_nearest_station
+    from src.models.evaluate import train_and_save
+    from src.models.predict_daily_base import predict_for_date
+
+    ensure_dirs()
+    registry = WeatherStationRegistry.from_kma_meta()
+    # 합성 관측소 전체를 대상 관측소로 (기본값은 북강릉/강릉만)
+    weather_daily.TARGET_STATIONS = [s.station_id for s in registry.stations]
+
+    results: List[dict] = []
+    raw = _stage(results, "load_weather_raw", weather_daily.load_weather_raw)
+    daily = _stage(results, "preprocess_weather", lambda: weather_daily.preprocess_weather(raw), len(raw))
+    del raw
+    write_dataset("weather_daily", daily)
+
+    fires = _stage(results, "load_fire_shapefile", lambda: gpd.read_file(next(FIRE_RAW_DIR.glob("*.shp"))))
+    matched = _stage(results, "attach_nearest_station", lambda: attach_nearest_station(fires, registry), len(fires))
+    matched.to_parquet(PROC_DIR / "fires_with_manual_station.parquet", index=False)
+    _stage(results, "normalize_fire_events", normalize_fire_events, len(matched))
+
+    _stage(results, "build_labels", build_labels, len(daily))
+    _stage(
+        results, "build_past_n_days_features",
+        lambda: weather_daily.build_past_n_days_features(daily, n_days=3), len(daily),
+    )
+    _stage(results, "train_and_save", lambda: train_and_save(holdout_days=holdout_days), len(daily))
+
+    last_date = str(pd.to_datetime(daily["date"]).max().date())
+    _stage(results, "predict_for_date", lambda: predict_for_date(last_date))
+    return results
+
+
+def compare(current: dict, baseline: dict) -> None:
+    base = {s["stage"]: s for s in baseline["stages"]}
+    print(f"\n{'stage':28s} {'wall_s':>9s} {'baseline':>9s} {'ratio':>7s} {'rss_mb':>8s} {'baseline':>9s}")
+    for s in current["stages"]:
+        b = base.get(s["stage"])
+        if b is None:
+            continue
+        ratio = s["wall_s"] / b["wall_s"] if b["wall_s"] else float("nan")
+        print(f"{s['stage']:28s} {s['wall_s']:9.2f} {b['wall_s']:9.2f} {ratio:7.2f} "
+              f"{s['peak_rss_mb']:8.1f} {b['peak_rss_mb']:9.1f}")
+
+
+def run(
+        workdir: str,
+        stations: int = 20,
+        years: int = 3,
+        fires: int = 5000,
+        holdout_days: int = 180,
+        reuse: bool = False,
+        baseline: Optional[str] = None,
+) -> dict:
+    workdir = Path(workdir).resolve()
+    # 같은 경로를 덮어써도 비교할 수 있게 먼저 읽어 둠
+    baseline_result = json.loads(Path(baseline).read_text(encoding="utf-8")) if baseline else None
+    info_path = workdir / "synthetic.json"
+    if reuse and info_path.exists():
+        info = json.loads(info_path.read_text(encoding="utf-8"))
+    else:
+        from src.benchmarks.synthetic import write_synthetic_inputs
+
+        info = write_synthetic_inputs(workdir, n_stations=stations, n_years=years, n_fires=fires)
+        info_path.write_text(json.dumps(info), encoding="utf-8")
+
+    stages_path = workdir / "stages.json"
+    env = dict(
+        os.environ,
+        FIRECAST_DATA_DIR=str(workdir / "data"),
+        FIRECAST_MODEL_DIR=str(workdir / "models"),
+    )
+    subprocess.run(
+        [sys.executable, "-m", "src.benchmarks.bench_pipeline", "--child",
+         "--holdout-days", str(holdout_days), "--stages-out", str(stages_path)],
+        cwd=Path(ROOT).parent, env=env, check=True,
+    )
+
+    result = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "scale": {k: info[k] for k in ("stations", "years", "hourly_rows", "fires")},
+        "stages": json.loads(stages_path.read_text(encoding="utf-8")),
+    }
+    out = workdir / "bench_pipeline.json"
+    out.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print("saved ->", out)
+    if baseline_result:
+        compare(result, baseline_result)
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Benchmark pipeline stages on synthetic data.")
+    parser.add_argument("--workdir", default="/tmp/firecast_bench")
+    parser.add_argument("--stations", type=int, default=20)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--fires", type=int, default=5000)
+    parser.add_argument("--holdout-days", type=int, default=180)
+    parser.add_argument("--reuse", action="store_true", help="reuse synthetic inputs already in workdir")
+    parser.add_argument("--baseline", default=None, help="previous bench_pipeline.json to compare with")
+    parser.add_argument("--child", action="store_true", help=SUPPRESS)
+    parser.add_argument("--stages-out", default=None, help=SUPPRESS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.child:
+        stages = run_stages(args.holdout_days)
+        Path(args.stages_out).write_text(json.dumps(stages), encoding="utf-8")
+    else:
+        run(args.workdir, args.stations, args.years, args.fires, args.holdout_days, args.reuse, args.baseline)
@@ -0,0 +1,88 @@
+"""
+Benchmark: scoring service latency/throughput vs. one `predict_for_date` call per request.
+
+    python -m src.benchmarks.bench_scoring_service --requests 500 --clients 8
+
+Needs a trained model (src.models.evaluate) and the weather_labeled dataset.
+The service runs in-process on an ephemeral localhost port.
+"""
+import json
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+
+import numpy as np
+import pandas as pd
+
+from src.core.datasets import read_dataset
+from src.models.predict_daily_base import predict_for_date
+from src.models.scoring_service import make_server
+
+
+def _percentiles(lat_s) -> dict:
+    ms = np.asarray(lat_s) * 1000
+    return {f"p{q}_ms": float(np.percentile(ms, q)) for q in (50, 95, 99)}
+
+
+def run(n_requests: int, n_clients: int, n_baseline: int = 20, seed: int = 0) -> dict:
+    dates = pd.to_datetime(read_dataset("weather_labeled", columns=["date"])["date"]).dt.normalize().unique()
+    rng = np.random.default_rng(seed)
+    picks = [str(pd.Timestamp(d).date()) for d in rng.choice(dates, n_requests)]
+
+    baseline = []
+    for d in picks[:n_baseline]:
+        t0 = time.perf_counter()
+        try:
+            predict_for_date(d)
+        except ValueError:
+            pass
+        baseline.append(time.perf_counter() - t0)
+
+    server = make_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    local = threading.local()
+
+    def _request(d):
+        # 클라이언트 스레드마다 keep-alive 연결 하나
+        if not hasattr(local, "conn"):
+            local.conn = HTTPConnection("127.0.0.1", server.server_port)
+        t0 = time.perf_counter()
+        local.conn.request("GET", f"/predict?date={d}")
+        json.loads(local.conn.getresponse().read())
+        return time.perf_counter() - t0
+
+    _request(picks[0])  # 모델 로드
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_clients) as pool:
+        latencies = list(pool.map(_request, picks))
+    wall = time.perf_counter() - t0
+
+    status = server.state.status()
+    server.shutdown()
+    server.server_close()
+
+    result = {
+        "requests": n_requests,
+        "clients": n_clients,
+        "service": dict(_percentiles(latencies), throughput_rps=n_requests / wall),
+        "predict_for_date": dict(_percentiles(baseline), throughput_rps=len(baseline) / sum(baseline)),
+        "cache_hits": status["cache_hits"],
+        "cache_misses": status["cache_misses"],
+    }
+    print(json.dumps(result, indent=2))
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Benchmark the local scoring service.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--baseline", type=int, default=20)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.requests, args.clients, n_baseline=args.baseline)
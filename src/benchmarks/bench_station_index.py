@@ -0,0 +1,103 @@
+"""
+Benchmark: KD-tree nearest-station lookup vs. the to_crs + sjoin_nearest path.
+
+    python -m src.benchmarks.bench_station_index --stations 100 --fires 200000
+
+Uses synthetic stations/fires inside the Korean peninsula bbox, fires in
+EPSG:5186 like the raw fire shapefile.
+"""
+import time
+from argparse import ArgumentParser
+
+import geopandas as gpd
+import numpy as np
+
+from src.core.stations import (
+    WeatherStation,
+    WeatherStationRegistry,
+    attach_nearest_station,
+)
+
+
+LON_RANGE = (126.0, 129.5)
+LAT_RANGE = (34.3, 38.5)
+
+
+def make_registry(n_stations: int, seed: int = 0) -> WeatherStationRegistry:
+    rng = np.random.default_rng(seed)
+    return WeatherStationRegistry([
+        WeatherStation(
+            station_id=90 + i,
+            name_kr=f"관측소{i}",
+            name_en=f"Station{i}",
+            lat=float(rng.uniform(*LAT_RANGE)),
+            lon=float(rng.uniform(*LON_RANGE)),
+        )
+        for i in range(n_stations)
+    ])
+
+
+def make_fires(n_fires: int, seed: int = 1, crs: str = "EPSG:5186") -> gpd.GeoDataFrame:
+    rng = np.random.default_rng(seed)
+    gdf = gpd.GeoDataFrame(
+        {"fire_no": np.arange(n_fires)},
+        geometry=gpd.points_from_xy(rng.uniform(*LON_RANGE, n_fires), rng.uniform(*LAT_RANGE, n_fires)),
+        crs="EPSG:4326",
+    )
+    return gdf.to_crs(crs)
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def run(n_stations: int, n_fires: int, radius_km: float = 30.0) -> dict:
+    fires = make_fires(n_fires)
+
+    registry = make_registry(n_stations)
+    _, t_build = _timed(registry.spatial_index)
+
+    slow, t_sjoin = _timed(lambda: attach_nearest_station(fires, registry, use_index=False))
+    fast, t_index = _timed(lambda: attach_nearest_station(fires, registry, use_index=True))
+
+    index = registry.spatial_index()
+    xy = index.project(fires.geometry.x, fires.geometry.y, crs=fires.crs.to_string())
+    pairs, t_radius = _timed(lambda: index.within_radius(xy, radius_km * 1000))
+
+    # sjoin_nearest 는 동률이면 한 점에 여러 행을 돌려주므로 첫 행만 비교
+    slow = slow[~slow.index.duplicated()]
+    if list(slow.columns) != list(fast.columns):
+        raise AssertionError(f"Schema differs: sjoin {list(slow.columns)} vs index {list(fast.columns)}")
+    same_station = float((slow["station_id"].to_numpy() == fast["station_id"].to_numpy()).mean())
+    max_dist_diff = float(np.abs(slow["dist_m"].to_numpy() - fast["dist_m"].to_numpy()).max())
+
+    result = {
+        "stations": n_stations,
+        "fires": n_fires,
+        "index_build_s": t_build,
+        "sjoin_nearest_s": t_sjoin,
+        "kdtree_nearest_s": t_index,
+        "speedup": t_sjoin / t_index,
+        "within_radius_s": t_radius,
+        "within_radius_pairs": len(pairs),
+        "same_station_ratio": same_station,
+        "max_dist_diff_m": max_dist_diff,
+    }
+    for k, v in result.items():
+        print(f"{k:>20}: {v:.4f}" if isinstance(v, float) else f"{k:>20}: {v}")
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Benchmark nearest-station lookup.")
+    parser.add_argument("--stations", type=int, default=100)
+    parser.add_argument("--fires", type=int, default=200_000)
+    parser.add_argument("--radius-km", type=float, default=30.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.stations, args.fires, radius_km=args.radius_km)
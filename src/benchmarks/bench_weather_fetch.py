@@ -0,0 +1,85 @@
+"""
+Benchmark: weather_fetch throughput vs. concurrency, pooled vs. per-request connections.
+
+    python -m src.benchmarks.bench_weather_fetch --workdir /tmp/firecast_fetch --stations 10 --years 1 \
+        --latency-ms 50 --concurrency 1 4 16 32
+
+Starts `mock_kma_server` in a thread (random port, fixed per-request latency
+to stand in for network round trips) and fetches every (station, month) of
+hourly data into <workdir>/data/raw/weather for each setting, starting from
+an empty raw dir / checkpoint each time. Reports requests/s, connections
+opened and speedup over the first setting, then loads the fetched CSVs with
+`load_weather_raw` + `clean_hourly_weather` to check they feed ingestion.
+"""
+import asyncio
+import os
+import shutil
+import threading
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+import pandas as pd
+
+
+def run(workdir, n_stations: int = 10, n_years: int = 1, latency_ms: float = 50.0,
+        concurrency=(1, 4, 16), fail_rate: float = 0.0) -> pd.DataFrame:
+    workdir = Path(workdir)
+    # 경로 모듈이 import 되기 전에 data dir 지정
+    os.environ["FIRECAST_DATA_DIR"] = str(workdir / "data")
+    os.environ.setdefault("FIRECAST_TELEMETRY", "0")
+    from src.benchmarks.mock_kma_server import make_server
+    from src.config.paths import WEATHER_FETCH_CHECKPOINT, WEATHER_RAW_DIR
+    from src.core.weather_daily import TARGET_STATIONS, clean_hourly_weather, load_weather_raw
+    from src.core.weather_fetch import fetch_tasks, plan_tasks
+
+    server = make_server(port=0, latency_ms=latency_ms, fail_rate=fail_rate)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    # TARGET_STATIONS 를 포함해야 마지막 clean_hourly_weather 확인에 행이 남음
+    stations = (list(TARGET_STATIONS) + [s for s in range(90, 200) if s not in TARGET_STATIONS])[:n_stations]
+    tasks = plan_tasks(stations, "2020-01-01", f"{2020 + n_years - 1}-12-31", "hourly")
+    settings = [(c, True) for c in concurrency] + [(max(concurrency), False)]
+
+    rows = []
+    try:
+        for conc, keepalive in settings:
+            shutil.rmtree(WEATHER_RAW_DIR, ignore_errors=True)
+            WEATHER_FETCH_CHECKPOINT.unlink(missing_ok=True)
+            t0 = time.perf_counter()
+            summary = asyncio.run(fetch_tasks(
+                tasks, base_url, concurrency=conc, rate=0, keepalive=keepalive, retries=6))
+            wall = time.perf_counter() - t0
+            rows.append({"concurrency": conc, "keepalive": keepalive, "requests": summary["requests"],
+                         "connections": summary["connections"], "failed": summary["failed"],
+                         "wall_s": wall, "req_per_s": summary["requests"] / wall})
+    finally:
+        server.shutdown()
+
+    result = pd.DataFrame(rows)
+    result["speedup"] = result["wall_s"].iloc[0] / result["wall_s"]
+    print(f"\n{len(tasks)} hourly requests ({n_stations} stations x {n_years * 12} months), "
+          f"mock latency {latency_ms:g} ms")
+    print(result.to_string(index=False, float_format="{:.2f}".format))
+
+    hourly = clean_hourly_weather(load_weather_raw())
+    print(f"\nfetched CSVs -> clean_hourly_weather: {len(hourly):,} rows, "
+          f"stations {sorted(hourly['station_id'].unique().tolist())}")
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="KMA fetcher throughput against the local mock server.")
+    parser.add_argument("--workdir", required=True)
+    parser.add_argument("--stations", type=int, default=10)
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.workdir, args.stations, args.years, args.latency_ms, args.concurrency, args.fail_rate)
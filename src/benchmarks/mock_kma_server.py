@@ -0,0 +1,170 @@
+"""
+Local stand-in for the KMA API hub ASOS endpoints, replaying synthetic observations.
+
+    python -m src.benchmarks.mock_kma_server --port 8766 --latency-ms 40 --fail-rate 0.05 --max-rps 200
+
+GET /api/typ01/url/kma_sfctm3.php?stn=104&tm1=202003010000&tm2=202003312300   hourly
+GET /api/typ01/url/kma_sfcdd3.php?stn=104&tm1=20200101&tm2=20201231           daily
+
+Responses are KMA typ01-style text (disp=1): `#START7777`, a `#---` separator,
+a `#` column-name line (`YYMMDDHHMI STN TA ...`, `YYMMDD` for daily) followed
+by a `#` units line (`KST ID C % ...`) as the real endpoint writes them,
+comma-separated rows (time, STN, TA/POP/is_precip/SKY/WD_sin/WD_cos), `#7777END`. Values come from
+`synthetic.make_hourly_weather` (deterministic per station and year); daily
+rows are the day means (is_precip max, SKY most frequent).
+
+Knobs for offline throughput / failure testing: per-request latency,
+random 503s (`fail_rate`) and a global request rate above which 429 with
+Retry-After is returned (`max_rps`). HTTP/1.1 keep-alive, one thread per
+connection.
+"""
+import random
+import threading
+import time
+from argparse import ArgumentParser
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from src.benchmarks.synthetic import make_hourly_weather
+
+HOURLY_PATH = "/api/typ01/url/kma_sfctm3.php"
+DAILY_PATH = "/api/typ01/url/kma_sfcdd3.php"
+COLUMNS = ["STN", "TM", "TA", "POP", "is_precip", "SKY", "WD_sin", "WD_cos"]
+# 실제 응답 순서 (시각, 지점, 요소...) 와 두 줄 header (컬럼명 / 단위)
+WIRE_COLUMNS = ["TM", "STN", "TA", "POP", "is_precip", "SKY", "WD_sin", "WD_cos"]
+UNITS = ["KST", "ID", "C", "%", "-", "-", "-", "-"]
+
+
+@lru_cache(maxsize=256)
+def _station_year(stn: int, year: int) -> pd.DataFrame:
+    station = pd.DataFrame({"지점": [stn], "위도": [34.6 + (stn % 37) / 10]})
+    return make_hourly_weather(station, year, seed=stn)
+
+
+def hourly_rows(stn: int, tm1: str, tm2: str) -> pd.DataFrame:
+    lo, hi = int(tm1[:12].ljust(12, "0")), int(tm2[:12].ljust(12, "0"))
+    years = range(int(tm1[:4]), int(tm2[:4]) + 1)
+    df = pd.concat([_station_year(stn, y) for y in years], ignore_index=True)
+    return df[(df["TM"] >= lo) & (df["TM"] <= hi)]
+
+
+def daily_rows(stn: int, tm1: str, tm2: str) -> pd.DataFrame:
+    hourly = hourly_rows(stn, tm1[:8] + "0000", tm2[:8] + "2300")
+    hourly = hourly.assign(TM=hourly["TM"] // 10000, TA=hourly["TA"].where(hourly["TA"] > -99))
+    daily = hourly.groupby(["STN", "TM"], as_index=False).agg(
+        TA=("TA", "mean"), POP=("POP", "mean"), is_precip=("is_precip", "max"),
+        SKY=("SKY", lambda s: s.mode().iloc[0]), WD_sin=("WD_sin", "mean"), WD_cos=("WD_cos", "mean"),
+    )
+    return daily.round({"TA": 1, "POP": 1, "WD_sin": 4, "WD_cos": 4})[COLUMNS]
+
+
+def render(df: pd.DataFrame, time_name: str = "YYMMDDHHMI") -> bytes:
+    names = [time_name if c == "TM" else c for c in WIRE_COLUMNS]
+    lines = ["#START7777", "#" + "-" * 60, "# " + " ".join(names), "# " + " ".join(UNITS)]
+    lines.append(df[WIRE_COLUMNS].to_csv(index=False, header=False, lineterminator="\n").rstrip("\n"))
+    lines.append("#7777END")
+    return ("\n".join(line for line in lines if line) + "\n").encode("utf-8")
+
+
+class _RateWindow:
+    """Requests in the current 1-second window (for the 429 knob)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._second = 0
+        self._count = 0
+
+    def hit(self) -> int:
+        now = int(time.monotonic())
+        with self._lock:
+            if now != self._second:
+                self._second, self._count = now, 0
+            self._count += 1
+            return self._count
+
+
+def make_handler(latency_ms: float = 0.0, fail_rate: float = 0.0, max_rps: float = 0.0, seed: int = 0):
+    rng = random.Random(seed)
+    window = _RateWindow()
+    stats = {"requests": 0, "ok": 0, "throttled": 0, "failed": 0}
+    stats_lock = threading.Lock()
+
+    class MockKmaHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True
+
+        def _send(self, code: int, body: bytes, headers=()) -> None:
+            self.send_response(code)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in headers:
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _count(self, key: str) -> None:
+            with stats_lock:
+                stats["requests"] += 1
+                stats[key] += 1
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if url.path not in (HOURLY_PATH, DAILY_PATH) or not {"stn", "tm1", "tm2"} <= set(query):
+                self._send(404, b"use kma_sfctm3.php / kma_sfcdd3.php ?stn=&tm1=&tm2=\n")
+                return
+            if max_rps and window.hit() > max_rps:
+                self._count("throttled")
+                self._send(429, b"rate limited\n", [("Retry-After", "1")])
+                return
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            with stats_lock:
+                fail = rng.random() < fail_rate
+            if fail:
+                self._count("failed")
+                self._send(503, b"temporarily unavailable\n")
+                return
+
+            hourly = url.path == HOURLY_PATH
+            rows = (hourly_rows if hourly else daily_rows)(int(query["stn"]), query["tm1"], query["tm2"])
+            self._count("ok")
+            self._send(200, render(rows, "YYMMDDHHMI" if hourly else "YYMMDD"))
+
+        def log_message(self, format, *args):
+            pass
+
+    MockKmaHandler.stats = stats
+    return MockKmaHandler
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8766, latency_ms: float = 0.0,
+                fail_rate: float = 0.0, max_rps: float = 0.0, seed: int = 0) -> ThreadingHTTPServer:
+    handler = make_handler(latency_ms, fail_rate, max_rps, seed)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.stats = handler.stats
+    return server
+
+
+def parse_args():
+    parser = ArgumentParser(description="Serve synthetic KMA ASOS hourly/daily observations locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added per successful request")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="429 above this many requests/s (0 = off)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = make_server(args.host, args.port, args.latency_ms, args.fail_rate, args.max_rps)
+    print(f"[mock_kma] http://{args.host}:{server.server_port}{HOURLY_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[mock_kma] stopped", server.stats)
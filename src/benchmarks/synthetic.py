@@ -0,0 +1,164 @@
+"""
+Synthetic raw inputs in the same schemas as the real data, at configurable scale.
+
+    python -m src.benchmarks.synthetic --out /tmp/firecast_synth --stations 50 --years 5 --fires 20000
+
+Writes, under <out>/data/raw (the layout src.config.paths expects when
+FIRECAST_DATA_DIR=<out>/data):
+  weather/weather_<year>.csv   hourly STN/TM/TA/POP/is_precip/SKY/WD_sin/WD_cos
+  fires/FRT000102_42/fires.shp OCCRR_DTM/CTPRV_NM/SGNG_NM + point geometry (EPSG:5186)
+  meta/stations.csv            KMA station meta (지점/지점명/위도/경도/시작일/종료일)
+
+Temperature/precipitation follow seasonal + diurnal cycles, and fires are
+clustered around stations with a spring peak, so downstream stages see
+realistic shapes and class imbalance rather than uniform noise.
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FIRE_CRS = "EPSG:5186"
+# 대략적인 남한 육지 범위 (WGS84)
+LON_RANGE = (126.3, 129.4)
+LAT_RANGE = (34.6, 38.3)
+REGIONS = [
+    ("강원도", ["강릉시", "동해시", "삼척시", "속초시", "양양군", "고성군"]),
+    ("경기도", ["수원시", "용인시", "가평군", "양평군"]),
+    ("경상북도", ["안동시", "울진군", "영덕군", "봉화군"]),
+    ("경상남도", ["진주시", "합천군", "산청군"]),
+    ("충청북도", ["충주시", "제천시", "단양군"]),
+    ("전라남도", ["순천시", "광양시", "구례군"]),
+]
+# 월별 산불 발생 비중 (봄철 집중)
+FIRE_MONTH_WEIGHTS = np.array([8, 10, 20, 22, 9, 4, 2, 2, 2, 4, 7, 10], dtype="float64")
+
+
+def make_stations(n_stations: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    regions = rng.integers(0, len(REGIONS), n_stations)
+    return pd.DataFrame({
+        "지점": 90 + np.arange(n_stations),
+        "지점명": [f"관측소{i:03d}" for i in range(n_stations)],
+        "위도": np.round(rng.uniform(*LAT_RANGE, n_stations), 5),
+        "경도": np.round(rng.uniform(*LON_RANGE, n_stations), 5),
+        "시작일": "2000-01-01",
+        "종료일": "",
+        "region": regions,
+    })
+
+
+def make_hourly_weather(stations: pd.DataFrame, year: int, seed: int = 0) -> pd.DataFrame:
+    """One year of hourly KMA-style observations for every station."""
+    rng = np.random.default_rng([seed, year])
+    tm = pd.date_range(f"{year}-01-01", f"{year}-12-31 23:00", freq="h")
+    n_st, n_t = len(stations), len(tm)
+    n = n_st * n_t
+
+    doy = np.tile(tm.dayofyear.to_numpy(), n_st)
+    hour = np.tile(tm.hour.to_numpy(), n_st)
+    lat = np.repeat(stations["위도"].to_numpy(), n_t)
+    season = np.sin(2 * np.pi * (doy - 105) / 365.25)
+
+    ta = 12 + 13 * season - 0.8 * (lat - 36) + 4 * np.sin(2 * np.pi * (hour - 9) / 24) + rng.normal(0, 2.5, n)
+    pop = np.clip(35 + 25 * season + rng.normal(0, 25, n), 0, 100)
+    is_precip = (rng.random(n) * 100 < pop * 0.6).astype("int8")
+    sky_idx = np.clip((pop / 25).astype(int) + rng.integers(-1, 2, n), 0, 3)
+    wd = rng.uniform(0, 2 * np.pi, n)
+
+    ta = np.round(ta, 1)
+    ta[rng.random(n) < 0.003] = -99  # KMA 결측 코드
+
+    return pd.DataFrame({
+        "STN": np.repeat(stations["지점"].to_numpy(), n_t),
+        "TM": np.tile(np.asarray(tm.strftime("%Y%m%d%H%M"), dtype=np.int64), n_st),
+        "TA": ta,
+        "POP": np.round(pop).astype("int16"),
+        "is_precip": is_precip,
+        "SKY": np.array(["DB01", "DB02", "DB03", "DB04"])[sky_idx],
+        "WD_sin": np.round(np.sin(wd), 4),
+        "WD_cos": np.round(np.cos(wd), 4),
+    })
+
+
+def make_fires(stations: pd.DataFrame, n_fires: int, start_year: int, n_years: int, seed: int = 0):
+    """Fire points (GeoDataFrame in FIRE_CRS) clustered around stations, spring-heavy."""
+    import geopandas as gpd
+
+    rng = np.random.default_rng([seed, 1])
+    st = rng.integers(0, len(stations), n_fires)
+    lon = stations["경도"].to_numpy()[st] + rng.normal(0, 0.12, n_fires)
+    lat = stations["위도"].to_numpy()[st] + rng.normal(0, 0.10, n_fires)
+
+    year = start_year + rng.integers(0, n_years, n_fires)
+    month = rng.choice(12, n_fires, p=FIRE_MONTH_WEIGHTS / FIRE_MONTH_WEIGHTS.sum()) + 1
+    first = pd.to_datetime(pd.DataFrame({"year": year, "month": month, "day": 1}))
+    day = (rng.random(n_fires) * first.dt.days_in_month).astype(int)
+    minute = rng.integers(8 * 60, 20 * 60, n_fires)
+    ts = first + pd.to_timedelta(day, unit="D") + pd.to_timedelta(minute, unit="m")
+
+    region = stations["region"].to_numpy()[st]
+    ctprv = np.array([REGIONS[r][0] for r in region], dtype=object)
+    sgng = np.array([REGIONS[r][1][rng.integers(len(REGIONS[r][1]))] for r in region], dtype=object)
+
+    return gpd.GeoDataFrame(
+        {"OCCRR_DTM": ts.dt.strftime("%Y%m%d%H%M"), "CTPRV_NM": ctprv, "SGNG_NM": sgng},
+        geometry=gpd.points_from_xy(lon, lat),
+        crs="EPSG:4326",
+    ).to_crs(FIRE_CRS)
+
+
+def write_synthetic_inputs(
+        out_dir,
+        n_stations: int = 20,
+        n_years: int = 3,
+        n_fires: int = 5000,
+        start_year: int = 2018,
+        seed: int = 0,
+) -> dict:
+    """Write raw weather CSVs, fire shapefile and station meta under <out_dir>/data/raw."""
+    raw = Path(out_dir) / "data" / "raw"
+    weather_dir, fire_dir, meta_dir = raw / "weather", raw / "fires" / "FRT000102_42", raw / "meta"
+    for d in (weather_dir, fire_dir, meta_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    stations = make_stations(n_stations, seed)
+    stations.drop(columns=["region"]).to_csv(meta_dir / "stations.csv", index=False, encoding="utf-8")
+
+    n_hourly = 0
+    for year in range(start_year, start_year + n_years):
+        hourly = make_hourly_weather(stations, year, seed)
+        hourly.to_csv(weather_dir / f"weather_{year}.csv", index=False)
+        n_hourly += len(hourly)
+
+    fires = make_fires(stations, n_fires, start_year, n_years, seed)
+    fires.to_file(fire_dir / "fires.shp", encoding="utf-8")
+
+    info = {
+        "stations": n_stations,
+        "station_ids": stations["지점"].tolist(),
+        "years": n_years,
+        "start_year": start_year,
+        "hourly_rows": n_hourly,
+        "fires": n_fires,
+        "data_dir": str(Path(out_dir) / "data"),
+    }
+    print(f"[synthetic] {n_stations} stations x {n_years} years: {n_hourly:,} hourly rows, {n_fires:,} fires -> {raw}")
+    return info
+
+
+def parse_args():
+    parser = ArgumentParser(description="Write synthetic raw weather / fire / station inputs.")
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--stations", type=int, default=20)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--fires", type=int, default=5000)
+    parser.add_argument("--start-year", type=int, default=2018)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    write_synthetic_inputs(args.out, args.stations, args.years, args.fires, args.start_year, args.seed)
@@ -0,0 +1,220 @@
+"""
+Unified `firecast` command line.
+
+    python -m src <command> [options]      # python -m src --help
+
+Subcommands import their modules only when they run, so `--help` and light
+commands do not pay for geopandas / sklearn / pyarrow at startup.
+"""
+import sys
+from argparse import ArgumentParser
+from typing import List, Optional
+
+
+def cmd_ingest(args) -> None:
+    from src.config.paths import ensure_dirs
+
+    ensure_dirs()
+    if args.what in ("weather", "all"):
+        if args.full:
+            from src.core.weather_daily import normalize_weather_daily
+
+            normalize_weather_daily(streaming=True, chunksize=args.chunksize)
+        else:
+            from src.core.weather_incremental import update_weather_daily
+
+            update_weather_daily(chunksize=args.chunksize)
+    if args.what in ("fires", "all"):
+        from src.core.fire_events import ingest_fire_events
+
+        ingest_fire_events(workers=args.workers, stations=args.stations)
+
+
+def cmd_match(args) -> None:
+    from src.pipelines.match_fire_station import main
+
+    main()
+
+
+def cmd_label(args) -> None:
+    from src.core.labeling import build_labels
+
+    build_labels()
+    if args.cell_m:
+        from src.core.grid_labels import main as build_grid_labels
+
+        build_grid_labels(cell_m=args.cell_m)
+        if args.idw:
+            from src.core.labeling import build_grid_weather_labels
+
+            build_grid_weather_labels(cell_m=args.cell_m, k=args.k, stations=args.stations)
+
+
+def cmd_train(args) -> None:
+    from src.models.evaluate import train_and_save
+
+    if args.neg_ratio:
+        from src.core.training_set import build_training_sample
+
+        build_training_sample(neg_ratio=args.neg_ratio)
+    if args.incremental:
+        from src.models.train_incremental import train_incremental
+
+        train_incremental(holdout_days=args.holdout_days, dataset=args.dataset)
+    else:
+        train_and_save(holdout_days=args.holdout_days, dataset=args.dataset)
+
+
+def cmd_backtest(args) -> None:
+    from src.models.backtest import run_backtest
+
+    run_backtest(
+        n_folds=args.folds,
+        test_days=args.test_days,
+        Cs=args.C,
+        class_weights=[None if w == "none" else w for w in args.class_weight],
+        workers=args.workers,
+    )
+
+
+def cmd_predict(args) -> None:
+    if args.date and args.grid_cell_m:
+        from src.models.predict_daily_base import predict_grid_for_date
+
+        result = predict_grid_for_date(args.date, cell_m=args.grid_cell_m, k=args.k, stations=args.stations,
+                                       save=args.save, scorer=args.scorer)
+        print(result["risk_level"].value_counts().to_string())
+    elif args.date:
+        from src.models.predict_daily_base import predict_for_date
+
+        print(predict_for_date(args.date, save=args.save, scorer=args.scorer).to_string(index=False))
+    else:
+        from src.models.predict_batch import predict_range
+
+        predict_range(args.start, args.end, save=not args.no_save, scorer=args.scorer)
+
+
+def cmd_watch(args) -> None:
+    from src.core.weather_daily import TARGET_HOURS
+    from src.pipelines.watch_hourly import watch
+
+    watch(
+        interval=args.interval,
+        once=args.once,
+        scorer=args.scorer,
+        hours=None if args.all_hours else TARGET_HOURS,
+        keep_days=args.keep_days,
+    )
+
+
+def cmd_fetch(args) -> None:
+    from src.core.weather_fetch import fetch_observations
+
+    fetch_observations(
+        args.start, args.end, args.stations, args.kind, args.base_url,
+        concurrency=args.concurrency, rate=args.rate, retries=args.retries,
+    )
+
+
+def cmd_validate(args) -> None:
+    from src.validation.validate_fire_weather import validate_fire_weather
+
+    validate_fire_weather()
+
+
+def cmd_stats(args) -> None:
+    from src.core.telemetry import summarize
+
+    summarize(run=args.run, top=args.top)
+
+
+def build_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="firecast", description="Firecast wildfire-risk pipeline.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ingest", help="raw 기상 CSV / 산불 데이터 -> processed datasets")
+    p.add_argument("--what", choices=["weather", "fires", "all"], default="weather")
+    p.add_argument("--full", action="store_true", help="manifest 무시하고 weather_daily 전체 재생성")
+    p.add_argument("--chunksize", type=int, default=200_000)
+    p.add_argument("--workers", type=int, default=None, help="산불 수집 프로세스 수 (기본: CPU 수)")
+    p.add_argument("--stations", choices=["gangneung", "national"], default="gangneung",
+                   help="산불 매칭 관측소: 강릉 2곳 (기본) / KMA 메타 전체 (station_id·라벨이 바뀜)")
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser("fetch", help="KMA API 에서 ASOS 관측 동시 수집 -> data/raw/weather (KMA_API_KEY 필요)")
+    p.add_argument("--start", required=True, help="YYYY-MM-DD")
+    p.add_argument("--end", required=True, help="YYYY-MM-DD")
+    p.add_argument("--stations", type=int, nargs="*", default=None, help="기본: TARGET_STATIONS")
+    p.add_argument("--kind", choices=["hourly", "daily"], default="hourly")
+    p.add_argument("--base-url", default=None, help="기본: $KMA_API_URL 또는 KMA API hub (mock 서버 테스트용)")
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--rate", type=float, default=10.0, help="초당 최대 요청 수 (0 = 제한 없음)")
+    p.add_argument("--retries", type=int, default=4)
+    p.set_defaults(func=cmd_fetch)
+
+    p = sub.add_parser("match", help="산불 -> 최근접 관측소 매칭")
+    p.set_defaults(func=cmd_match)
+
+    p = sub.add_parser("label", help="weather_daily + fire_events -> weather_labeled")
+    p.add_argument("--cell-m", type=int, default=None, help="격자 라벨도 생성 (셀 크기, m)")
+    p.add_argument("--idw", action="store_true",
+                   help="--cell-m 과 함께: 산불 셀 x 날짜에 k 최근접 관측소 IDW 기상 -> grid_weather_labeled")
+    p.add_argument("--k", type=int, default=3)
+    p.add_argument("--stations", choices=["gangneung", "national"], default="gangneung")
+    p.set_defaults(func=cmd_label)
+
+    p = sub.add_parser("train", help="base LR 학습 + time holdout 평가")
+    p.add_argument("--holdout-days", type=int, default=240)
+    p.add_argument("--dataset", choices=["weather_labeled", "training_sample"], default="weather_labeled")
+    p.add_argument("--neg-ratio", type=float, default=None, help="training_sample 를 이 비율로 새로 생성")
+    p.add_argument("--incremental", action="store_true", help="partition 단위 partial_fit (out-of-core)")
+    p.set_defaults(func=cmd_train)
+
+    p = sub.add_parser("backtest", help="rolling-origin backtest x (C, class_weight) grid")
+    p.add_argument("--folds", type=int, default=6)
+    p.add_argument("--test-days", type=int, default=60)
+    p.add_argument("--C", type=float, nargs="+", default=[0.01, 0.1, 1.0, 10.0])
+    p.add_argument("--class-weight", nargs="+", default=["balanced", "none"])
+    p.add_argument("--workers", type=int, default=4)
+    p.set_defaults(func=cmd_backtest)
+
+    p = sub.add_parser("predict", help="base_prob / risk_level 예측 (하루 또는 기간)")
+    p.add_argument("--date", default=None, help="YYYY-MM-DD (하루 예측, 결과 출력)")
+    p.add_argument("--start", default=None, help="YYYY-MM-DD (기간 예측 -> base_predictions)")
+    p.add_argument("--end", default=None)
+    p.add_argument("--save", action="store_true", help="--date 결과를 parquet 로 저장")
+    p.add_argument("--grid-cell-m", type=int, default=None,
+                   help="--date 와 함께: 관측소 대신 격자 셀별 IDW 기상으로 예측 (label --cell-m 격자 사용)")
+    p.add_argument("--k", type=int, default=3)
+    p.add_argument("--stations", choices=["gangneung", "national"], default="gangneung")
+    p.add_argument("--no-save", action="store_true", help="기간 예측을 base_predictions 에 쓰지 않음")
+    p.add_argument("--scorer", choices=["auto", "compiled", "sklearn"], default=None,
+                   help="compiled = NumPy 전용 artifact (sklearn import 없음), 기본 auto")
+    p.set_defaults(func=cmd_predict)
+
+    p = sub.add_parser("watch", help="시간별 관측 파일 감시 -> 당일 running 집계 갱신 -> 해당 관측소 재예측")
+    p.add_argument("--interval", type=float, default=5.0, help="polling 간격 (초)")
+    p.add_argument("--once", action="store_true", help="현재 도착한 파일만 처리하고 종료")
+    p.add_argument("--all-hours", action="store_true", help="00/12시뿐 아니라 모든 시간 집계")
+    p.add_argument("--keep-days", type=int, default=3)
+    p.add_argument("--scorer", choices=["auto", "compiled", "sklearn"], default=None)
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("validate", help="fire_events vs fire_weather_merged 검증")
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser("stats", help="stage telemetry: 가장 느린 단계 요약")
+    p.add_argument("--run", default="latest")
+    p.add_argument("--top", type=int, default=10)
+    p.set_defaults(func=cmd_stats)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,22 +1,48 @@
+import os
 from pathlib import Path
 
 # firecast/ 폴더 기준 루트
 ROOT = Path(__file__).resolve().parents[1]
 
-DATA_DIR = ROOT / "data"
+# 벤치마크 / 합성 데이터 실행용: 환경변수로 데이터·모델 위치 변경 가능
+DATA_DIR = Path(os.environ.get("FIRECAST_DATA_DIR", ROOT / "data"))
 RAW_DIR = DATA_DIR / "raw"
 PROC_DIR = DATA_DIR / "processed"
 FEAT_DIR = DATA_DIR / "features"
 
 # 세부 경로
-FIRE_RAW_DIR = RAW_DIR / "fires" / "FRT000102_42"
+# 시도별 산불 데이터셋은 FIRE_RAW_ROOT 아래 하위 폴더 하나씩 (FRT000102_42 = 강원)
+FIRE_RAW_ROOT = RAW_DIR / "fires"
+FIRE_RAW_DIR = FIRE_RAW_ROOT / "FRT000102_42"
 WEATHER_RAW_DIR = RAW_DIR / "weather"
+META_RAW_DIR = RAW_DIR / "meta"
+# 실시간으로 도착하는 시간별 관측 CSV (watch 모드 입력)
+WEATHER_HOURLY_DIR = RAW_DIR / "weather_hourly"
+
+# 증분 수집: raw 파일 manifest / 파일별 partial / station·월 단위 partition
+WEATHER_MANIFEST_PATH = PROC_DIR / "weather_manifest.json"
+WEATHER_PARTIALS_DIR = PROC_DIR / "weather_partials"
+WEATHER_DAILY_DIR = PROC_DIR / "weather_daily"
+# watch 모드: 관측소별 당일 running partial 상태 / 최신 위험도 (일자별 parquet)
+WATCH_STATE_DIR = PROC_DIR / "watch_state"
+NOWCAST_DIR = PROC_DIR / "nowcast"
+# weather_fetch (KMA API 수집) 의 완료 task 기록 -> 중단 후 재개
+WEATHER_FETCH_CHECKPOINT = PROC_DIR / "weather_fetch_checkpoint.json"
+# 산불 shapefile 의 GeoParquet 변환본 (year / 시도 partition + bbox index)
+FIRE_STORE_DIR = PROC_DIR / "fire_store"
 
 TRAIN_TEST_DIR = FEAT_DIR / "train_test_split"
+# 정제된 X / y / date / station 배열 (memmap, 데이터 fingerprint + FEATURES 별)
+FEATURE_CACHE_DIR = FEAT_DIR / "matrix_cache"
+
+# stage 별 성능 telemetry (JSON lines)
+TELEMETRY_PATH = DATA_DIR / "telemetry" / "stages.jsonl"
+
+MODEL_DIR = Path(os.environ.get("FIRECAST_MODEL_DIR", ROOT / "models"))
+
 
-MODEL_DIR = ROOT / "models"
 
-# 필요한 디렉토리는 미리 만들어두기
-PROC_DIR.mkdir(parents=True, exist_ok=True)
-FEAT_DIR.mkdir(parents=True, exist_ok=True)
-TRAIN_TEST_DIR.mkdir(parents=True, exist_ok=True)
+def ensure_dirs(*dirs: Path) -> None:
+    """출력 디렉토리 생성 (import 시점이 아니라 쓰기 직전에 호출). 인자가 없으면 기본 출력 디렉토리 전부."""
+    for d in dirs or (PROC_DIR, FEAT_DIR, TRAIN_TEST_DIR, MODEL_DIR):
+        Path(d).mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,290 @@
+"""
+Hive-style partitioned parquet datasets under PROC_DIR.
+
+Layout: PROC_DIR/<name>/<col>=<value>/.../part-0.parquet
+Partition columns are stored in the directory names only. Readers request
+only the columns they need and push date / station filters into the scan,
+so e.g. one day touches one year/month partition. Columns are cast to the
+compact dtypes of `src.core.schema` on write and on read.
+"""
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.config.paths import PROC_DIR
+from src.core.schema import apply_schema
+from src.core.telemetry import count_read, count_written, log, tracking
+
+
+PART_FILE = "part-0.parquet"
+PARTITION_TYPES = {"station_id": pa.int16(), "year": pa.int32(), "month": pa.int32()}
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    name: str
+    date_col: str
+    partition_cols: Tuple[str, ...] = ("year", "month")
+    geo: bool = False
+
+
+DATASETS = {
+    "weather_daily": DatasetSpec("weather_daily", "date", ("station_id", "year", "month")),
+    "weather_labeled": DatasetSpec("weather_labeled", "date"),
+    "fire_events": DatasetSpec("fire_events", "fire_date", geo=True),
+    "base_predictions": DatasetSpec("base_predictions", "date"),
+    "training_sample": DatasetSpec("training_sample", "date"),
+    # 산불 발생 격자 셀 x 날짜, k 최근접 관측소 IDW 기상 (labeling.build_grid_weather_labels)
+    "grid_weather_labeled": DatasetSpec("grid_weather_labeled", "date"),
+}
+
+
+def partition_dir(root: Path, partition_cols: Sequence[str], values: Sequence) -> Path:
+    return Path(root).joinpath(*[f"{c}={v}" for c, v in zip(partition_cols, values)])
+
+
+def write_partitions(
+        df: pd.DataFrame,
+        root: Path,
+        partition_cols: List[str],
+) -> List[Tuple]:
+    """
+    Write `df` as one file per partition, replacing only the partitions present in `df`.
+
+    Returns the list of written partition keys.
+    """
+    written = []
+    for values, part in df.groupby(partition_cols, sort=True):
+        if not isinstance(values, tuple):
+            values = (values,)
+        values = tuple(int(v) if hasattr(v, "__int__") else v for v in values)
+        out_dir = partition_dir(root, partition_cols, values)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # 같은 partition 을 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 tmp -> replace
+        tmp_path = out_dir / f".{PART_FILE}.tmp"
+        apply_schema(part.drop(columns=partition_cols)).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, out_dir / PART_FILE)
+        count_written(out_dir / PART_FILE)
+        written.append(values)
+    return written
+
+
+def remove_partitions(root: Path, partition_cols: List[str], keys: Iterable[Tuple]) -> None:
+    """Delete the given partitions (missing ones are ignored)."""
+    for values in keys:
+        d = partition_dir(root, partition_cols, values)
+        if d.exists():
+            shutil.rmtree(d)
+
+
+def read_partitioned(
+        root: Path,
+        partition_schema: Dict[str, pa.DataType],
+        columns: Optional[List[str]] = None,
+        filter_expr: Optional[ds.Expression] = None,
+) -> pd.DataFrame:
+    """Read a partitioned dataset (optionally only some columns / rows) into pandas."""
+    dataset = ds.dataset(
+        str(root),
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema(list(partition_schema.items())), flavor="hive"),
+    )
+    if tracking():
+        # on-disk 크기 기준 (partition pruning 후 남은 파일만)
+        count_read(sum(os.path.getsize(f.path) for f in dataset.get_fragments(filter=filter_expr)))
+    table = dataset.to_table(columns=columns, filter=filter_expr)
+    return table.to_pandas()
+
+
+def dataset_path(name: str) -> Path:
+    return PROC_DIR / name
+
+
+def legacy_file_path(name: str) -> Path:
+    """Single-file output written before partitioned datasets (<name>.parquet)."""
+    return PROC_DIR / f"{name}.parquet"
+
+
+def dataset_exists(name: str) -> bool:
+    return dataset_path(name).exists() or legacy_file_path(name).exists()
+
+
+def write_dataset(name: str, df: pd.DataFrame) -> Path:
+    """
+    Replace dataset `name` with `df`, partitioned by DATASETS[name].partition_cols.
+
+    year/month are derived from the spec's date column when missing. The new
+    dataset is written next to the old one and swapped in at the end.
+    """
+    spec = DATASETS[name]
+    root = dataset_path(name)
+
+    dates = pd.to_datetime(df[spec.date_col])
+    if dates.isna().any():
+        n = int(dates.isna().sum())
+        log(f"[WARN] {name}: {n} rows without {spec.date_col} are not written", dataset=name, rows=n)
+        df, dates = df[dates.notna()], dates[dates.notna()]
+    if "year" in spec.partition_cols and "year" not in df.columns:
+        df = df.assign(year=dates.dt.year)
+    if "month" in spec.partition_cols and "month" not in df.columns:
+        df = df.assign(month=dates.dt.month)
+
+    tmp_root = root.with_name(f".{name}.tmp")
+    old_root = root.with_name(f".{name}.old")
+    for d in (tmp_root, old_root):
+        if d.exists():
+            shutil.rmtree(d)
+
+    write_partitions(df, tmp_root, list(spec.partition_cols))
+    if root.exists():
+        os.replace(root, old_root)
+    os.replace(tmp_root, root)
+    if old_root.exists():
+        shutil.rmtree(old_root)
+    return root
+
+
+def _month_bound(year_month: Tuple[int, int], op: str) -> ds.Expression:
+    """(year, month) >= / <= bound as an expression on partition fields (prunable)."""
+    y, m = year_month
+    year, month = ds.field("year"), ds.field("month")
+    if op == ">=":
+        return (year > y) | ((year == y) & (month >= m))
+    return (year < y) | ((year == y) & (month <= m))
+
+
+def build_filter(
+        spec: DatasetSpec,
+        start=None,
+        end=None,
+        station_ids: Optional[Sequence[int]] = None,
+        partition_level: bool = True,
+) -> Optional[ds.Expression]:
+    """Date range [start, end] (inclusive, by day) and station filter expression."""
+    expr = None
+
+    def _and(e):
+        return e if expr is None else expr & e
+
+    if start is not None:
+        start = pd.Timestamp(start).normalize()
+        if partition_level and "year" in spec.partition_cols:
+            expr = _and(_month_bound((start.year, start.month), ">="))
+        expr = _and(ds.field(spec.date_col) >= start)
+    if end is not None:
+        end = pd.Timestamp(end).normalize()
+        if partition_level and "year" in spec.partition_cols:
+            expr = _and(_month_bound((end.year, end.month), "<="))
+        expr = _and(ds.field(spec.date_col) < end + pd.Timedelta(days=1))
+    if station_ids is not None:
+        expr = _and(ds.field("station_id").isin([int(s) for s in station_ids]))
+    return expr
+
+
+def list_partitions(name: str) -> List[Tuple[int, ...]]:
+    """Partition keys present on disk for dataset `name` (sorted, ints)."""
+    spec = DATASETS[name]
+    root = dataset_path(name)
+    if not root.exists():
+        return []
+    pattern = "/".join(f"{c}=*" for c in spec.partition_cols)
+    keys = []
+    for d in root.glob(pattern):
+        parts = d.relative_to(root).parts
+        keys.append(tuple(int(p.split("=", 1)[1]) for p in parts))
+    return sorted(keys)
+
+
+def partition_row_counts(name: str) -> Dict[Tuple[int, ...], int]:
+    """Row count per partition from parquet footers (no data pages read)."""
+    spec = DATASETS[name]
+    root = dataset_path(name)
+    return {
+        key: pq.ParquetFile(partition_dir(root, spec.partition_cols, key) / PART_FILE).metadata.num_rows
+        for key in list_partitions(name)
+    }
+
+
+def iter_partitions(
+        name: str,
+        columns: Optional[List[str]] = None,
+        keys: Optional[Sequence[Tuple[int, ...]]] = None,
+) -> Iterator[Tuple[Dict[str, int], pd.DataFrame]]:
+    """
+    Yield (partition key, rows) one partition at a time, in key order
+    (or in the order of `keys`, restricted to those partitions).
+
+    Partition columns are added back as plain int columns, so memory stays
+    bounded by the largest partition rather than the whole dataset.
+    """
+    spec = DATASETS[name]
+    root = dataset_path(name)
+    if not root.exists():
+        raise FileNotFoundError(f"Partitioned dataset not found: {root}")
+    file_cols = None if columns is None else [c for c in columns if c not in spec.partition_cols]
+    for key in list_partitions(name) if keys is None else keys:
+        path = partition_dir(root, spec.partition_cols, key) / PART_FILE
+        count_read(path)
+        df = pd.read_parquet(path, columns=file_cols)
+        key_dict = dict(zip(spec.partition_cols, key))
+        for col, v in key_dict.items():
+            if columns is None or col in columns:
+                df[col] = v
+        yield key_dict, apply_schema(df)
+
+
+def dataset_columns(name: str) -> List[str]:
+    """Column names of dataset `name` (including partition columns)."""
+    root = dataset_path(name)
+    if root.exists():
+        return ds.dataset(str(root), format="parquet", partitioning="hive").schema.names
+    return pq.read_schema(legacy_file_path(name)).names
+
+
+def read_dataset(
+        name: str,
+        columns: Optional[List[str]] = None,
+        start=None,
+        end=None,
+        station_ids: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+    """
+    Read processed dataset `name` with column and date/station pushdown.
+
+    Falls back to the single-file PROC_DIR/<name>.parquet when the partitioned
+    dataset has not been written yet. Geo datasets are returned as
+    GeoDataFrame when `geometry` is among the requested columns.
+    """
+    spec = DATASETS[name]
+    root = dataset_path(name)
+    partitioned = root.exists()
+    path = root if partitioned else legacy_file_path(name)
+    if not path.exists():
+        raise FileNotFoundError(f"Dataset not found: {root} (or {legacy_file_path(name)})")
+
+    filter_expr = build_filter(spec, start, end, station_ids, partition_level=partitioned)
+
+    if spec.geo and (columns is None or "geometry" in columns):
+        import geopandas as gpd
+
+        count_read(path)
+        df = gpd.read_parquet(path, columns=columns, filters=filter_expr)
+    elif partitioned:
+        schema = {c: PARTITION_TYPES[c] for c in spec.partition_cols}
+        df = read_partitioned(root, schema, columns=columns, filter_expr=filter_expr)
+    else:
+        count_read(path)
+        df = pd.read_parquet(path, columns=columns, filters=filter_expr)
+
+    for col in spec.partition_cols:
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(PARTITION_TYPES[col].to_pandas_dtype())
+    return apply_schema(df).reset_index(drop=True)
@@ -0,0 +1,257 @@
+"""
+Versioned, memory-mapped feature-matrix cache.
+
+    from src.core.feature_cache import load_feature_matrix
+
+    fm = load_feature_matrix("weather_labeled", FEATURES)
+    lo = fm.date_index("2021-01-01")          # rows are sorted by date
+    model.fit(fm.frame(slice(0, lo)), fm.y[:lo])
+
+    python -m src.core.feature_cache --rebuild     # (re)build for evaluate.FEATURES
+    python -m src.core.feature_cache --clear
+
+The cleaned model inputs of a processed dataset (numeric FEATURES, rows
+with a missing feature or label dropped) are built once and stored as .npy
+files under FEATURE_CACHE_DIR:
+
+    X.npy (float32, rows x features), y.npy (int8), day.npy (int32 days
+    since 1970-01-01), station.npy (int16), weight.npy (float32, if the
+    dataset has sample_weight), extra columns (float64), meta.json
+
+Rows are sorted by (date, station_id), so time windows are contiguous row
+ranges. The cache directory is keyed by CACHE_VERSION, the feature / label
+/ extra column lists and a fingerprint of the dataset files (path, size,
+mtime), so rewriting the dataset or changing FEATURES builds a new entry
+and the stale one is removed. Readers open the arrays with mmap_mode="r"
+(zero-copy, shared page cache across processes).
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.config.paths import FEATURE_CACHE_DIR
+from src.core.datasets import dataset_columns, dataset_path, legacy_file_path, read_dataset
+from src.core.telemetry import count_read, count_written, log
+
+
+CACHE_VERSION = 1
+LABEL = "fire_label"
+WEIGHT = "sample_weight"
+EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def source_fingerprint(name: str) -> str:
+    """sha256 over (relative path, size, mtime_ns) of the dataset files (no data read)."""
+    root = dataset_path(name)
+    files = sorted(p for p in root.rglob("*.parquet") if p.is_file()) if root.exists() else []
+    if not files:
+        legacy = legacy_file_path(name)
+        if not legacy.exists():
+            raise FileNotFoundError(f"Dataset not found: {root} (or {legacy})")
+        root, files = legacy.parent, [legacy]
+    h = hashlib.sha256()
+    for p in files:
+        st = p.stat()
+        h.update(f"{p.relative_to(root).as_posix()}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def _digest(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode()).hexdigest()
+
+
+@dataclass
+class FeatureMatrix:
+    """Cached model inputs (memory-mapped, read-only), sorted by date."""
+
+    path: Path
+    features: List[str]
+    X: np.ndarray
+    y: np.ndarray
+    day: np.ndarray
+    station: np.ndarray
+    weight: Optional[np.ndarray] = None
+    extra: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.y)
+
+    @property
+    def dates(self) -> np.ndarray:
+        return EPOCH + self.day.astype("timedelta64[D]")
+
+    def date_index(self, date, side: str = "left") -> int:
+        """First row with date >= `date` (side="left") or > `date` (side="right")."""
+        d = (np.datetime64(pd.Timestamp(date).normalize(), "D") - EPOCH).astype("int64")
+        return int(np.searchsorted(self.day, d, side=side))
+
+    def rows_between(self, start=None, end=None) -> slice:
+        """Row range with start <= date <= end (inclusive, None = open-ended)."""
+        lo = 0 if start is None else self.date_index(start)
+        hi = len(self) if end is None else self.date_index(end, side="right")
+        return slice(lo, max(lo, hi))
+
+    def frame(self, rows: slice = slice(None)) -> pd.DataFrame:
+        """Feature columns of `rows` as a DataFrame over the memmap (no copy)."""
+        return pd.DataFrame(self.X[rows], columns=self.features, copy=False)
+
+    def keys_frame(self, rows: slice = slice(None)) -> pd.DataFrame:
+        """station_id / date (+ extra columns) of `rows`."""
+        df = pd.DataFrame({
+            "station_id": pd.array(self.station[rows], dtype="Int16"),
+            "date": pd.to_datetime(self.dates[rows]).astype("datetime64[ns]"),
+        })
+        for col, values in self.extra.items():
+            df[col] = values[rows]
+        return df
+
+
+def _cache_dir(name: str, features: Sequence[str], extra: Sequence[str], fingerprint: str) -> Path:
+    columns_key = _digest({"v": CACHE_VERSION, "features": list(features), "label": LABEL, "extra": list(extra)})
+    return FEATURE_CACHE_DIR / f"{name}-{columns_key[:10]}-{fingerprint[:12]}"
+
+
+def _open(path: Path) -> FeatureMatrix:
+    meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+
+    def load(stem):
+        count_read(path / f"{stem}.npy")
+        return np.load(path / f"{stem}.npy", mmap_mode="r")
+
+    return FeatureMatrix(
+        path=path,
+        features=meta["features"],
+        X=load("X"),
+        y=load("y"),
+        day=load("day"),
+        station=load("station"),
+        weight=load("weight") if meta["weighted"] else None,
+        extra={c: load(f"extra_{c}") for c in meta["extra"]},
+    )
+
+
+def _build(name: str, features: List[str], extra: List[str], out_dir: Path, fingerprint: str) -> dict:
+    available = dataset_columns(name)
+    missing = [c for c in features + [LABEL, "date", "station_id"] if c not in available]
+    if missing:
+        raise KeyError(f"Missing required columns in {name}: {missing}")
+    weighted = WEIGHT in available
+    extra = [c for c in extra if c in available]
+
+    t0 = time.perf_counter()
+    df = read_dataset(name, columns=["station_id", "date", LABEL] + features + extra + ([WEIGHT] if weighted else []))
+    for col in features:
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=features + [LABEL, "date", "station_id"])
+    df["date"] = pd.to_datetime(df["date"]).dt.normalize()
+    df = df.sort_values(["date", "station_id"], kind="stable")
+
+    arrays = {
+        "X": df[features].to_numpy(dtype="float32", na_value=np.nan),
+        "y": df[LABEL].to_numpy(dtype="int8"),
+        "day": (df["date"].to_numpy().astype("datetime64[D]") - EPOCH).astype("int32"),
+        "station": df["station_id"].to_numpy(dtype="int16"),
+    }
+    if weighted:
+        arrays["weight"] = df[WEIGHT].to_numpy(dtype="float32")
+    for col in extra:
+        arrays[f"extra_{col}"] = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    out_dir.mkdir(parents=True)
+    for stem, arr in arrays.items():
+        np.save(out_dir / f"{stem}.npy", arr)
+        count_written(out_dir / f"{stem}.npy")
+    meta = {
+        "version": CACHE_VERSION,
+        "dataset": name,
+        "source_fingerprint": fingerprint,
+        "features": features,
+        "label": LABEL,
+        "weighted": weighted,
+        "extra": extra,
+        "rows": len(df),
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "build_s": round(time.perf_counter() - t0, 2),
+    }
+    (out_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    return meta
+
+
+def _prune(keep: Path) -> None:
+    """같은 dataset + 컬럼 조합의 이전 (다른 fingerprint) 캐시 삭제."""
+    prefix = keep.name.rsplit("-", 1)[0] + "-"
+    for d in keep.parent.glob(f"{prefix}*"):
+        if d != keep and d.is_dir() and not d.name.startswith("."):
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def load_feature_matrix(
+        name: str = "weather_labeled",
+        features: Sequence[str] = (),
+        extra: Sequence[str] = (),
+        rebuild: bool = False,
+) -> FeatureMatrix:
+    """
+    Open (building first if needed) the cached feature matrix of dataset `name`.
+
+    extra: additional numeric columns to carry along (e.g. lat / lon); those
+    not in the dataset are skipped.
+    """
+    features, extra = list(features), list(extra)
+    if not features:
+        raise ValueError("features must not be empty")
+    fingerprint = source_fingerprint(name)
+    path = _cache_dir(name, features, extra, fingerprint)
+
+    if rebuild and path.exists():
+        shutil.rmtree(path)
+    if not (path / "meta.json").exists():
+        # 다른 프로세스와 동시에 만들어도 안전하게: tmp 에 쓰고 rename
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        meta = _build(name, features, extra, tmp, fingerprint)
+        try:
+            os.rename(tmp, path)
+            log(f"[feature_cache] built {path.name}: {meta['rows']:,} rows in {meta['build_s']}s", path=str(path))
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)  # 이미 다른 프로세스가 만듦
+        _prune(path)
+    return _open(path)
+
+
+def clear_cache() -> None:
+    if FEATURE_CACHE_DIR.exists():
+        shutil.rmtree(FEATURE_CACHE_DIR)
+
+
+def parse_args():
+    parser = ArgumentParser(description="Build / inspect / clear the feature-matrix cache.")
+    parser.add_argument("--dataset", choices=["weather_labeled", "training_sample"], default="weather_labeled")
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("--clear", action="store_true", help="delete every cached matrix")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.clear:
+        clear_cache()
+        print("cleared ->", FEATURE_CACHE_DIR)
+    else:
+        from src.models.evaluate import FEATURES
+
+        fm = load_feature_matrix(args.dataset, FEATURES, rebuild=args.rebuild)
+        print(f"{fm.path}: {len(fm):,} rows x {len(fm.features)} features, "
+              f"{fm.dates[0]} .. {fm.dates[-1]}" if len(fm) else f"{fm.path}: empty")
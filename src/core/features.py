@@ -0,0 +1,137 @@
+"""
+Lag / rolling-window feature engine on a dense (station_id, date) grid.
+
+Daily rows are placed on a dense, sorted grid covering every calendar day
+between each station's first and last observation, so shifts and windows
+are in calendar days and missing days are explicit NaN (never silently
+skipped). All features are computed on that grid in one pass and mapped
+back to the input rows by position (no per-lag merges).
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.telemetry import log
+
+
+KEYS = ["station_id", "date"]
+WINDOW_AGGS = ("sum", "mean", "max", "min")
+
+
+def densify_daily(df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Reindex daily rows to a dense, sorted station x date grid.
+
+    Returns (dense, pos): `dense` has KEYS, the other columns of `df` (NaN/NA on
+    missing days), `is_observed` and `day_idx` (days since the station's first
+    row); `pos[i]` is the grid row of `df.iloc[i]`.
+
+    Rows without station_id or date get pos -1 (not on the grid). Duplicate
+    (station_id, date) rows share one grid row holding the first one's values.
+    """
+    dates = pd.to_datetime(df["date"]).dt.normalize()
+    valid = (df["station_id"].notna() & dates.notna()).to_numpy()
+    if not valid.all():
+        n = int((~valid).sum())
+        log(f"[features] {n} rows without station_id/date: features left NaN", rows=n)
+    dup = pd.DataFrame({"station_id": df["station_id"], "date": dates}).duplicated().to_numpy() & valid
+    if dup.any():
+        n = int(dup.sum())
+        log(f"[features] {n} duplicate (station_id, date) rows: first row's values used", rows=n)
+    first = valid & ~dup
+
+    value_cols = [c for c in df.columns if c not in KEYS]
+    span = dates[first].groupby(df["station_id"][first]).agg(["min", "max"])
+    if span.empty:
+        dense = df.iloc[:0][KEYS + value_cols].reset_index(drop=True)
+        dense["is_observed"] = pd.Series(dtype=bool)
+        dense["day_idx"] = pd.Series(dtype="int64")
+        return dense, np.full(len(df), -1, dtype="int64")
+
+    n_days = ((span["max"] - span["min"]).dt.days + 1).to_numpy()
+    start = np.concatenate(([0], np.cumsum(n_days)[:-1]))
+    total = int(n_days.sum())
+
+    day_idx = np.arange(total) - np.repeat(start, n_days)
+    dense = pd.DataFrame({
+        "station_id": span.index.repeat(n_days),
+        "date": np.repeat(span["min"].to_numpy(), n_days) + day_idx.astype("timedelta64[D]"),
+    })
+
+    station_pos = pd.Series(np.arange(len(span)), index=span.index)
+    st = station_pos.loc[df["station_id"][valid]].to_numpy()
+    pos = np.full(len(df), -1, dtype="int64")
+    pos[valid] = start[st] + (
+        dates[valid].to_numpy() - span["min"].to_numpy()[st]
+    ).astype("timedelta64[D]").astype("int64")
+
+    values = df.loc[first, value_cols].set_axis(pos[first]).reindex(np.arange(total))
+    dense = pd.concat([dense, values], axis=1)
+    dense["is_observed"] = False
+    dense.loc[pos[first], "is_observed"] = True
+    dense["day_idx"] = day_idx
+    return dense, pos
+
+
+def build_window_features(
+        df: pd.DataFrame,
+        feature_cols: Optional[List[str]] = None,
+        lags: Sequence[int] = (1, 2, 3),
+        windows: Sequence[int] = (),
+        window_aggs: Sequence[str] = WINDOW_AGGS,
+        since_cols: Sequence[str] = (),
+        min_periods: int = 1,
+) -> pd.DataFrame:
+    """
+    Build lag / rolling / "days since" features for every (station_id, date) row of `df`.
+
+    - `{c}_minus{k}d`: value k calendar days earlier (NaN if that day is missing)
+    - `{c}_{agg}{w}d`: rolling agg over the w days ending on `date` (inclusive),
+      computed over observed days, NaN if fewer than `min_periods` observed
+    - `obs_{w}d`: number of observed days in that window
+    - `days_since_{c}`: days since the last day with `c > 0` (0 = today, NaN = never)
+    """
+    if feature_cols is None:
+        feature_cols = [c for c in df.columns if c not in KEYS]
+
+    dense, pos = densify_daily(df[KEYS + list(feature_cols)])
+    base = df[KEYS].reset_index(drop=True)
+    if dense.empty:
+        # 빈 입력 (또는 key 없는 행만): 같은 컬럼의 NaN feature
+        names = [f"{c}_minus{k}d" for k in lags for c in feature_cols]
+        for w in windows:
+            names += [f"{c}_{agg}{w}d" for agg in window_aggs for c in feature_cols] + [f"obs_{w}d"]
+        names += [f"days_since_{c}" for c in since_cols]
+        return pd.concat([base, pd.DataFrame(np.nan, index=base.index, columns=names)], axis=1)
+
+    day_idx = dense["day_idx"].to_numpy()
+    out = {}
+
+    for k in lags:
+        valid = day_idx >= k
+        for c in feature_cols:
+            out[f"{c}_minus{k}d"] = dense[c].shift(k).where(valid)
+
+    if windows:
+        numeric = dense[feature_cols].astype("float64")
+        numeric["__obs"] = dense["is_observed"].astype("float64")
+        grouped = numeric.groupby(dense["station_id"], sort=False)
+        for w in windows:
+            rolled = grouped.rolling(w, min_periods=1)
+            obs = rolled["__obs"].sum().droplevel(0)
+            vals = grouped[list(feature_cols)].rolling(w, min_periods=min_periods)
+            for agg in window_aggs:
+                res = getattr(vals, agg)().droplevel(0)
+                for c in feature_cols:
+                    out[f"{c}_{agg}{w}d"] = res[c]
+            out[f"obs_{w}d"] = obs
+
+    for c in since_cols:
+        event = pd.to_numeric(dense[c], errors="coerce").fillna(0) > 0
+        last = dense["date"].where(event).groupby(dense["station_id"], sort=False).ffill()
+        out[f"days_since_{c}"] = (dense["date"] - last).dt.days
+
+    # pos -1 (key 없는 행) -> NaN
+    feats = pd.DataFrame(out, index=dense.index).reindex(pos).reset_index(drop=True)
+    return pd.concat([base, feats], axis=1)
@@ -1,30 +1,60 @@
 # src/core/fire_events.py  (혹은 firecast/core/fire_events.py)
 
+import os
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
 import geopandas as gpd
 import pandas as pd
-from src.config.paths import PROC_DIR
+from src.config.paths import FIRE_STORE_DIR, PROC_DIR
+from src.core.datasets import write_dataset
+from src.core.fire_store import ensure_fire_store, select_files
+from src.core.schema import apply_schema
+from src.core.stations import WeatherStationRegistry, attach_nearest_station
+from src.core.telemetry import count_read, count_written, instrument, log
 
+EVENT_COLUMNS = [
+    "fire_id",
+    "fire_datetime",
+    "fire_date",
+    "year",
+    "month",
+    "CTPRV_NM",
+    "SGNG_NM",
+    "station_id",
+    "dist_m",
+    "lon",
+    "lat",
+    "geometry",
+]
 
-def normalize_fire_events(
-        input_path=None,
-        output_path=None,
-) -> gpd.GeoDataFrame:
+# ingest worker 프로세스별 관측소 레지스트리 (initializer 에서 한 번 설정)
+_REGISTRY = None
+
+# 매칭 대상 관측소: gangneung = 북강릉/강릉 (기존 라벨 기준), national = KMA 메타 전체 관측소
+STATION_SETS = ("gangneung", "national")
+
+
+def station_registry(stations: str = "gangneung") -> WeatherStationRegistry:
+    """Registry for a STATION_SETS name (national needs a meta CSV in META_RAW_DIR)."""
+    if stations == "gangneung":
+        return WeatherStationRegistry.default_kma_gangneung()
+    if stations == "national":
+        return WeatherStationRegistry.from_kma_meta()
+    raise ValueError(f"Unknown station set {stations!r} (expected one of {STATION_SETS})")
+
+
+def to_fire_events(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
-    fires_with_manual_station.parquet을 정규화된 fire_events.parquet으로 변환.
+    Station-matched fire points -> fire_events columns.
 
     - fire_datetime/fire_date/year/month 생성
     - 좌표계 EPSG:4326으로 변환해 lon/lat 추가
-    - fire_id 부여
+    - fire_id 부여 (입력에 없을 때만, index 기반)
     """
-    if input_path is None:
-        input_path = PROC_DIR / "fires_with_manual_station.parquet"
-    if output_path is None:
-        output_path = PROC_DIR / "fire_events.parquet"
-
-    # 1) 기존 결과 읽기 (관측소 매칭까지 끝난 상태)
-    gdf = gpd.read_parquet(input_path)
-
-    # 2) 날짜/시간 통일
+    # 날짜/시간 통일
     if "OCCRR_DATE" in gdf.columns:
         gdf["fire_datetime"] = pd.to_datetime(gdf["OCCRR_DATE"])
     elif "OCCRR_DTM" in gdf.columns:
@@ -42,7 +72,7 @@ def normalize_fire_events(
     gdf["year"] = gdf["fire_date"].dt.year
     gdf["month"] = gdf["fire_date"].dt.month
 
-    # 3) 좌표계 및 lon/lat 추가
+    # 좌표계 및 lon/lat 추가
     if gdf.crs is None:
         # 필요하면 수동으로 crs 지정
         # gdf = gdf.set_crs("EPSG:5179")
@@ -52,30 +82,128 @@ def normalize_fire_events(
     gdf["lon"] = gdf_4326.geometry.x
     gdf["lat"] = gdf_4326.geometry.y
 
-    # 4) fire_id 추가 (없으면 index 기반)
+    # fire_id 추가 (fire_store 를 거친 입력은 이미 source 기준 fire_id 가 있음)
     if "fire_id" not in gdf.columns:
         gdf = gdf.reset_index(drop=True)
         gdf["fire_id"] = gdf.index
 
-    # 5) 최종 컬럼 순서 정리
-    cols = [
-        "fire_id",
-        "fire_datetime",
-        "fire_date",
-        "year",
-        "month",
-        "CTPRV_NM",
-        "SGNG_NM",
-        "station_id",
-        "dist_m",
-        "lon",
-        "lat",
-        "geometry",
-    ]
-    cols = [c for c in cols if c in gdf.columns]
-    gdf = gdf[cols]
-
-    gdf.to_parquet(output_path, index=False)
-    print("saved normalized fire_events ->", output_path)
+    cols = [c for c in EVENT_COLUMNS if c in gdf.columns]
+    return apply_schema(gdf[cols].copy())
+
+
+@instrument()
+def normalize_fire_events(
+        input_path=None,
+        output_path=None,
+) -> gpd.GeoDataFrame:
+    """
+    fires_with_manual_station.parquet을 정규화된 fire_events dataset 으로 변환.
+
+    output_path 가 없으면 PROC_DIR/fire_events (year/month partition) 에 저장.
+    """
+    if input_path is None:
+        input_path = PROC_DIR / "fires_with_manual_station.parquet"
+
+    # 1) 기존 결과 읽기 (관측소 매칭까지 끝난 상태)
+    count_read(input_path)
+    gdf = gpd.read_parquet(input_path)
+
+    # 2) 날짜 / lon·lat / fire_id / 컬럼 정리
+    gdf = to_fire_events(gdf)
+
+    if output_path is None:
+        output_path = write_dataset("fire_events", gdf)
+    else:
+        gdf.to_parquet(output_path, index=False)
+        count_written(output_path)
+    log(f"saved normalized fire_events -> {output_path}", path=str(output_path))
+
+    return gdf
+
+
+def _init_worker(stations) -> None:
+    global _REGISTRY
+    _REGISTRY = WeatherStationRegistry(stations)
+
+
+def _ingest_file(path: str, year: int, ctprv: str) -> gpd.GeoDataFrame:
+    """One fire_store file (one year x 시도): nearest station + fire_events columns."""
+    count_read(path)
+    gdf = gpd.read_parquet(path).assign(year=year, CTPRV_NM=ctprv)
+    gdf = attach_nearest_station(gdf, _REGISTRY, distance_col="dist_m")
+    return to_fire_events(gdf)
+
 
+@instrument()
+def ingest_fire_events(
+        years: Optional[Sequence[int]] = None,
+        workers: Optional[int] = None,
+        registry=None,
+        raw_dir=None,
+        store_dir=None,
+        stations: str = "gangneung",
+) -> gpd.GeoDataFrame:
+    """
+    Every province's fire shapefile -> one fire_events dataset, in a process pool.
+
+    1) new / changed shapefiles are converted to the fire_store (CRS -> EPSG:5186,
+       stable fire_id = source code << 32 | row), one shapefile per worker
+    2) each store file (year x 시도) gets its nearest station and the
+       fire_events columns, one file per task, so the work spreads over
+       `workers` (default: CPU count) even for a single province
+    3) the results are merged and written as fire_events (year/month partition)
+
+    registry defaults to `station_registry(stations)`: the two Gangneung
+    stations, as fire_events / build_labels have always used. stations="national"
+    matches every fire to the nearest station in the KMA meta instead, which
+    changes station_id and so which (station, date) rows are labeled positive.
+    """
+    workers = workers or os.cpu_count() or 1
+    store_dir = store_dir or FIRE_STORE_DIR
+    index = ensure_fire_store(raw_dir, store_dir, workers=workers)
+    if registry is None:
+        registry = station_registry(stations)
+
+    files = select_files(index, years=years)
+    if not files:
+        raise FileNotFoundError(f"No fire records to ingest (years={years}) in {store_dir}")
+    # 큰 파일부터 배정해서 마지막에 한 worker 만 남는 시간을 줄임
+    files = sorted(files, key=lambda e: -e["rows"])
+    tasks = [(str(os.path.join(store_dir, e["path"])), e["year"], e["CTPRV_NM"]) for e in files]
+
+    t0 = time.perf_counter()
+    workers = min(workers, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(registry.stations,),
+        ) as pool:
+            parts: List[gpd.GeoDataFrame] = list(pool.map(_ingest_file, *zip(*tasks)))
+    else:
+        _init_worker(registry.stations)
+        parts = [_ingest_file(*t) for t in tasks]
+
+    gdf = gpd.GeoDataFrame(pd.concat(parts, ignore_index=True), geometry="geometry", crs=parts[0].crs)
+    gdf = gdf.sort_values("fire_id", kind="stable").reset_index(drop=True)
+    if gdf["fire_id"].duplicated().any():
+        raise ValueError(f"fire_events: {int(gdf['fire_id'].duplicated().sum())} duplicate fire_id")
+    log(f"[fire_events] {len(gdf):,} fires from {len(tasks)} store files "
+        f"({gdf['CTPRV_NM'].nunique()} 시도) in {time.perf_counter() - t0:.1f}s, {workers} workers",
+        store_files=len(tasks), workers=workers)
+
+    output_path = write_dataset("fire_events", gdf)
+    log(f"saved normalized fire_events -> {output_path}", path=str(output_path))
     return gdf
+
+
+def parse_args():
+    parser = ArgumentParser(description="Ingest every province's fire shapefile into fire_events.")
+    parser.add_argument("--years", type=int, nargs="*", default=None)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--stations", choices=STATION_SETS, default="gangneung",
+                        help="stations to match against (national: KMA meta, changes labels)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    ingest_fire_events(years=args.years, workers=args.workers, stations=args.stations)
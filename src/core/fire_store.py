@@ -0,0 +1,344 @@
+"""
+GeoParquet store of the raw fire shapefiles with attribute / bbox pushdown.
+
+    python -m src.core.fire_store --workers 8  # convert (only new / changed .shp)
+
+    from src.core.fire_store import load_fires
+    fires = load_fires(years=[2020, 2021], sgng=["강릉시"], columns=["OCCRR_DTM", "SGNG_NM"])
+
+Every shapefile under FIRE_RAW_ROOT (one sub-directory per province
+dataset) is parsed once (DBF + geometry), in a process pool, and written to
+
+    FIRE_STORE_DIR/year=<YYYY>/CTPRV_NM=<시도>/part-<source>.parquet
+
+in STORE_CRS, with a stable `fire_id` (see `fire_ids`), rows sorted by
+SGNG_NM then Hilbert distance, with a GeoParquet
+covering `bbox` column and small row groups, so row-group statistics prune
+county (SGNG_NM) and bbox filters inside a file. FIRE_STORE_DIR/_index.json
+is the spatial index: per file its year, province, counties, bbox and row
+count, plus the size/mtime of every source shapefile (a changed source is
+re-converted). `load_fires` picks files from the index and pushes the
+county / bbox / column filters into the parquet read.
+"""
+import json
+import os
+import shutil
+import time
+import zlib
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from pyproj import Transformer
+
+from src.config.paths import FIRE_RAW_ROOT, FIRE_STORE_DIR
+from src.core.datasets import partition_dir
+from src.core.telemetry import count_read, count_written, instrument, log
+
+
+STORE_CRS = "EPSG:5186"
+INDEX_NAME = "_index.json"
+INDEX_VERSION = 2
+PARTITION_COLS = ["year", "CTPRV_NM"]
+ROW_GROUP_SIZE = 4096
+UNKNOWN = "미상"
+
+
+def _source_key(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def raw_fire_shapefiles(raw_dir=None) -> Dict[str, str]:
+    """{source name (path relative to raw_dir, e.g. "FRT000102_42/x.shp"): path} of every .shp below raw_dir."""
+    root = Path(raw_dir or FIRE_RAW_ROOT)
+    return {p.relative_to(root).as_posix(): str(p) for p in sorted(root.rglob("*.shp"))}
+
+
+def source_code(source: str) -> int:
+    """31-bit id of a source name (crc32), the high half of its fire_ids."""
+    return zlib.crc32(source.encode("utf-8")) & 0x7FFFFFFF
+
+
+def fire_ids(source: str, n: int) -> np.ndarray:
+    """
+    fire_id = source_code(source) << 32 | row number in the shapefile.
+
+    Stable across runs and machines while the shapefile keeps its row order
+    (appended rows get new ids), and unique across provinces: sources with
+    the same code are rejected at conversion.
+    """
+    return (np.int64(source_code(source)) << np.int64(32)) | np.arange(n, dtype="int64")
+
+
+def _read_index(store_dir=None) -> Optional[dict]:
+    path = Path(store_dir or FIRE_STORE_DIR) / INDEX_NAME
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+
+
+def load_index(store_dir=None) -> dict:
+    """Store index; an empty one if missing or written by another INDEX_VERSION (the store is then rebuilt)."""
+    index = _read_index(store_dir)
+    if index is None or index.get("version") != INDEX_VERSION:
+        return {"version": INDEX_VERSION, "sources": {}, "files": []}
+    return index
+
+
+def _save_index(index: dict, store_dir: Path) -> None:
+    tmp = store_dir / f".{INDEX_NAME}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(index, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp, store_dir / INDEX_NAME)
+
+
+def _prepare(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """STORE_CRS + partition columns, rows ordered for row-group pruning."""
+    if gdf.crs is None:
+        raise ValueError("CRS 정보가 없습니다. shapefile CRS를 먼저 확인하세요.")
+    if gdf.crs != STORE_CRS:
+        gdf = gdf.to_crs(STORE_CRS)
+    year = pd.to_numeric(gdf["OCCRR_DTM"].astype("string").str.slice(0, 4), errors="coerce")
+    gdf["year"] = year.fillna(0).astype("int32")  # 날짜 없는 행은 year=0 partition 에 보관
+    gdf["CTPRV_NM"] = gdf["CTPRV_NM"].fillna(UNKNOWN).astype(str) if "CTPRV_NM" in gdf.columns else UNKNOWN
+    if "SGNG_NM" in gdf.columns:
+        gdf["SGNG_NM"] = gdf["SGNG_NM"].fillna(UNKNOWN).astype(str)
+
+    # 같은 시군구 / 가까운 지점이 같은 row group 에 모이도록
+    order = pd.DataFrame({
+        "sgng": gdf["SGNG_NM"] if "SGNG_NM" in gdf.columns else "",
+        "hilbert": gdf.geometry.hilbert_distance(total_bounds=gdf.total_bounds) if len(gdf) else 0,
+    })
+    return gdf.iloc[order.sort_values(["sgng", "hilbert"], kind="stable").index.to_numpy()]
+
+
+def convert_shapefile(shp_path: str, source: str, store_dir: Path) -> List[dict]:
+    """Parse one shapefile and write its year/province partitions. Returns index entries."""
+    count_read(shp_path)
+    gdf = gpd.read_file(shp_path)
+    gdf.insert(0, "fire_id", fire_ids(source, len(gdf)))  # 정렬 / CRS 변환 전 원본 행 순서 기준
+    gdf = _prepare(gdf)
+    stem = source[:-len(".shp")].replace("/", "__")
+    entries = []
+    for (year, ctprv), part in gdf.groupby(PARTITION_COLS, sort=True):
+        out_dir = partition_dir(store_dir, PARTITION_COLS, (int(year), ctprv))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_path = out_dir / f"part-{stem}.parquet"
+        # 동시에 같은 store 를 변환하는 프로세스 (DAG 의 다른 stage) 와 tmp 가 겹치지 않게
+        tmp_path = out_dir / f".part-{stem}.parquet.{os.getpid()}.tmp"
+        part.drop(columns=PARTITION_COLS).to_parquet(
+            tmp_path, index=False, write_covering_bbox=True, row_group_size=ROW_GROUP_SIZE,
+        )
+        os.replace(tmp_path, out_path)
+        count_written(out_path)
+        entries.append({
+            "path": out_path.relative_to(store_dir).as_posix(),
+            "source": source,
+            "year": int(year),
+            "CTPRV_NM": ctprv,
+            "SGNG_NM": sorted(part["SGNG_NM"].unique().tolist()) if "SGNG_NM" in part.columns else [],
+            "bbox": [float(v) for v in part.total_bounds],
+            "rows": len(part),
+        })
+    return entries
+
+
+def _convert_task(args) -> List[dict]:
+    shp_path, source, store_dir = args
+    t0 = time.perf_counter()
+    entries = convert_shapefile(shp_path, source, Path(store_dir))
+    log(f"[fire_store] {source}: {sum(e['rows'] for e in entries):,} rows, "
+        f"{len(entries)} partitions in {time.perf_counter() - t0:.1f}s")
+    return entries
+
+
+def _check_source_codes(sources: Sequence[str]) -> None:
+    seen: Dict[int, str] = {}
+    for source in sources:
+        other = seen.setdefault(source_code(source), source)
+        if other != source:
+            raise ValueError(f"fire_id collision: sources {other!r} and {source!r} share a source code; rename one")
+
+
+@instrument()
+def convert_fire_shapefiles(raw_dir=None, store_dir=None, force: bool = False, workers: Optional[int] = None) -> dict:
+    """
+    Convert new / changed raw fire shapefiles into the GeoParquet store.
+
+    Shapefiles are converted concurrently in a process pool of `workers`
+    (default: CPU count). Files of a source that changed or disappeared are
+    removed first, so the store always mirrors the current raw shapefiles.
+    """
+    store_dir = Path(store_dir or FIRE_STORE_DIR)
+    old = _read_index(store_dir)
+    if store_dir.exists() and (force or (old is not None and old.get("version") != INDEX_VERSION)):
+        shutil.rmtree(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    index = load_index(store_dir)
+
+    current = raw_fire_shapefiles(raw_dir)
+    _check_source_codes(list(current))
+    stale = [
+        name for name, key in index["sources"].items()
+        if name not in current or key != _source_key(current[name])
+    ]
+    todo = [name for name in current if name in stale or name not in index["sources"]]
+
+    for entry in [e for e in index["files"] if e["source"] in stale]:
+        (store_dir / entry["path"]).unlink(missing_ok=True)
+    index["files"] = [e for e in index["files"] if e["source"] not in stale]
+    for name in stale:
+        index["sources"].pop(name, None)
+
+    tasks = [(current[name], name, str(store_dir)) for name in todo]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_convert_task, tasks))
+    else:
+        results = [_convert_task(t) for t in tasks]
+    for name, entries in zip(todo, results):
+        index["files"].extend(entries)
+        index["sources"][name] = _source_key(current[name])
+
+    if todo or stale:
+        _save_index(index, store_dir)
+    return {"converted": todo, "removed": [s for s in stale if s not in current]}
+
+
+def ensure_fire_store(raw_dir=None, store_dir=None, workers: Optional[int] = None) -> dict:
+    """Store index, converting first if a raw shapefile is new or changed (cheap stat check otherwise)."""
+    index = load_index(store_dir)
+    current = raw_fire_shapefiles(raw_dir)
+    up_to_date = set(current) == set(index["sources"]) and all(
+        index["sources"][name] == _source_key(p) for name, p in current.items()
+    )
+    if not up_to_date:
+        convert_fire_shapefiles(raw_dir, store_dir, workers=workers)
+        index = load_index(store_dir)
+    return index
+
+
+def _intersects(a: Sequence[float], b: Sequence[float]) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def select_files(
+        index: dict,
+        years: Optional[Sequence[int]] = None,
+        ctprv: Optional[Sequence[str]] = None,
+        sgng: Optional[Sequence[str]] = None,
+        bbox: Optional[Sequence[float]] = None,
+        datasets: Optional[Sequence[str]] = None,
+) -> List[dict]:
+    """Index entries that can contain matching rows (year / province / county / bbox / raw dataset)."""
+    out = []
+    for e in index["files"]:
+        if datasets is not None and e["source"].split("/")[0] not in set(datasets):
+            continue
+        if years is not None and e["year"] not in set(int(y) for y in years):
+            continue
+        if ctprv is not None and e["CTPRV_NM"] not in set(ctprv):
+            continue
+        if sgng is not None and not set(sgng).intersection(e["SGNG_NM"]):
+            continue
+        if bbox is not None and not _intersects(e["bbox"], bbox):
+            continue
+        out.append(e)
+    return out
+
+
+def _project_bounds(bbox: Sequence[float], crs: str, densify_pts: int = 21) -> tuple:
+    """bbox in `crs` -> bounds in STORE_CRS that contain the whole (curved) box, for pruning only."""
+    xmin, ymin, xmax, ymax = Transformer.from_crs(crs, STORE_CRS, always_xy=True).transform_bounds(
+        *bbox, densify_pts=densify_pts)
+    # 샘플 점 사이에서 휘는 변까지 덮도록 약간 넓힘 (정확한 필터는 읽은 뒤에)
+    pad = 0.001 * max(xmax - xmin, ymax - ymin)
+    return xmin - pad, ymin - pad, xmax + pad, ymax + pad
+
+
+def load_fires(
+        years: Optional[Sequence[int]] = None,
+        ctprv: Optional[Sequence[str]] = None,
+        sgng: Optional[Sequence[str]] = None,
+        bbox: Optional[Sequence[float]] = None,
+        bbox_crs: str = STORE_CRS,
+        columns: Optional[List[str]] = None,
+        datasets: Optional[Sequence[str]] = None,
+        raw_dir=None,
+        store_dir=None,
+) -> gpd.GeoDataFrame:
+    """
+    Fire points from the GeoParquet store (converted on first use), in STORE_CRS.
+
+    years / ctprv (시도) / sgng (시군구) / bbox (xmin, ymin, xmax, ymax in
+    bbox_crs) / columns are applied in the read: files are chosen from the
+    index, county and bbox filters prune row groups. datasets restricts to raw
+    sub-directories of FIRE_RAW_ROOT (e.g. ["FRT000102_42"]). The geometry column is
+    always returned; `year` and `CTPRV_NM` come back from the partition.
+    """
+    store_dir = Path(store_dir or FIRE_STORE_DIR)
+    index = ensure_fire_store(raw_dir, store_dir)
+    exact_bbox = None
+    if bbox is not None and bbox_crs != STORE_CRS:
+        # 다른 CRS 의 box 는 변환 후 변이 휘므로 모서리 2점으로는 bound 가 안 됨:
+        # 변을 촘촘히 변환한 bound 로 prune 하고, 읽은 점을 bbox_crs 로 되돌려 정확히 다시 거름
+        exact_bbox = tuple(bbox)
+        bbox = _project_bounds(bbox, bbox_crs)
+
+    read_cols = None
+    if columns is not None:
+        read_cols = [c for c in columns if c not in PARTITION_COLS and c != "geometry"] + ["geometry"]
+    filters = [("SGNG_NM", "in", list(sgng))] if sgng is not None else None
+
+    parts: List[gpd.GeoDataFrame] = []
+    for e in select_files(index, years, ctprv, sgng, bbox, datasets):
+        path = store_dir / e["path"]
+        count_read(path)
+        part = gpd.read_parquet(path, columns=read_cols, filters=filters, bbox=bbox)
+        if len(part):
+            parts.append(part.assign(year=e["year"], CTPRV_NM=e["CTPRV_NM"]))
+
+    if not parts:
+        # 결과가 없어도 partition 컬럼 (year / CTPRV_NM) 은 비어 있지 않을 때와 같은 dtype 으로 포함
+        cols = [c for c in (read_cols or ["geometry"]) if c != "geometry"]
+        empty = gpd.GeoDataFrame(
+            {**{c: pd.Series(dtype=object) for c in cols},
+             "year": pd.Series(dtype="int64"), "CTPRV_NM": pd.Series(dtype=object)},
+            geometry=gpd.GeoSeries([], crs=STORE_CRS), crs=STORE_CRS,
+        )
+        if columns is not None:
+            empty = empty[[c for c in columns if c != "geometry"] + ["geometry"]]
+        return empty
+    fires = gpd.GeoDataFrame(pd.concat(parts, ignore_index=True), geometry="geometry", crs=STORE_CRS)
+    if exact_bbox is not None:
+        b = fires.geometry.to_crs(bbox_crs).bounds
+        xmin, ymin, xmax, ymax = exact_bbox
+        fires = fires[((b["maxx"] >= xmin) & (b["minx"] <= xmax) & (b["maxy"] >= ymin) & (b["miny"] <= ymax)).values]
+    if columns is not None:
+        keep = [c for c in columns if c != "geometry"]
+        fires = fires[keep + ["geometry"]]
+    return fires.reset_index(drop=True)
+
+
+def summarize_store(store_dir=None) -> pd.DataFrame:
+    index = load_index(store_dir)
+    if not index["files"]:
+        return pd.DataFrame()
+    df = pd.DataFrame(index["files"])
+    return df.groupby(["CTPRV_NM", "year"]).agg(files=("path", "size"), rows=("rows", "sum")).reset_index()
+
+
+def parse_args():
+    parser = ArgumentParser(description="Convert raw fire shapefiles into the GeoParquet store.")
+    parser.add_argument("--force", action="store_true", help="rebuild the whole store")
+    parser.add_argument("--workers", type=int, default=None, help="conversion processes (default: CPU count)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    print(convert_fire_shapefiles(force=args.force, workers=args.workers))
+    print(summarize_store().to_string(index=False))
@@ -0,0 +1,284 @@
+"""
+Fire labels on a regular spatial grid (e.g. 1 km / 5 km cells) x date.
+
+Only positive (cell, day) pairs are stored, as sorted int64 keys
+`day_idx * n_cells + cell_id`; every other pair is an implicit negative.
+A province-scale 1 km grid over ten years is ~10^8 pairs, while the number
+of fire cell-days is in the thousands, so lookups are a binary search and
+the iterators generate (cell, date, label) batches on the fly.
+
+    python -m src.core.grid_labels --cell-m 1000
+"""
+import json
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from scipy import sparse
+
+from src.config.paths import PROC_DIR, ensure_dirs
+from src.core.datasets import read_dataset
+from src.core.stations import DIST_CRS, _transformer
+from src.core.telemetry import count_written, instrument, log
+
+
+GRID_META_KEY = b"firecast.grid"
+
+
+@dataclass(frozen=True)
+class GridSpec:
+    """Regular grid in `crs` (meters): cell_id = row * nx + col, row 0 at y0."""
+    cell_m: int
+    x0: float
+    y0: float
+    nx: int
+    ny: int
+    crs: str = DIST_CRS
+
+    @classmethod
+    def from_bounds(cls, xmin, ymin, xmax, ymax, cell_m: int, crs: str = DIST_CRS) -> "GridSpec":
+        """Snap bounds outward to multiples of cell_m."""
+        x0 = np.floor(xmin / cell_m) * cell_m
+        y0 = np.floor(ymin / cell_m) * cell_m
+        nx = int(np.floor((xmax - x0) / cell_m)) + 1
+        ny = int(np.floor((ymax - y0) / cell_m)) + 1
+        return cls(int(cell_m), float(x0), float(y0), nx, ny, crs)
+
+    @property
+    def n_cells(self) -> int:
+        return self.nx * self.ny
+
+    def project(self, lon, lat) -> Tuple[np.ndarray, np.ndarray]:
+        return _transformer("EPSG:4326", self.crs).transform(np.asarray(lon), np.asarray(lat))
+
+    def cell_of(self, x, y) -> np.ndarray:
+        """Grid-CRS coordinates -> cell_id (-1 outside the grid or NaN)."""
+        col = np.floor((np.asarray(x, dtype="float64") - self.x0) / self.cell_m)
+        row = np.floor((np.asarray(y, dtype="float64") - self.y0) / self.cell_m)
+        ok = (col >= 0) & (col < self.nx) & (row >= 0) & (row < self.ny)
+        cell = np.full(col.shape, -1, dtype="int64")
+        cell[ok] = row[ok].astype("int64") * self.nx + col[ok].astype("int64")
+        return cell
+
+    def cell_of_lonlat(self, lon, lat) -> np.ndarray:
+        return self.cell_of(*self.project(lon, lat))
+
+    def cell_centers(self, cell_ids) -> Tuple[np.ndarray, np.ndarray]:
+        """cell_id -> center (x, y) in the grid CRS."""
+        row, col = np.divmod(np.asarray(cell_ids, dtype="int64"), self.nx)
+        return self.x0 + (col + 0.5) * self.cell_m, self.y0 + (row + 0.5) * self.cell_m
+
+    def cell_centers_lonlat(self, cell_ids) -> Tuple[np.ndarray, np.ndarray]:
+        return _transformer(self.crs, "EPSG:4326").transform(*self.cell_centers(cell_ids))
+
+
+@dataclass
+class GridLabelCube:
+    """Sparse (cell x day) fire labels: sorted positive keys + fire counts."""
+    grid: GridSpec
+    dates: pd.DatetimeIndex
+    keys: np.ndarray      # int64, sorted, day_idx * n_cells + cell_id
+    n_fires: np.ndarray   # int32, fires per positive key
+
+    @property
+    def n_days(self) -> int:
+        return len(self.dates)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.grid.n_cells, self.n_days
+
+    @property
+    def n_positive(self) -> int:
+        return len(self.keys)
+
+    @property
+    def prevalence(self) -> float:
+        return self.n_positive / float(self.grid.n_cells * self.n_days)
+
+    def day_index(self, dates) -> np.ndarray:
+        """Dates -> day index on the cube's date axis (-1 if out of range)."""
+        days = (pd.DatetimeIndex(pd.to_datetime(dates)).normalize() - self.dates[0]).days.to_numpy()
+        days = days.astype("int64")
+        days[(days < 0) | (days >= self.n_days)] = -1
+        return days
+
+    def _lookup(self, keys: np.ndarray) -> np.ndarray:
+        """Positions in self.keys, -1 where the key is an implicit negative."""
+        pos = np.searchsorted(self.keys, keys)
+        pos_c = np.minimum(pos, max(self.n_positive - 1, 0))
+        hit = (pos < self.n_positive) & (self.keys[pos_c] == keys) if self.n_positive else np.zeros(len(keys), bool)
+        return np.where(hit, pos_c, -1)
+
+    def label(self, cell_ids, dates) -> np.ndarray:
+        """Vectorized label lookup for (cell_id, date) pairs (int8)."""
+        cell_ids = np.asarray(cell_ids, dtype="int64")
+        days = self.day_index(dates)
+        out = np.zeros(len(cell_ids), dtype="int8")
+        valid = (days >= 0) & (cell_ids >= 0)
+        out[valid] = self._lookup(days[valid] * self.grid.n_cells + cell_ids[valid]) >= 0
+        return out
+
+    def positives(self) -> pd.DataFrame:
+        day, cell = np.divmod(self.keys, self.grid.n_cells)
+        return pd.DataFrame({
+            "cell_id": cell,
+            "date": self.dates[day],
+            "n_fires": self.n_fires,
+        })
+
+    def iter_positives(self, batch_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        for lo in range(0, self.n_positive, batch_size):
+            day, cell = np.divmod(self.keys[lo:lo + batch_size], self.grid.n_cells)
+            yield pd.DataFrame({
+                "cell_id": cell,
+                "date": self.dates[day],
+                "label": np.ones(len(cell), dtype="int8"),
+            })
+
+    def iter_samples(
+            self,
+            batch_size: int = 1_000_000,
+            cells: Optional[Sequence[int]] = None,
+            start=None,
+            end=None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Every (cell, date, label) in day-major order, generated batch by batch.
+
+        cells: restrict to these cell_ids (e.g. land cells); default = whole grid.
+        start/end: inclusive date range; parts outside the cube's date axis are ignored.
+        """
+        cells = np.arange(self.grid.n_cells, dtype="int64") if cells is None else np.unique(np.asarray(cells, dtype="int64"))
+        # day_index 는 범위 밖이 -1 이라 bound 로 못 씀 -> date 축에서 searchsorted (자동으로 [0, n_days] clamp)
+        d_lo = 0 if start is None else int(self.dates.searchsorted(pd.Timestamp(start).normalize(), side="left"))
+        d_hi = self.n_days if end is None else int(self.dates.searchsorted(pd.Timestamp(end).normalize(), side="right"))
+        if d_hi <= d_lo or len(cells) == 0:
+            return
+
+        days_per_batch = max(1, batch_size // len(cells))
+        for d0 in range(d_lo, d_hi, days_per_batch):
+            days = np.arange(d0, min(d0 + days_per_batch, d_hi), dtype="int64")
+            day_col = np.repeat(days, len(cells))
+            cell_col = np.tile(cells, len(days))
+            labels = (self._lookup(day_col * self.grid.n_cells + cell_col) >= 0).astype("int8")
+            yield pd.DataFrame({
+                "cell_id": cell_col,
+                "date": self.dates[day_col],
+                "label": labels,
+            })
+
+    def to_sparse(self) -> sparse.csr_matrix:
+        """(n_days x n_cells) CSR matrix of fire counts."""
+        day, cell = np.divmod(self.keys, self.grid.n_cells)
+        return sparse.csr_matrix(
+            (self.n_fires, (day, cell)), shape=(self.n_days, self.grid.n_cells)
+        )
+
+    # --- persistence (positives only, grid/date axis in parquet metadata) ---
+
+    def save(self, path=None) -> Path:
+        path = Path(path) if path is not None else grid_labels_path(self.grid.cell_m)
+        ensure_dirs(path.parent)
+        meta = {
+            "grid": asdict(self.grid),
+            "start": str(self.dates[0].date()),
+            "end": str(self.dates[-1].date()),
+        }
+        table = pa.table({"key": self.keys, "n_fires": self.n_fires})
+        table = table.replace_schema_metadata({GRID_META_KEY: json.dumps(meta).encode()})
+        pq.write_table(table, path)
+        count_written(path)
+        return path
+
+    @classmethod
+    def load(cls, path) -> "GridLabelCube":
+        table = pq.read_table(path)
+        meta = json.loads(table.schema.metadata[GRID_META_KEY])
+        return cls(
+            grid=GridSpec(**meta["grid"]),
+            dates=pd.date_range(meta["start"], meta["end"], freq="D"),
+            keys=table.column("key").to_numpy().astype("int64"),
+            n_fires=table.column("n_fires").to_numpy().astype("int32"),
+        )
+
+
+def grid_labels_path(cell_m: int) -> Path:
+    return PROC_DIR / f"grid_labels_{int(cell_m)}m.parquet"
+
+
+@instrument()
+def build_grid_labels(
+        fires: Optional[pd.DataFrame] = None,
+        cell_m: int = 1000,
+        grid: Optional[GridSpec] = None,
+        start=None,
+        end=None,
+        bounds_buffer_m: float = 0.0,
+) -> GridLabelCube:
+    """
+    fire_events (lon/lat, fire_date) -> GridLabelCube.
+
+    grid: fixed grid to use; default = fire extent (+ buffer) snapped to cell_m.
+    start/end: date axis; default = first/last fire date.
+    Fires outside the grid or date range are dropped.
+    """
+    if fires is None:
+        fires = read_dataset("fire_events", columns=["lon", "lat", "fire_date"])
+    fires = fires.dropna(subset=["lon", "lat", "fire_date"])
+    dates = pd.to_datetime(fires["fire_date"]).dt.normalize()
+
+    if grid is None:
+        x, y = _transformer("EPSG:4326", DIST_CRS).transform(fires["lon"].to_numpy(), fires["lat"].to_numpy())
+        grid = GridSpec.from_bounds(
+            x.min() - bounds_buffer_m, y.min() - bounds_buffer_m,
+            x.max() + bounds_buffer_m, y.max() + bounds_buffer_m,
+            cell_m,
+        )
+    date_axis = pd.date_range(
+        pd.Timestamp(start) if start is not None else dates.min(),
+        pd.Timestamp(end) if end is not None else dates.max(),
+        freq="D",
+    )
+
+    cells = grid.cell_of_lonlat(fires["lon"].to_numpy(), fires["lat"].to_numpy())
+    days = (dates - date_axis[0]).dt.days.to_numpy()
+    ok = (cells >= 0) & (days >= 0) & (days < len(date_axis))
+    if (~ok).any():
+        n = int((~ok).sum())
+        log(f"[grid_labels] dropped {n} fires outside grid/date range", dropped=n)
+
+    keys, counts = np.unique(days[ok].astype("int64") * grid.n_cells + cells[ok], return_counts=True)
+    cube = GridLabelCube(grid, date_axis, keys, counts.astype("int32"))
+    log(
+        f"[grid_labels] cell={grid.cell_m}m grid={grid.nx}x{grid.ny} days={cube.n_days} "
+        f"positives={cube.n_positive} (prevalence {cube.prevalence:.2e})",
+        cell_m=grid.cell_m, days=cube.n_days, positives=cube.n_positive,
+    )
+    return cube
+
+
+def main(cell_m: int = 1000, start=None, end=None, bounds_buffer_m: float = 0.0) -> Path:
+    cube = build_grid_labels(cell_m=cell_m, start=start, end=end, bounds_buffer_m=bounds_buffer_m)
+    out = cube.save()
+    log(f"saved grid labels -> {out}", path=str(out))
+    return out
+
+
+def parse_args():
+    parser = ArgumentParser(description="Build sparse grid-cell x date fire labels from fire_events.")
+    parser.add_argument("--cell-m", type=int, default=1000)
+    parser.add_argument("--start", default=None)
+    parser.add_argument("--end", default=None)
+    parser.add_argument("--buffer-m", type=float, default=0.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(args.cell_m, args.start, args.end, args.buffer_m)
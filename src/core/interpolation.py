@@ -0,0 +1,214 @@
+"""
+Inverse-distance-weighted (IDW) daily weather at arbitrary points.
+
+Each point gets weights for its k nearest stations, stored as one sparse
+(n_points x n_stations) CSR matrix. Daily weather is held as a dense
+station x date cube per feature, so interpolation is a sparse matmul
+(all points x all dates) or a gather over the k non-zeros per row
+(each point on its own date), never k separate joins.
+Missing station values are excluded and the remaining weights renormalized.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.core.stations import StationIndex, WeatherStationRegistry
+
+
+IDW_FEATURES = ["TA", "TA_dtr", "POP", "is_precip", "WD_sin", "WD_cos", "SKY"]
+# 정수 코드 변수 (0/1, 1..4): 보간값을 반올림 = 거리 가중 다수결 / 가중 평균 등급 (schema Int8 유지)
+DISCRETE_FEATURES = ["is_precip", "SKY"]
+
+
+@dataclass
+class WeatherCube:
+    """Daily weather as values[feature, station, date] (NaN = missing)."""
+    features: List[str]
+    station_ids: np.ndarray
+    dates: pd.DatetimeIndex
+    values: np.ndarray
+
+    def date_positions(self, dates) -> np.ndarray:
+        """Positions of `dates` on the cube's date axis (-1 if out of range)."""
+        days = (pd.to_datetime(pd.Series(dates)).dt.normalize() - self.dates[0]).dt.days
+        days = days.fillna(-1).to_numpy(dtype="int64")
+        days[(days < 0) | (days >= len(self.dates))] = -1
+        return days
+
+
+def build_weather_cube(
+        weather_daily: pd.DataFrame,
+        station_ids: Sequence[int],
+        features: Sequence[str] = IDW_FEATURES,
+        dtype="float32",
+) -> WeatherCube:
+    """Scatter weather_daily rows into a dense feature x station x date array."""
+    features = [f for f in features if f in weather_daily.columns]
+    station_ids = np.asarray(station_ids)
+    dates = pd.to_datetime(weather_daily["date"]).dt.normalize()
+    date_axis = pd.date_range(dates.min(), dates.max(), freq="D")
+
+    station_pos = pd.Series(np.arange(len(station_ids)), index=station_ids)
+    s_pos = station_pos.reindex(pd.to_numeric(weather_daily["station_id"])).to_numpy()
+    keep = ~np.isnan(s_pos)
+    s_pos = s_pos[keep].astype("int64")
+    d_pos = (dates[keep] - date_axis[0]).dt.days.to_numpy()
+
+    values = np.full((len(features), len(station_ids), len(date_axis)), np.nan, dtype=dtype)
+    for i, f in enumerate(features):
+        col = pd.to_numeric(weather_daily[f], errors="coerce").astype("float64").to_numpy()
+        values[i, s_pos, d_pos] = col[keep]
+    return WeatherCube(features, station_ids, date_axis, values)
+
+
+def idw_weights(
+        index: StationIndex,
+        xy: np.ndarray,
+        k: int = 3,
+        power: float = 2.0,
+        max_dist_m: Optional[float] = None,
+) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """
+    Row-normalized IDW weights of the k nearest stations for projected points.
+
+    Returns (W, nearest_dist_m). A point on top of a station gets weight 1 for it;
+    stations beyond max_dist_m get weight 0 (rows with none stay all-zero).
+    Points with non-finite coordinates (empty geometry) get an all-zero row and NaN distance.
+    """
+    k = min(k, len(index.station_ids))
+    ok = np.isfinite(xy).all(axis=1)
+    pos = np.zeros((len(xy), k), dtype="int64")
+    dist = np.full((len(xy), k), np.inf)
+    if ok.any():
+        p, d = index.nearest(xy[ok], k=k)
+        pos[ok] = p.reshape(-1, k)
+        dist[ok] = d.reshape(-1, k)
+
+    with np.errstate(divide="ignore"):
+        w = 1.0 / np.power(dist, power)
+    exact = dist == 0
+    w = np.where(exact.any(axis=1, keepdims=True), exact.astype("float64"), w)
+    if max_dist_m is not None:
+        w[dist > max_dist_m] = 0.0
+    total = w.sum(axis=1, keepdims=True)
+    w = np.divide(w, total, out=np.zeros_like(w), where=total > 0)
+
+    W = sparse.csr_matrix(
+        (w.ravel(), pos.ravel(), np.arange(0, len(xy) * k + 1, k)),
+        shape=(len(xy), len(index.station_ids)),
+    )
+    return W, np.where(ok, dist[:, 0], np.nan)
+
+
+def interpolate_at_points(cube: WeatherCube, W: sparse.csr_matrix, date_pos: np.ndarray) -> pd.DataFrame:
+    """IDW value of every cube feature for point i on date `date_pos[i]` (one row per point)."""
+    n = W.shape[0]
+    row_len = np.diff(W.indptr)
+    rows = np.repeat(np.arange(n), row_len)
+    d = date_pos[rows]
+    valid_date = d >= 0
+
+    out = {}
+    for i, f in enumerate(cube.features):
+        v = np.full(len(rows), np.nan)
+        v[valid_date] = cube.values[i, W.indices[valid_date], d[valid_date]]
+        m = ~np.isnan(v)
+        num = np.bincount(rows, weights=np.where(m, v, 0.0) * W.data, minlength=n)
+        den = np.bincount(rows, weights=m * W.data, minlength=n)
+        out[f] = np.divide(num, den, out=np.full(n, np.nan), where=den > 0)
+    return pd.DataFrame(out)
+
+
+def interpolate_grid(
+        cube: WeatherCube,
+        W: sparse.csr_matrix,
+        feature: str,
+        date_chunk: int = 366,
+) -> Iterator[Tuple[pd.DatetimeIndex, np.ndarray]]:
+    """
+    IDW value of `feature` for every point x every date, as (dates, (n_points, n_dates)) chunks.
+
+    Each chunk is two sparse matmuls: W @ filled_values / W @ observed_mask.
+    """
+    v_all = cube.values[cube.features.index(feature)]
+    for start in range(0, len(cube.dates), date_chunk):
+        v = v_all[:, start:start + date_chunk]
+        m = ~np.isnan(v)
+        num = W @ np.where(m, v, 0.0)
+        den = W @ m.astype(v.dtype)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            res = np.where(den > 0, num / den, np.nan).astype(v.dtype)
+        yield cube.dates[start:start + date_chunk], res
+
+
+def station_index_with_data(registry: WeatherStationRegistry, weather_daily: pd.DataFrame) -> StationIndex:
+    """StationIndex over the registry stations that have rows in weather_daily."""
+    with_data = set(pd.to_numeric(weather_daily["station_id"]).dropna().astype(int))
+    return StationIndex([s for s in registry.stations if s.station_id in with_data])
+
+
+def iter_idw_weather(
+        weather_daily: pd.DataFrame,
+        registry: WeatherStationRegistry,
+        x,
+        y,
+        crs: str,
+        k: int = 3,
+        power: float = 2.0,
+        max_dist_m: Optional[float] = None,
+        features: Sequence[str] = IDW_FEATURES,
+        date_chunk: int = 366,
+) -> Iterator[Tuple[pd.DatetimeIndex, Dict[str, np.ndarray]]]:
+    """
+    IDW weather for fixed points (x, y in `crs`) on every weather_daily date.
+
+    Yields (dates, {feature: (n_points, n_dates) array}) per date chunk; the
+    weights are built once and each chunk is `interpolate_grid`'s matmuls.
+    """
+    index = station_index_with_data(registry, weather_daily)
+    W, _ = idw_weights(index, index.project(x, y, crs=crs), k=k, power=power, max_dist_m=max_dist_m)
+    cube = build_weather_cube(weather_daily, index.station_ids, features)
+    chunks = [interpolate_grid(cube, W, f, date_chunk=date_chunk) for f in cube.features]
+    for parts in zip(*chunks):
+        yield parts[0][0], {
+            f: np.round(values) if f in DISCRETE_FEATURES else values
+            for f, (_, values) in zip(cube.features, parts)
+        }
+
+
+def attach_idw_weather(
+        fire_gdf: gpd.GeoDataFrame,
+        weather_daily: pd.DataFrame,
+        registry: WeatherStationRegistry,
+        k: int = 3,
+        power: float = 2.0,
+        max_dist_m: Optional[float] = None,
+        date_col: str = "fire_date",
+        features: Sequence[str] = IDW_FEATURES,
+) -> gpd.GeoDataFrame:
+    """
+    산불 지점별 발생일 기상을 k개 최근접 관측소의 IDW 로 붙이기.
+
+    weather_daily 에 데이터가 있는 관측소만 사용. 결과 컬럼: features + idw_nearest_m.
+    """
+    if fire_gdf.crs is None:
+        raise ValueError("fire_gdf.crs 가 None입니다. CRS를 먼저 지정해 주세요.")
+
+    index = station_index_with_data(registry, weather_daily)
+
+    centroids = fire_gdf.geometry.centroid if not (fire_gdf.geom_type == "Point").all() else fire_gdf.geometry
+    xy = index.project(centroids.x, centroids.y, crs=fire_gdf.crs.to_string())
+    W, nearest = idw_weights(index, xy, k=k, power=power, max_dist_m=max_dist_m)
+
+    cube = build_weather_cube(weather_daily, index.station_ids, features, dtype="float64")
+    values = interpolate_at_points(cube, W, cube.date_positions(fire_gdf[date_col]))
+
+    out = fire_gdf.copy()
+    for col in values.columns:
+        out[col] = np.round(values[col].to_numpy()) if col in DISCRETE_FEATURES else values[col].to_numpy()
+    out["idw_nearest_m"] = nearest
+    return out
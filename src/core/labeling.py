@@ -1,11 +1,16 @@
+import numpy as np
 import pandas as pd
 
-from src.config.paths import PROC_DIR
+from src.core.datasets import read_dataset, write_dataset
+from src.core.schema import COMPACT_DTYPES
+from src.core.telemetry import instrument, log
+from src.core.weather_daily import read_weather_daily
 
 
+@instrument()
 def build_labels():
-    fires = pd.read_parquet(PROC_DIR / "fire_events.parquet")
-    weather = pd.read_parquet(PROC_DIR / "weather_daily.parquet")
+    fires = read_dataset("fire_events", columns=["station_id", "fire_date"])
+    weather = read_weather_daily()
 
     fires = fires.rename(columns={"fire_date": "date"})
     fires["date"] = pd.to_datetime(fires["date"]).dt.normalize()
@@ -14,11 +19,65 @@ def build_labels():
     labels = fires.groupby(["station_id", "date"], as_index=False)["fire_label"].max()
 
     df = weather.merge(labels, on=["station_id", "date"], how="left")
-    df["fire_label"] = df["fire_label"].fillna(0).astype(int)
+    df["fire_label"] = df["fire_label"].fillna(0).astype(COMPACT_DTYPES["fire_label"])
 
-    out = PROC_DIR / "weather_labeled.parquet"
-    df.to_parquet(out, index=False)
-    print("saved labeled dataset ->", out)
+    out = write_dataset("weather_labeled", df)
+    log(f"saved labeled dataset -> {out}", path=str(out))
+    return df
+
+
+@instrument()
+def build_grid_weather_labels(
+        cell_m: int = 1000,
+        k: int = 3,
+        power: float = 2.0,
+        stations: str = "gangneung",
+        date_chunk: int = 366,
+):
+    """
+    Fire cells x every weather date, with IDW weather instead of one station's row.
+
+    Cells are the grid cells (GridLabelCube, `cell_m`) that had at least one
+    fire; each gets the IDW weather of its k nearest stations with data
+    (`stations`: see fire_events.station_registry) at the cell center, and
+    fire_label from the cube. Written as the grid_weather_labeled dataset.
+    """
+    from src.core.fire_events import station_registry
+    from src.core.grid_labels import GridLabelCube, build_grid_labels, grid_labels_path
+    from src.core.interpolation import iter_idw_weather
+
+    path = grid_labels_path(cell_m)
+    cube = GridLabelCube.load(path) if path.exists() else build_grid_labels(cell_m=cell_m)
+    cells = np.unique(cube.keys % cube.grid.n_cells)
+    if len(cells) == 0:
+        raise ValueError(f"No fire cells in the {cell_m}m grid labels")
+    weather = read_weather_daily()
+    x, y = cube.grid.cell_centers(cells)
+    lon, lat = cube.grid.cell_centers_lonlat(cells)
+
+    parts = []
+    for dates, values in iter_idw_weather(
+            weather, station_registry(stations), x, y, cube.grid.crs, k=k, power=power, date_chunk=date_chunk,
+    ):
+        # (n_cells, n_dates) -> 날짜 우선 long format
+        n = len(cells) * len(dates)
+        date_col = np.repeat(dates.to_numpy(), len(cells))
+        cell_col = np.tile(cells, len(dates))
+        part = pd.DataFrame({
+            "cell_id": cell_col.astype("int32"),
+            "date": date_col,
+            "lon": np.tile(lon, len(dates)),
+            "lat": np.tile(lat, len(dates)),
+        })
+        for f, v in values.items():
+            part[f] = v.T.reshape(n)
+        part["fire_label"] = cube.label(cell_col, date_col).astype(COMPACT_DTYPES["fire_label"])
+        parts.append(part)
+
+    df = pd.concat(parts, ignore_index=True)
+    out = write_dataset("grid_weather_labeled", df)
+    log(f"[grid_weather_labeled] {len(cells):,} fire cells x {df['date'].nunique():,} days, "
+        f"{int(df['fire_label'].sum()):,} positives -> {out}", path=str(out))
     return df
 
 
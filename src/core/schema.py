@@ -0,0 +1,113 @@
+"""
+Compact column dtypes for processed tables.
+
+    from src.core.schema import apply_schema, feature_frame
+
+pandas defaults are wide (float64 features, int64 / nullable Int64 ids,
+object strings). Processed tables use:
+
+- station_id: Int16 (KMA 지점번호 < 1000; nullable for unmatched fires)
+- is_precip / SKY: Int8, fire_label: int8
+- weather features (TA, TA_dtr, POP, WD_sin, WD_cos) and their lags: float32
+- CTPRV_NM / SGNG_NM, risk_level: category
+
+`write_dataset` applies the schema before writing and `read_dataset` after
+reading (so files written by older runs come back compact too). Integer
+casts are checked: a value that does not fit raises instead of wrapping.
+lon/lat stay float64 (float32 is ~1 m at Korean longitudes).
+"""
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+WEATHER_FEATURES = ["TA", "TA_dtr", "POP", "WD_sin", "WD_cos"]
+
+COMPACT_DTYPES: Dict[str, str] = {
+    "station_id": "Int16",
+    "is_precip": "Int8",
+    "SKY": "Int8",
+    "fire_label": "int8",
+    "dist_m": "float32",
+    "sample_weight": "float32",
+    "base_prob": "float32",
+    "CTPRV_NM": "category",
+    "SGNG_NM": "category",
+    "risk_level": "category",
+    **{c: "float32" for c in WEATHER_FEATURES},
+}
+
+# build_window_features 출력: {c}_minus{k}d 는 원래 컬럼 dtype, rolling 집계는 float32
+_LAG_RE = re.compile(r"^(?P<base>.+)_minus\d+d$")
+_WINDOW_RE = re.compile(r"^(?P<base>.+)_(sum|mean|max|min)\d+d$")
+
+
+def compact_dtype(col: str) -> Optional[str]:
+    """Target dtype for column `col` (None = leave as is)."""
+    if col in COMPACT_DTYPES:
+        return COMPACT_DTYPES[col]
+    m = _LAG_RE.match(col)
+    if m and m["base"] in COMPACT_DTYPES:
+        # shift 결과는 첫 k 일이 NA 라 정수는 nullable 로
+        dtype = COMPACT_DTYPES[m["base"]]
+        return dtype[0].upper() + dtype[1:] if dtype.startswith("int") else dtype
+    m = _WINDOW_RE.match(col)
+    if m and m["base"] in COMPACT_DTYPES and m["base"] not in ("station_id", "CTPRV_NM", "SGNG_NM"):
+        return "float32"
+    return None
+
+
+def _cast(s: pd.Series, dtype: str) -> pd.Series:
+    if dtype == "category":
+        return s.astype("category")
+    if not pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+        s = pd.to_numeric(s, errors="coerce")
+    if dtype.startswith("float"):
+        return s.astype(dtype)
+
+    # 정수: nullable 로 먼저 캐스팅 (범위를 벗어나거나 소수점이 있으면 TypeError)
+    nullable = dtype[0].upper() + dtype[1:]
+    try:
+        out = s.astype(nullable)
+    except TypeError as e:
+        raise ValueError(f"Column {s.name!r} does not fit {dtype}: {e}") from None
+    if dtype != nullable:
+        if out.isna().any():
+            raise ValueError(f"Column {s.name!r} has missing values; cannot cast to {dtype}")
+        out = out.astype(dtype)
+    return out
+
+
+def apply_schema(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Cast the columns of `df` that have a compact dtype (in place; returns `df`)."""
+    for col in df.columns if columns is None else columns:
+        dtype = compact_dtype(col)
+        if dtype is None or col not in df.columns or str(df[col].dtype) == dtype:
+            continue
+        df[col] = _cast(df[col], dtype)
+    return df
+
+
+def feature_frame(df: pd.DataFrame, features: List[str]) -> pd.DataFrame:
+    """Model input as a float32 frame (nullable NA -> NaN), keeping column names."""
+    return df[features].astype("float32")
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    return float(df.memory_usage(deep=True).sum()) / 2**20
+
+
+def dtype_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Per-column dtype and in-memory size before / after `apply_schema`."""
+    mem_before = before.memory_usage(deep=True, index=False)
+    mem_after = after.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.astype(str),
+        "mb_before": mem_before / 2**20,
+        "mb_after": mem_after / 2**20,
+    })
+    report["ratio"] = np.where(report["mb_before"] > 0, report["mb_after"] / report["mb_before"], np.nan)
+    return report
@@ -1,8 +1,32 @@
 # firecast/scripts/stations.py
+import glob
+import os
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+from pyproj import Transformer
+from scipy.spatial import cKDTree
+
+from src.config.paths import META_RAW_DIR
+from src.core.weather_daily import detect_csv_encoding, pick_column
+
+# 거리 계산용 투영좌표계 (meter)
+DIST_CRS = "EPSG:5179"
+
+# KMA 관측지점 메타 CSV 컬럼 후보
+META_COLUMN_CANDIDATES = {
+    "station_id": ["지점", "지점번호", "STN", "STN_ID", "stn_id"],
+    "name_kr": ["지점명", "STN_KO", "name_kr"],
+    "name_en": ["지점영문명", "STN_EN", "name_en"],
+    "lat": ["위도", "LAT", "lat"],
+    "lon": ["경도", "LON", "lon"],
+    "start": ["시작일", "START_DT", "start"],
+    "end": ["종료일", "END_DT", "end"],
+}
 
 @dataclass
 class WeatherStation:
@@ -17,6 +41,59 @@ class WeatherStationRegistry:
     """관측소 정보를 관리하는 레지스트리."""
     def __init__(self, stations: List[WeatherStation]):
         self.stations = stations
+        self._index: Optional["StationIndex"] = None
+
+    @classmethod
+    def from_kma_meta(cls, meta_path=None, active_only: bool = True) -> "WeatherStationRegistry":
+        """
+        data/raw/meta 의 KMA 관측지점 메타 CSV 로 전국 레지스트리 생성.
+
+        같은 지점이 이전 이력으로 여러 행일 수 있어 시작일 기준 마지막 행만 사용.
+        active_only=True 이면 종료일이 있는 (폐지된) 지점은 제외.
+        """
+        if meta_path is None:
+            csv_paths = sorted(glob.glob(os.path.join(str(META_RAW_DIR), "*.csv")))
+            if not csv_paths:
+                raise FileNotFoundError(f"No station meta CSV found in: {META_RAW_DIR}")
+            meta_path = csv_paths[0]
+
+        meta = pd.read_csv(meta_path, encoding=detect_csv_encoding(str(meta_path)))
+        cols = {k: pick_column(meta.columns, v) for k, v in META_COLUMN_CANDIDATES.items()}
+        missing = [k for k in ["station_id", "lat", "lon"] if cols[k] is None]
+        if missing:
+            raise ValueError(f"Required station meta columns not found: {missing}")
+
+        df = pd.DataFrame({
+            "station_id": pd.to_numeric(meta[cols["station_id"]], errors="coerce"),
+            "name_kr": meta[cols["name_kr"]].astype("string") if cols["name_kr"] else "",
+            "name_en": meta[cols["name_en"]].astype("string") if cols["name_en"] else "",
+            "lat": pd.to_numeric(meta[cols["lat"]], errors="coerce"),
+            "lon": pd.to_numeric(meta[cols["lon"]], errors="coerce"),
+            "start": pd.to_datetime(meta[cols["start"]], errors="coerce") if cols["start"] else pd.NaT,
+            "end": meta[cols["end"]] if cols["end"] else pd.NA,
+        }).dropna(subset=["station_id", "lat", "lon"])
+
+        if active_only:
+            df = df[df["end"].isna() | (df["end"].astype("string").str.strip() == "")]
+        df = df.sort_values(["station_id", "start"]).drop_duplicates("station_id", keep="last")
+
+        stations = [
+            WeatherStation(
+                station_id=int(r.station_id),
+                name_kr=str(r.name_kr),
+                name_en=str(r.name_en),
+                lat=float(r.lat),
+                lon=float(r.lon),
+            )
+            for r in df.itertuples(index=False)
+        ]
+        return cls(stations)
+
+    def spatial_index(self) -> "StationIndex":
+        """관측소 최근접/반경 검색용 KD-tree (한 번만 생성해서 재사용)."""
+        if self._index is None:
+            self._index = StationIndex(self.stations)
+        return self._index
 
     @classmethod
     def default_kma_gangneung(cls) -> "WeatherStationRegistry":
@@ -51,18 +128,130 @@ class WeatherStationRegistry:
         return gdf
 
 
+@lru_cache(maxsize=16)
+def _transformer(src_crs: str, dst_crs: str = DIST_CRS) -> Transformer:
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
+
+class StationIndex:
+    """
+    KD-tree over station coordinates projected to DIST_CRS (EPSG:5179, meter).
+
+    Distances are planar in EPSG:5179, same as the `sjoin_nearest` path.
+    """
+
+    def __init__(self, stations: List[WeatherStation]):
+        if not stations:
+            raise ValueError("StationIndex requires at least one station.")
+        self.station_ids = np.array([s.station_id for s in stations])
+        self.names_kr = np.array([s.name_kr for s in stations], dtype=object)
+        self.names_en = np.array([s.name_en for s in stations], dtype=object)
+        self.lon = np.array([s.lon for s in stations], dtype="float64")
+        self.lat = np.array([s.lat for s in stations], dtype="float64")
+        self.xy = np.column_stack(_transformer("EPSG:4326").transform(self.lon, self.lat))
+        self.tree = cKDTree(self.xy)
+
+    def project(self, x, y, crs: str = "EPSG:4326") -> np.ndarray:
+        """Point coordinates in `crs` -> (n, 2) array in DIST_CRS."""
+        x = np.asarray(x, dtype="float64")
+        y = np.asarray(y, dtype="float64")
+        if crs != DIST_CRS:
+            x, y = _transformer(crs).transform(x, y)
+        return np.column_stack([x, y])
+
+    def nearest(self, xy: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k nearest stations for each projected point.
+
+        Returns (positions, dist_m) with shape (n,) for k=1, else (n, k).
+        `positions` index into `station_ids`.
+        """
+        k = min(k, len(self.station_ids))
+        dist, pos = self.tree.query(xy, k=k)
+        return pos, dist
+
+    def within_radius(self, xy: np.ndarray, radius_m: float) -> pd.DataFrame:
+        """All (point_idx, station_id, dist_m) pairs with dist_m <= radius_m."""
+        hits = self.tree.query_ball_point(xy, r=radius_m)
+        counts = np.fromiter((len(h) for h in hits), dtype="int64", count=len(hits))
+        point_idx = np.repeat(np.arange(len(hits)), counts)
+        pos = np.fromiter((p for h in hits for p in h), dtype="int64", count=int(counts.sum()))
+        dist = np.hypot(*(xy[point_idx] - self.xy[pos]).T) if len(pos) else np.empty(0)
+        return pd.DataFrame({
+            "point_idx": point_idx,
+            "station_id": self.station_ids[pos],
+            "dist_m": dist,
+        })
+
+
+def _point_xy(gdf: gpd.GeoDataFrame) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Point 좌표 배열 (Point 가 아닌 geometry 가 섞여 있으면 None)."""
+    geom = gdf.geometry
+    if not (geom.geom_type == "Point").all():
+        return None
+    return geom.x.to_numpy(), geom.y.to_numpy()
+
+
+def attach_nearest_station_indexed(
+        fire_gdf: gpd.GeoDataFrame,
+        registry: WeatherStationRegistry,
+        distance_col: str = "dist_m",
+) -> gpd.GeoDataFrame:
+    """
+    `attach_nearest_station` 과 같은 결과를 레지스트리의 KD-tree 로 계산.
+
+    fire geometry 는 변환하지 않고 좌표 배열만 EPSG:5179 로 투영한다.
+    Point 가 아닌 geometry 는 sjoin_nearest 경로로 처리.
+    """
+    if fire_gdf.crs is None:
+        raise ValueError("fire_gdf.crs 가 None입니다. CRS를 먼저 지정해 주세요.")
+
+    coords = _point_xy(fire_gdf)
+    if coords is None:
+        return attach_nearest_station(fire_gdf, registry, distance_col=distance_col, use_index=False)
+
+    index = registry.spatial_index()
+    xy = index.project(*coords, crs=fire_gdf.crs.to_string())
+    # 빈 Point 는 좌표가 NaN -> KD-tree 에 넣지 않고 sjoin_nearest 처럼 NaN 으로 남김
+    ok = np.isfinite(xy).all(axis=1)
+    pos, dist = index.nearest(xy[ok], k=1) if ok.any() else (np.empty(0, "int64"), np.empty(0))
+
+    out = fire_gdf.copy()
+    values = {
+        "index_right": pos,
+        "station_id": index.station_ids[pos],
+        "name_kr": index.names_kr[pos],
+        "name_en": index.names_en[pos],
+        "stn_lat": index.lat[pos],
+        "stn_lon": index.lon[pos],
+        distance_col: dist,
+    }
+    for col, v in values.items():
+        out[col] = v if ok.all() else pd.Series(v, index=out.index[ok]).reindex(out.index)
+    return out
+
+
 def attach_nearest_station(
         fire_gdf: gpd.GeoDataFrame,
         registry: WeatherStationRegistry,
         distance_col: str = "dist_m",
+        use_index: bool = True,
 ) -> gpd.GeoDataFrame:
     """
     산불 지점에 최근접 관측소 정보 붙이기 (거리 단위: meter, EPSG:5179 기준).
+
+    use_index=True 이면 레지스트리의 KD-tree 사용 (`attach_nearest_station_indexed`),
+    False 이면 매번 to_crs + gpd.sjoin_nearest.
     """
     if fire_gdf.crs is None:
         raise ValueError("fire_gdf.crs 가 None입니다. CRS를 먼저 지정해 주세요.")
 
-    stations_wgs84 = registry.to_geodataframe(crs="EPSG:4326")
+    if use_index:
+        return attach_nearest_station_indexed(fire_gdf, registry, distance_col=distance_col)
+
+    # 관측소 WGS84 좌표는 stn_lat/stn_lon 으로 (fire 쪽 lon/lat 과 겹치지 않고 shapefile 10자 제한 안)
+    stations_wgs84 = registry.to_geodataframe(crs="EPSG:4326").rename(
+        columns={"lat": "stn_lat", "lon": "stn_lon"})
 
     # fire 좌표 WGS84 맞추기
     if fire_gdf.crs.to_string() != "EPSG:4326":
@@ -71,18 +260,18 @@ def attach_nearest_station(
         fires_wgs84 = fire_gdf
 
     # 거리 계산용 투영좌표계
-    fires_proj = fires_wgs84.to_crs("EPSG:5179")
-    stations_proj = stations_wgs84.to_crs("EPSG:5179")
+    fires_proj = fires_wgs84.to_crs(DIST_CRS)
+    stations_proj = stations_wgs84.to_crs(DIST_CRS)
 
     joined = gpd.sjoin_nearest(
         fires_proj,
-        stations_proj[["station_id", "name_kr", "name_en", "geometry"]],
+        stations_proj[["station_id", "name_kr", "name_en", "stn_lat", "stn_lon", "geometry"]],
         how="left",
         distance_col=distance_col,
     )
 
     # 원래 CRS로 다시 돌려서 반환
-    if fire_gdf.crs.to_string() != "EPSG:5179":
+    if fire_gdf.crs.to_string() != DIST_CRS:
         joined = joined.to_crs(fire_gdf.crs)
 
     return joined
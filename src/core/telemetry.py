@@ -0,0 +1,286 @@
+"""
+Per-stage performance telemetry as JSON lines.
+
+    from src.core.telemetry import instrument, log, stage, count_read, count_written
+
+    @instrument()                        # rows_in / rows_out from DataFrame arg / result
+    def normalize_weather_daily(): ...
+
+    with stage("load_weather_raw") as rec:
+        ...
+        rec.rows_out = len(df)
+
+    log(f"saved -> {out}", path=str(out))   # progress line: printed + kept on the stage record
+
+One record per stage call is appended to TELEMETRY_PATH with run_id, stage
+name, parent stage, wall/CPU seconds, peak-RSS rise, end RSS, rows in/out,
+bytes read/written, status and the progress messages logged during the call.
+Bytes are attributed to every active stage (so a parent includes its children).
+A run_id is created per process and inherited by child processes through
+FIRECAST_RUN_ID.
+
+Stages are pipeline / CLI entry points (one record per stage run, not per
+chunk or per request); helpers they call only add bytes / log lines to the
+enclosing stage. Overhead is a few syscalls and one line-buffered append per
+stage (~50 us), so it stays on by default; FIRECAST_TELEMETRY=0 disables it.
+peak_rss_delta_mb uses the process high-water mark (getrusage), i.e. how much
+the stage raised the peak; 0 means it stayed under an earlier peak.
+
+    python -m src.core.telemetry --top 10          # slowest stages of the latest run
+"""
+import contextvars
+import functools
+import json
+import os
+import resource
+import sys
+import time
+import uuid
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+from src.config.paths import TELEMETRY_PATH
+
+ENABLED = os.environ.get("FIRECAST_TELEMETRY", "1") != "0"
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024  # ru_maxrss: macOS bytes, Linux KB
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+MAX_EVENTS = 50  # stage 당 보관하는 log 메시지 수 (나머지는 events_dropped 로만 셈)
+
+_active: contextvars.ContextVar[tuple] = contextvars.ContextVar("firecast_stages", default=())
+
+
+def run_id() -> str:
+    """Current run ID (created once per process tree, shared via FIRECAST_RUN_ID)."""
+    rid = os.environ.get("FIRECAST_RUN_ID")
+    if not rid:
+        rid = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+        os.environ["FIRECAST_RUN_ID"] = rid
+    return rid
+
+
+def _maxrss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_SCALE
+
+
+def _rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        return None
+
+
+@dataclass
+class StageRecord:
+    stage: str
+    run_id: str
+    parent: Optional[str] = None
+    pid: int = field(default_factory=os.getpid)
+    started_at: str = ""
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_delta_mb: float = 0.0
+    rss_end_mb: Optional[float] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    bytes_read: int = 0
+    bytes_written: int = 0
+    status: str = "ok"
+    error: Optional[str] = None
+    events: List[dict] = field(default_factory=list)
+    events_dropped: int = 0
+
+
+def _size(path_or_bytes) -> int:
+    if isinstance(path_or_bytes, int):
+        return path_or_bytes
+    p = Path(path_or_bytes)
+    try:
+        if p.is_dir():
+            return sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+        return p.stat().st_size
+    except OSError:
+        return 0
+
+
+def tracking() -> bool:
+    """True if a stage is active (callers can skip computing byte counts otherwise)."""
+    return bool(_active.get())
+
+
+def count_read(path_or_bytes) -> None:
+    """Add a file/dir size (or byte count) to bytes_read of every active stage."""
+    stack = _active.get()
+    if stack:
+        n = _size(path_or_bytes)
+        for rec in stack:
+            rec.bytes_read += n
+
+
+def count_written(path_or_bytes) -> None:
+    """Add a file/dir size (or byte count) to bytes_written of every active stage."""
+    stack = _active.get()
+    if stack:
+        n = _size(path_or_bytes)
+        for rec in stack:
+            rec.bytes_written += n
+
+
+def log(msg: str, **fields) -> None:
+    """
+    Progress message: printed, and kept (with JSON-able `fields`) in the
+    innermost active stage's `events`.
+    """
+    print(msg)
+    stack = _active.get()
+    if stack:
+        rec = stack[-1]
+        if len(rec.events) < MAX_EVENTS:
+            rec.events.append({"msg": msg, **fields})
+        else:
+            rec.events_dropped += 1
+
+
+_sink = {"pid": None, "file": None}
+
+
+def _emit(rec: StageRecord) -> None:
+    try:
+        # 프로세스마다 append 핸들 하나 (fork 후에는 새로 연다)
+        if _sink["pid"] != os.getpid():
+            TELEMETRY_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _sink["file"] = open(TELEMETRY_PATH, "a", encoding="utf-8", buffering=1)
+            _sink["pid"] = os.getpid()
+        # 한 줄 단위 append (O_APPEND) 라 여러 프로세스가 같은 파일에 써도 줄이 섞이지 않음
+        _sink["file"].write(json.dumps(rec.__dict__, ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        print(f"[telemetry] could not write {TELEMETRY_PATH}: {e}", file=sys.stderr)
+
+
+@contextmanager
+def stage(name: str, rows_in: Optional[int] = None) -> Iterator[StageRecord]:
+    """Time a block; set rec.rows_out / use count_read/count_written inside."""
+    stack = _active.get()
+    rec = StageRecord(stage=name, run_id=run_id(), parent=stack[-1].stage if stack else None, rows_in=rows_in)
+    if not ENABLED:
+        yield rec
+        return
+
+    token = _active.set(stack + (rec,))
+    rec.started_at = datetime.now().isoformat(timespec="milliseconds")
+    maxrss0 = _maxrss()
+    cpu0 = time.process_time()
+    t0 = time.perf_counter()
+    try:
+        yield rec
+    except BaseException as e:
+        rec.status = "error"
+        rec.error = f"{type(e).__name__}: {e}"[:500]
+        raise
+    finally:
+        rec.wall_s = round(time.perf_counter() - t0, 6)
+        rec.cpu_s = round(time.process_time() - cpu0, 6)
+        rec.peak_rss_delta_mb = round((_maxrss() - maxrss0) / 2**20, 2)
+        rss = _rss()
+        rec.rss_end_mb = round(rss / 2**20, 1) if rss is not None else None
+        _active.reset(token)
+        _emit(rec)
+
+
+def _nrows(obj) -> Optional[int]:
+    """len() of a DataFrame-like object (or the first one in a tuple)."""
+    if isinstance(obj, tuple) and obj:
+        obj = obj[0]
+    if hasattr(obj, "columns") and hasattr(obj, "__len__"):
+        return len(obj)
+    return None
+
+
+def instrument(name: Optional[str] = None, tag_arg: Optional[str] = None) -> Callable:
+    """
+    Decorator form of `stage`. Stage name defaults to <module>.<function>
+    (without the leading "src."); tag_arg appends that argument's value,
+    e.g. tag_arg="name" records load(name="weather_daily") as <module>.load:weather_daily.
+    """
+    def deco(fn):
+        base = name or f"{fn.__module__.removeprefix('src.')}.{fn.__qualname__}"
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            stage_name = base
+            if tag_arg is not None:
+                tag = kwargs.get(tag_arg, args[0] if args else None)
+                stage_name = f"{base}:{tag}"
+            rows_in = next((n for n in map(_nrows, args) if n is not None), None)
+            with stage(stage_name, rows_in=rows_in) as rec:
+                out = fn(*args, **kwargs)
+                rec.rows_out = _nrows(out)
+                return out
+
+        return wrapper
+
+    return deco
+
+
+# --- report ------------------------------------------------------------------
+
+def load_records(path=None) -> List[dict]:
+    path = Path(path) if path is not None else TELEMETRY_PATH
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(run: Optional[str] = None, top: int = 10, path=None):
+    """Slowest stages of one run (default: the most recent run in the file)."""
+    import pandas as pd
+
+    df = pd.DataFrame(load_records(path))
+    if df.empty:
+        print(f"[telemetry] no records in {path or TELEMETRY_PATH}")
+        return df
+    if run in (None, "latest"):
+        run = df.sort_values("started_at")["run_id"].iloc[-1]
+    df = df[df["run_id"] == run]
+
+    agg = (
+        df.groupby("stage")
+        .agg(
+            calls=("wall_s", "size"),
+            wall_s=("wall_s", "sum"),
+            cpu_s=("cpu_s", "sum"),
+            max_wall_s=("wall_s", "max"),
+            peak_rss_delta_mb=("peak_rss_delta_mb", "max"),
+            rows_in=("rows_in", lambda s: s.sum(min_count=1)),
+            rows_out=("rows_out", lambda s: s.sum(min_count=1)),
+            mb_read=("bytes_read", lambda s: s.sum() / 2**20),
+            mb_written=("bytes_written", lambda s: s.sum() / 2**20),
+            errors=("status", lambda s: int((s != "ok").sum())),
+        )
+        .sort_values("wall_s", ascending=False)
+        .head(top)
+    )
+    print(f"run {run}: {len(df)} stage records, slowest {len(agg)} stages")
+    with pd.option_context("display.width", 200, "display.max_columns", 20, "display.float_format", "{:.3f}".format):
+        print(agg.to_string())
+    return agg
+
+
+def parse_args():
+    parser = ArgumentParser(description="Summarize per-stage telemetry (slowest stages per run).")
+    parser.add_argument("--run", default="latest", help="run_id (default: latest)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--path", default=None, help=f"JSON lines file (default: {TELEMETRY_PATH})")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    summarize(run=args.run, top=args.top, path=args.path)
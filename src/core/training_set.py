@@ -0,0 +1,124 @@
+"""
+Negative-sampled training set: all positives + stratified negatives.
+
+`build_labels` keeps every (station, date) row, so the labeled table grows
+with stations x days while positives stay a tiny fraction. Here weather_daily
+is streamed one (station, year, month) partition at a time (= one stratum),
+each partition is labeled against fire_events, and negatives are drawn
+without replacement at the same global rate in every stratum.
+
+Sampled negatives carry sample_weight = n_neg / n_kept of their stratum
+(positives 1.0), so weighted counts, metrics and fitted probabilities
+refer to the full population rather than the sample.
+
+    python -m src.core.training_set --neg-ratio 10 --seed 0
+"""
+from argparse import ArgumentParser
+from typing import Dict, Iterator, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.datasets import iter_partitions, partition_row_counts, read_dataset, write_dataset
+from src.core.telemetry import instrument, log
+
+
+LABEL = "fire_label"
+WEIGHT = "sample_weight"
+
+
+def positive_days() -> Dict[Tuple[int, int, int], Set[pd.Timestamp]]:
+    """(station_id, year, month) -> fire dates, from fire_events."""
+    fires = read_dataset("fire_events", columns=["station_id", "fire_date"]).dropna()
+    dates = pd.to_datetime(fires["fire_date"]).dt.normalize()
+    keys = pd.DataFrame({
+        "station_id": fires["station_id"].astype("int64"),
+        "year": dates.dt.year,
+        "month": dates.dt.month,
+        "date": dates,
+    }).drop_duplicates()
+    return {k: set(g["date"]) for k, g in keys.groupby(["station_id", "year", "month"])}
+
+
+def negative_rate(neg_ratio: float, positives: Dict) -> float:
+    """Global negative keep rate so that kept negatives ~= neg_ratio x positives."""
+    n_total = sum(partition_row_counts("weather_daily").values())
+    n_pos = sum(len(v) for v in positives.values())
+    n_neg = max(n_total - n_pos, 1)
+    return float(min(1.0, neg_ratio * n_pos / n_neg))
+
+
+def _n_keep(n_neg: int, rate: float, rng: np.random.Generator) -> int:
+    """Randomized rounding of rate * n_neg (unbiased, small strata still get a chance)."""
+    x = rate * n_neg
+    k = int(np.floor(x))
+    return min(n_neg, k + int(rng.random() < x - k))
+
+
+def iter_training_sample(
+        neg_ratio: float = 10.0,
+        seed: int = 0,
+        columns=None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield the sampled rows of each weather_daily partition (positives + negatives).
+
+    The RNG is seeded per stratum, so a partition's sample does not depend on
+    which other partitions exist or the order they are read in.
+    """
+    positives = positive_days()
+    rate = negative_rate(neg_ratio, positives)
+    log(f"[training_set] negative keep rate = {rate:.4f} (neg_ratio={neg_ratio})", rate=rate)
+
+    for key, part in iter_partitions("weather_daily", columns=columns):
+        stratum = (key["station_id"], key["year"], key["month"])
+        part["date"] = pd.to_datetime(part["date"]).dt.normalize()
+        is_pos = part["date"].isin(positives.get(stratum, ())).to_numpy()
+
+        neg_idx = np.flatnonzero(~is_pos)
+        rng = np.random.default_rng([seed, *stratum])
+        k = _n_keep(len(neg_idx), rate, rng)
+        keep_neg = np.sort(rng.choice(neg_idx, size=k, replace=False)) if k else neg_idx[:0]
+
+        pos = part[is_pos].assign(**{LABEL: 1, WEIGHT: 1.0})
+        neg = part.iloc[keep_neg].assign(**{LABEL: 0, WEIGHT: len(neg_idx) / k if k else 0.0})
+        sample = pd.concat([pos, neg]).sort_values("date")
+        sample[LABEL] = sample[LABEL].astype("int8")
+        yield sample
+
+
+@instrument()
+def build_training_sample(
+        neg_ratio: float = 10.0,
+        seed: int = 0,
+        save: bool = True,
+) -> pd.DataFrame:
+    """Collect the streamed sample and (optionally) write it as the training_sample dataset."""
+    n_rows = sum(partition_row_counts("weather_daily").values())
+    parts = list(iter_training_sample(neg_ratio=neg_ratio, seed=seed))
+    df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    if df.empty:
+        raise ValueError("Training sample is empty (no weather_daily partitions?)")
+
+    n_pos = int(df[LABEL].sum())
+    log(f"[training_set] weather rows     : {n_rows}")
+    log(f"[training_set] sampled rows     : {len(df)} (positives {n_pos}, negatives {len(df) - n_pos})",
+        positives=n_pos, negatives=len(df) - n_pos)
+    log(f"[training_set] weighted row sum : {df[WEIGHT].sum():.0f}")
+
+    if save:
+        out = write_dataset("training_sample", df)
+        log(f"saved training sample -> {out}", path=str(out))
+    return df
+
+
+def parse_args():
+    parser = ArgumentParser(description="Build a negative-sampled, weighted training set.")
+    parser.add_argument("--neg-ratio", type=float, default=10.0, help="negatives kept per positive")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    build_training_sample(neg_ratio=args.neg_ratio, seed=args.seed)
@@ -1,15 +1,40 @@
+import codecs
 import glob
 import os
-from typing import List, Optional
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from src.config.paths import PROC_DIR, WEATHER_RAW_DIR
+from src.config.paths import WEATHER_RAW_DIR
+from src.core.datasets import read_dataset, write_dataset
+from src.core.features import build_window_features
+from src.core.schema import apply_schema
+from src.core.telemetry import count_read, instrument, log
 
 
 SKY_MAP = {"DB01": 1, "DB02": 2, "DB03": 3, "DB04": 4}
 TARGET_STATIONS = [104, 105]
 TARGET_HOURS = [0, 12]
+MISSING_CODES = [-99, -999, -9999]
+# TM 고정폭 숫자 형식: 8=YYYYMMDD, 12=YYYYMMDDHHMM, 14=YYYYMMDDHHMMSS
+TM_WIDTHS = (8, 12, 14)
+
+# 표준 컬럼명 -> raw CSV에서 찾을 후보 컬럼명
+WEATHER_COLUMN_CANDIDATES = {
+    "station_id": ["STN", "stn", "지점", "지점번호"],
+    "obs_datetime": ["TM", "일시", "datetime", "date"],
+    "TA": ["TA", "평균기온", "평균기온(°C)"],
+    "POP": ["POP", "강수확률"],
+    "is_precip": ["is_precip", "IS_PRECIP"],
+    "WD_sin": ["WD_sin", "wd_sin"],
+    "WD_cos": ["WD_cos", "wd_cos"],
+    "SKY": ["SKY", "sky"],
+}
+NUMERIC_COLS = ["station_id", "TA", "POP", "is_precip", "WD_sin", "WD_cos"]
+MEAN_COLS = ["TA", "POP", "WD_sin", "WD_cos"]
+DAILY_COLS = ["station_id", "date", "TA", "TA_dtr", "POP", "is_precip", "WD_sin", "WD_cos", "SKY"]
 
 
 def pick_column(columns: List[str], candidates: List[str]) -> Optional[str]:
@@ -22,8 +47,21 @@ def pick_column(columns: List[str], candidates: List[str]) -> Optional[str]:
     return None
 
 
-def parse_obs_datetime(series: pd.Series) -> pd.Series:
-    """Parse TM-like datetime values robustly."""
+def resolve_weather_columns(columns: List[str]) -> Dict[str, str]:
+    """Map canonical weather column names to the raw column names present in `columns`."""
+    col_map = {}
+    for name, candidates in WEATHER_COLUMN_CANDIDATES.items():
+        col = pick_column(columns, candidates)
+        if col is not None:
+            col_map[name] = col
+
+    if "station_id" not in col_map or "obs_datetime" not in col_map:
+        raise ValueError("Required columns not found: station/date")
+    return col_map
+
+
+def _parse_obs_datetime_slow(series: pd.Series) -> pd.Series:
+    """Generic TM parser: %Y%m%d%H%M, then %Y%m%d%H%M%S, then free-form inference."""
     s = series.astype("string").str.strip()
 
     dt = pd.to_datetime(s, format="%Y%m%d%H%M", errors="coerce")
@@ -40,21 +78,141 @@ def parse_obs_datetime(series: pd.Series) -> pd.Series:
     return dt
 
 
-def _mode_or_na(series: pd.Series):
-    s = series.dropna().astype("string")
+def detect_tm_layout(series: pd.Series, sample_size: int = 1000) -> Optional[int]:
+    """
+    Detect fixed-width numeric TM layout from a sample.
+
+    Returns the digit width (one of TM_WIDTHS: 8=YYYYMMDD, 12=+HHMM, 14=+HHMMSS)
+    or None if values are not plain digit strings/integers.
+    """
+    sample = series.dropna().head(sample_size)
+    if sample.empty:
+        return None
+    if pd.api.types.is_float_dtype(sample):
+        if not (sample == sample.round()).all():
+            return None
+        sample = sample.astype("int64")
+
+    s = sample.astype("string").str.strip()
+    s = s[s.str.fullmatch(r"\d+")]
     if s.empty:
-        return pd.NA
-    mode = s.mode()
-    if mode.empty:
-        return s.iloc[0]
-    return mode.iloc[0]
+        return None
+    width = int(s.str.len().mode().iloc[0])
+    return width if width in TM_WIDTHS else None
+
+
+def _fixed_width_to_int(values: pd.Series, width: int) -> np.ndarray:
+    """Integer view of TM values with exactly `width` digits; -1 where not decodable."""
+    if pd.api.types.is_integer_dtype(values) or pd.api.types.is_float_dtype(values):
+        v = values.to_numpy(dtype="float64", na_value=np.nan)
+        ok = np.isfinite(v) & (v == np.floor(v))
+        ok &= (v >= 10 ** (width - 1)) & (v < 10 ** width)
+        return np.where(ok, v, -1).astype("int64")
+
+    s = values.astype("string").str.strip()
+    ok = (s.str.len() == width) & s.str.fullmatch(r"\d+")
+    ok = ok.fillna(False).to_numpy(dtype=bool)
+    out = np.full(len(s), -1, dtype="int64")
+    out[ok] = s[ok].astype("int64").to_numpy()
+    return out
+
+
+def _decode_fixed_width(v: np.ndarray, width: int) -> np.ndarray:
+    """Decode YYYYMMDD[HHMM[SS]] integers to datetime64[ns] with integer arithmetic (NaT if invalid)."""
+    v = v.copy()
+    second = minute = hour = np.zeros(len(v), dtype="int64")
+    if width == 14:
+        second, v = v % 100, v // 100
+    if width >= 12:
+        minute, v = v % 100, v // 100
+        hour, v = v % 100, v // 100
+    day, v = v % 100, v // 100
+    month, year = v % 100, v // 100
+
+    valid = (
+        (year >= 1678) & (year <= 2261)
+        & (month >= 1) & (month <= 12)
+        & (day >= 1) & (day <= 31)
+        & (hour < 24) & (minute < 60) & (second < 60)
+    )
+    months = np.where(valid, (year - 1970) * 12 + (month - 1), 0).astype("datetime64[M]")
+    days = months.astype("datetime64[D]") + np.where(valid, day - 1, 0).astype("timedelta64[D]")
+    # 2월 30일 같은 날짜는 다음 달로 넘어가므로 제외
+    valid &= days.astype("datetime64[M]") == months
+
+    seconds = hour * 3600 + minute * 60 + second
+    out = days.astype("datetime64[ns]") + seconds.astype("timedelta64[s]")
+    out[~valid] = np.datetime64("NaT")
+    return out
 
 
-def _dtr_0012(series: pd.Series):
-    s = pd.to_numeric(series, errors="coerce").dropna()
-    if len(s) < 2:
-        return pd.NA
-    return float(abs(s.max() - s.min()))
+_SLOW_PATH_CACHE: Dict[str, pd.Timestamp] = {}
+_SLOW_PATH_CACHE_MAX = 100_000
+
+
+def _wall_time(ts) -> np.datetime64:
+    """Parsed value -> naive datetime64[ns] keeping the local wall time (+09:00 offset 는 버리고 시각 유지)."""
+    if ts is None or pd.isna(ts):
+        return np.datetime64("NaT", "ns")
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.to_datetime64().astype("datetime64[ns]")
+
+
+def _parse_slow_cached(values: pd.Series) -> np.ndarray:
+    """
+    Slow-path parse of unique values, memoized across calls.
+
+    The cache holds what `_parse_obs_datetime_slow` returns (tz-aware values
+    included); tz-aware values become their local wall time, not UTC.
+    """
+    keys = values.astype("string").str.strip()
+    missing = [k for k in keys.dropna().unique() if k not in _SLOW_PATH_CACHE]
+    if missing:
+        if len(_SLOW_PATH_CACHE) + len(missing) > _SLOW_PATH_CACHE_MAX:
+            _SLOW_PATH_CACHE.clear()
+        parsed = _parse_obs_datetime_slow(pd.Series(missing, dtype="string"))
+        _SLOW_PATH_CACHE.update(zip(missing, parsed))
+    return np.array([_wall_time(_SLOW_PATH_CACHE.get(k)) if pd.notna(k) else np.datetime64("NaT", "ns")
+                     for k in keys], dtype="datetime64[ns]")
+
+
+def parse_obs_datetime(series: pd.Series, layout: Optional[int] = None) -> pd.Series:
+    """
+    Parse TM-like datetime values robustly.
+
+    Values are factorized so each distinct TM is parsed once. Fixed-width
+    numeric TM (layout = digit width, detected from a sample if not given)
+    is decoded with integer arithmetic; values that can't be decoded that way
+    go through the generic `_parse_obs_datetime_slow` path (memoized).
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques)
+
+    if layout is None:
+        layout = detect_tm_layout(uniques)
+
+    parsed = np.full(len(uniques), np.datetime64("NaT"), dtype="datetime64[ns]")
+    if layout is not None:
+        # 파일 형식 우선, 섞여 있는 다른 고정폭 값도 정수 연산으로 처리
+        for width in [layout] + [w for w in TM_WIDTHS if w != layout]:
+            todo = np.isnat(parsed)
+            if not todo.any():
+                break
+            ints = _fixed_width_to_int(uniques[todo], width)
+            decodable = ints >= 0
+            idx = np.flatnonzero(todo)[decodable]
+            parsed[idx] = _decode_fixed_width(ints[decodable], width)
+
+    need_slow = np.isnat(parsed) & uniques.notna().to_numpy()
+    if need_slow.any():
+        parsed[need_slow] = _parse_slow_cached(uniques[need_slow])
+
+    out = np.full(len(codes), np.datetime64("NaT"), dtype="datetime64[ns]")
+    has_value = codes >= 0
+    out[has_value] = parsed[codes[has_value]]
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def load_weather_raw() -> pd.DataFrame:
@@ -63,10 +221,11 @@ def load_weather_raw() -> pd.DataFrame:
     if not csv_paths:
         raise FileNotFoundError(f"No weather CSV found in: {WEATHER_RAW_DIR}")
 
-    print("weather files:", [os.path.basename(p) for p in csv_paths])
+    log(f"[weather_raw] {len(csv_paths)} weather files", files=[os.path.basename(p) for p in csv_paths])
 
     dfs = []
     for p in csv_paths:
+        count_read(p)
         try:
             df0 = pd.read_csv(p, low_memory=False)
         except UnicodeDecodeError:
@@ -75,146 +234,346 @@ def load_weather_raw() -> pd.DataFrame:
         dfs.append(df0)
 
     weather_raw = pd.concat(dfs, ignore_index=True)
-    print("weather_raw shape:", weather_raw.shape)
-    print("sample columns:", list(weather_raw.columns)[:20])
+    log(f"[weather_raw] {len(weather_raw):,} rows x {weather_raw.shape[1]} columns",
+        columns=list(weather_raw.columns))
     return weather_raw
 
 
-def preprocess_weather(weather_raw: pd.DataFrame) -> pd.DataFrame:
+def clean_hourly_weather(
+        weather_raw: pd.DataFrame,
+        col_map: Optional[Dict[str, str]] = None,
+        tm_layout: Optional[int] = None,
+) -> pd.DataFrame:
     """
-    Build daily weather features from hourly raw schema.
+    Select/rename raw weather columns and keep valid rows of TARGET_STATIONS.
 
-    Output columns:
-    - station_id, date
-    - TA: mean TA at 00/12
-    - TA_dtr: |TA(12)-TA(00)| proxy (implemented as max-min across 00/12)
-    - POP: mean precipitation probability at 00/12
-    - is_precip: max precipitation indicator at 00/12
-    - WD_sin, WD_cos: mean wind direction components at 00/12
-    - SKY: sky state code mapped to 1..4 (DB01..DB04), mode at 00/12
+    Adds obs_datetime, date, hour. Missing codes (-99/-999/-9999) become NaN.
+    tm_layout is passed to `parse_obs_datetime` (detected per call if None).
     """
-    stn_col = pick_column(weather_raw.columns, ["STN", "stn", "지점", "지점번호"])
-    tm_col = pick_column(weather_raw.columns, ["TM", "일시", "datetime", "date"])
-    ta_col = pick_column(weather_raw.columns, ["TA", "평균기온", "평균기온(°C)"])
-    pop_col = pick_column(weather_raw.columns, ["POP", "강수확률"])
-    precip_col = pick_column(weather_raw.columns, ["is_precip", "IS_PRECIP"])
-    wd_sin_col = pick_column(weather_raw.columns, ["WD_sin", "wd_sin"])
-    wd_cos_col = pick_column(weather_raw.columns, ["WD_cos", "wd_cos"])
-    sky_col = pick_column(weather_raw.columns, ["SKY", "sky"])
-
-    if stn_col is None or tm_col is None:
-        raise ValueError("Required columns not found: station/date")
+    if col_map is None:
+        col_map = resolve_weather_columns(weather_raw.columns)
 
-    keep_cols = [
-        c
-        for c in [stn_col, tm_col, ta_col, pop_col, precip_col, wd_sin_col, wd_cos_col, sky_col]
-        if c is not None
-    ]
-    weather = weather_raw[keep_cols].copy()
+    weather = weather_raw[list(col_map.values())].copy()
+    weather = weather.rename(columns={raw: name for name, raw in col_map.items()})
 
-    rename_map = {
-        stn_col: "station_id",
-        tm_col: "obs_datetime",
-    }
-    if ta_col:
-        rename_map[ta_col] = "TA"
-    if pop_col:
-        rename_map[pop_col] = "POP"
-    if precip_col:
-        rename_map[precip_col] = "is_precip"
-    if wd_sin_col:
-        rename_map[wd_sin_col] = "WD_sin"
-    if wd_cos_col:
-        rename_map[wd_cos_col] = "WD_cos"
-    if sky_col:
-        rename_map[sky_col] = "SKY"
-
-    weather = weather.rename(columns=rename_map)
-
-    for col in ["station_id", "TA", "POP", "is_precip", "WD_sin", "WD_cos"]:
+    for col in NUMERIC_COLS:
         if col in weather.columns:
             weather[col] = pd.to_numeric(weather[col], errors="coerce")
-            weather[col] = weather[col].replace([-99, -999, -9999], pd.NA)
+            weather[col] = weather[col].mask(weather[col].isin(MISSING_CODES))
 
     if "SKY" in weather.columns:
         weather["SKY"] = weather["SKY"].astype("string").str.strip().str.upper()
 
-    weather["obs_datetime"] = parse_obs_datetime(weather["obs_datetime"])
+    weather = weather[weather["station_id"].isin(TARGET_STATIONS)]
+
+    weather["obs_datetime"] = parse_obs_datetime(weather["obs_datetime"], layout=tm_layout)
     weather["date"] = weather["obs_datetime"].dt.normalize()
     weather["hour"] = weather["obs_datetime"].dt.hour
 
-    weather = weather[weather["station_id"].isin(TARGET_STATIONS)]
-    weather = weather[weather["date"].notna()]
+    return weather[weather["date"].notna()]
 
-    w_0012 = weather[weather["hour"].isin(TARGET_HOURS)].copy()
-    if w_0012.empty:
-        w_0012 = weather.copy()
 
-    keys = ["station_id", "date"]
-    weather_daily = w_0012[keys].drop_duplicates().sort_values(keys).reset_index(drop=True)
+def preprocess_weather(weather_raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build daily weather features from hourly raw schema.
 
-    if "TA" in w_0012.columns:
-        ta_daily = w_0012.groupby(keys, as_index=False)["TA"].mean()
-        ta_dtr = w_0012.groupby(keys, as_index=False)["TA"].agg(_dtr_0012).rename(columns={"TA": "TA_dtr"})
-        weather_daily = weather_daily.merge(ta_daily, on=keys, how="left")
-        weather_daily = weather_daily.merge(ta_dtr, on=keys, how="left")
+    Output columns:
+    - station_id, date
+    - TA: mean TA at 00/12
+    - TA_dtr: |TA(12)-TA(00)| proxy (implemented as max-min across 00/12, NaN if < 2 values)
+    - POP: mean precipitation probability at 00/12
+    - is_precip: max precipitation indicator at 00/12
+    - WD_sin, WD_cos: mean wind direction components at 00/12
+    - SKY: sky state code mapped to 1..4 (DB01..DB04), mode at 00/12
+    """
+    weather = clean_hourly_weather(weather_raw)
 
-    if "POP" in w_0012.columns:
-        pop_daily = w_0012.groupby(keys, as_index=False)["POP"].mean()
-        weather_daily = weather_daily.merge(pop_daily, on=keys, how="left")
+    w_0012 = weather[weather["hour"].isin(TARGET_HOURS)]
+    if w_0012.empty:
+        w_0012 = weather
 
-    if "is_precip" in w_0012.columns:
-        precip_daily = w_0012.groupby(keys, as_index=False)["is_precip"].max()
-        weather_daily = weather_daily.merge(precip_daily, on=keys, how="left")
+    # 모든 일별 통계를 groupby 한 번으로 계산 (그룹별 Python 콜백 없음)
+    stats, sky_counts = daily_partials(w_0012)
+    return finalize_partials(stats, sky_counts)
 
-    if "WD_sin" in w_0012.columns:
-        wd_sin_daily = w_0012.groupby(keys, as_index=False)["WD_sin"].mean()
-        weather_daily = weather_daily.merge(wd_sin_daily, on=keys, how="left")
 
-    if "WD_cos" in w_0012.columns:
-        wd_cos_daily = w_0012.groupby(keys, as_index=False)["WD_cos"].mean()
-        weather_daily = weather_daily.merge(wd_cos_daily, on=keys, how="left")
+def daily_partials(weather: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """
+    Reduce cleaned hourly rows to mergeable per-(station_id, date) partial stats.
 
-    if "SKY" in w_0012.columns:
-        sky_daily = w_0012.groupby(keys, as_index=False)["SKY"].agg(_mode_or_na)
+    Returns (stats, sky_counts). stats holds sum/count per mean column,
+    TA min/max and is_precip max; sky_counts holds counts per (station_id, date, SKY).
+    Partials of disjoint row sets can be combined with `combine_partials`.
+    """
+    keys = ["station_id", "date"]
+    agg = {"n_obs": ("hour", "size")}
+    for col in MEAN_COLS:
+        if col in weather.columns:
+            agg[f"{col}_sum"] = (col, "sum")
+            agg[f"{col}_n"] = (col, "count")
+    if "TA" in weather.columns:
+        agg["TA_min"] = ("TA", "min")
+        agg["TA_max"] = ("TA", "max")
+    if "is_precip" in weather.columns:
+        agg["is_precip_max"] = ("is_precip", "max")
+
+    stats = weather.groupby(keys, as_index=False).agg(**agg)
+
+    sky_counts = None
+    if "SKY" in weather.columns:
+        sky_counts = (
+            weather.dropna(subset=["SKY"])
+            .groupby(keys + ["SKY"], as_index=False)
+            .size()
+            .rename(columns={"size": "n"})
+        )
+    return stats, sky_counts
+
+
+def combine_partials(
+        stats_list: List[pd.DataFrame],
+        sky_list: List[Optional[pd.DataFrame]],
+) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """Merge partial stats produced by `daily_partials` on different row sets."""
+    keys = ["station_id", "date"]
+    stats = pd.concat(stats_list, ignore_index=True)
+    how = {}
+    for col in stats.columns:
+        if col in keys:
+            continue
+        if col.endswith("_min"):
+            how[col] = "min"
+        elif col.endswith("_max"):
+            how[col] = "max"
+        else:
+            how[col] = "sum"
+    stats = stats.groupby(keys, as_index=False).agg(how)
+
+    sky_list = [s for s in sky_list if s is not None]
+    sky_counts = None
+    if sky_list:
+        sky_counts = (
+            pd.concat(sky_list, ignore_index=True)
+            .groupby(keys + ["SKY"], as_index=False)["n"]
+            .sum()
+        )
+    return stats, sky_counts
+
+
+def finalize_partials(
+        stats: pd.DataFrame,
+        sky_counts: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Turn partial stats into the daily schema returned by `preprocess_weather`."""
+    keys = ["station_id", "date"]
+    daily = stats[keys].copy()
+
+    for col in MEAN_COLS:
+        if f"{col}_sum" not in stats.columns:
+            continue
+        n = stats[f"{col}_n"]
+        daily[col] = (stats[f"{col}_sum"] / n).where(n > 0)
+        if col == "TA":
+            dtr = (stats["TA_max"] - stats["TA_min"]).abs()
+            daily["TA_dtr"] = dtr.where(n >= 2)
+
+    if "is_precip_max" in stats.columns:
+        daily["is_precip"] = stats["is_precip_max"].fillna(0)
+
+    if sky_counts is not None:
+        # 최빈값, 동률이면 문자열 오름차순 첫 값 (Series.mode 와 동일)
+        sky_daily = (
+            sky_counts.sort_values(keys + ["n", "SKY"], ascending=[True, True, False, True])
+            .drop_duplicates(subset=keys)
+            .drop(columns=["n"])
+        )
         sky_num = sky_daily["SKY"].map(SKY_MAP)
         sky_num_fallback = pd.to_numeric(sky_daily["SKY"], errors="coerce")
-        sky_daily["SKY"] = sky_num.fillna(sky_num_fallback).astype("Int64")
-        weather_daily = weather_daily.merge(sky_daily, on=keys, how="left")
+        sky_daily["SKY"] = sky_num.fillna(sky_num_fallback)
+        daily = daily.merge(sky_daily, on=keys, how="left")
+
+    cols = [c for c in DAILY_COLS if c in daily.columns]
+    return apply_schema(daily[cols].sort_values(keys).reset_index(drop=True))
+
+
+def detect_csv_encoding(path: str, sample_bytes: int = 1 << 20) -> str:
+    """Guess CSV encoding (utf-8 / cp949) from the first `sample_bytes` of the file."""
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # final=False: 샘플 끝에서 잘린 멀티바이트 문자는 무시
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def stream_file_partials(path: str, chunksize: int, encoding: Optional[str] = None) -> dict:
+    """Read one raw CSV chunk by chunk and reduce it to daily partials."""
+    if encoding is None:
+        encoding = detect_csv_encoding(path)
+
+    count_read(path)
+    header = pd.read_csv(path, nrows=0, encoding=encoding)
+    col_map = resolve_weather_columns(header.columns)
+    str_cols = [col_map[c] for c in ["obs_datetime", "SKY"] if c in col_map]
+
+    target_parts, all_parts = [], []
+    n_raw = n_target = n_all = 0
+    tm_layout = None
+    try:
+        reader = pd.read_csv(
+            path,
+            encoding=encoding,
+            usecols=list(col_map.values()),
+            dtype={c: "string" for c in str_cols},
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            if n_raw == 0:
+                # TM 형식은 파일당 한 번만 판별
+                tm_layout = detect_tm_layout(chunk[col_map["obs_datetime"]])
+            n_raw += len(chunk)
+            weather = clean_hourly_weather(chunk, col_map, tm_layout=tm_layout)
+            target = weather[weather["hour"].isin(TARGET_HOURS)]
+            if not target.empty:
+                n_target += len(target)
+                target_parts.append(daily_partials(target))
+                all_parts = []
+            elif not target_parts and not weather.empty:
+                # TARGET_HOURS 가 하나도 없을 때만 전체 시간 fallback 유지
+                n_all += len(weather)
+                all_parts.append(daily_partials(weather))
+
+            # chunk 별 partial 이 쌓이지 않도록 주기적으로 합치기
+            for parts in (target_parts, all_parts):
+                if len(parts) >= 32:
+                    parts[:] = [combine_partials(*zip(*parts))]
+    except UnicodeDecodeError:
+        if encoding == "cp949":
+            raise
+        return stream_file_partials(path, chunksize, encoding="cp949")
+
+    return {
+        "file": os.path.basename(path),
+        "encoding": encoding,
+        "rows_raw": n_raw,
+        "rows_kept": n_target if target_parts else n_all,
+        "has_target_hours": bool(target_parts),
+        "partials": target_parts or all_parts,
+    }
 
-    if "is_precip" in weather_daily.columns:
-        weather_daily["is_precip"] = weather_daily["is_precip"].fillna(0).astype("Int64")
 
+def stream_weather_daily(
+        chunksize: int = 200_000,
+        report_memory: bool = True,
+) -> pd.DataFrame:
+    """
+    Bounded-memory version of `preprocess_weather(load_weather_raw())`.
+
+    Each CSV is read in chunks with only the columns resolved by `pick_column`;
+    every chunk is filtered to TARGET_STATIONS/TARGET_HOURS and reduced to
+    daily partial stats, so the full raw table is never materialized.
+    Peak traced memory is reported per file when `report_memory=True`.
+    """
+    csv_paths = sorted(glob.glob(os.path.join(str(WEATHER_RAW_DIR), "*.csv")))
+    if not csv_paths:
+        raise FileNotFoundError(f"No weather CSV found in: {WEATHER_RAW_DIR}")
+
+    started_tracing = report_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    file_results = []
+    try:
+        for p in csv_paths:
+            if report_memory:
+                tracemalloc.reset_peak()
+            res = stream_file_partials(p, chunksize=chunksize)
+            if report_memory:
+                res["peak_mem_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+
+            # 파일 단위로 partial 을 합쳐 메모리에 남는 조각 수를 제한
+            if res["partials"]:
+                res["partials"] = [combine_partials(*zip(*res["partials"]))]
+            file_results.append(res)
+
+            msg = f"[stream] {res['file']}: rows={res['rows_raw']} kept={res['rows_kept']} enc={res['encoding']}"
+            if report_memory:
+                msg += f" peak_mem={res['peak_mem_mb']:.1f}MB"
+            log(msg, file=res["file"], rows_raw=res["rows_raw"], rows_kept=res["rows_kept"])
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    # preprocess_weather 와 동일하게: 전체에서 00/12시가 하나도 없을 때만 전체 시간 사용
+    use_target = any(r["has_target_hours"] for r in file_results)
+    parts = [
+        part
+        for r in file_results
+        if r["has_target_hours"] == use_target
+        for part in r["partials"]
+    ]
+    if not parts:
+        return pd.DataFrame(columns=["station_id", "date"])
+
+    stats, sky_counts = combine_partials(*zip(*parts))
+    weather_daily = finalize_partials(stats, sky_counts)
+    log(f"[stream] weather_daily {len(weather_daily):,} rows x {weather_daily.shape[1]} columns")
     return weather_daily
 
 
 def build_past_n_days_features(df: pd.DataFrame, n_days: int = 3) -> pd.DataFrame:
-    """Build lagged weather features (past n days) by station_id/date."""
-    base_cols = ["station_id", "date"]
-    feature_cols = [c for c in df.columns if c not in base_cols]
-
-    out = df[base_cols].copy()
-    for k in range(1, n_days + 1):
-        shifted = df.copy()
-        shifted["date"] = shifted["date"] + pd.Timedelta(days=k)
-        rename_map = {c: f"{c}_minus{k}d" for c in feature_cols}
-        shifted = shifted[base_cols + feature_cols].rename(columns=rename_map)
-        out = out.merge(shifted, how="left", on=base_cols)
-    return out
+    """
+    Build lagged weather features (past n days) by station_id/date.
+
+    Thin wrapper over `src.core.features.build_window_features` (dense
+    station x date grid); see it for rolling windows / days-since features.
+    """
+    return build_window_features(df, lags=range(1, n_days + 1))
 
 
-def normalize_weather_daily() -> pd.DataFrame:
-    """Save normalized daily weather data to weather_daily.parquet."""
-    weather_raw = load_weather_raw()
-    weather_daily = preprocess_weather(weather_raw)
+@instrument()
+def normalize_weather_daily(streaming: bool = False, chunksize: int = 200_000) -> pd.DataFrame:
+    """
+    Save normalized daily weather data to the weather_daily dataset
+    (PROC_DIR/weather_daily, partitioned by station_id/year/month).
+
+    streaming=True uses `stream_weather_daily` (chunked, bounded memory)
+    instead of loading every raw CSV into one frame.
+    """
+    if streaming:
+        weather_daily = stream_weather_daily(chunksize=chunksize)
+    else:
+        weather_raw = load_weather_raw()
+        weather_daily = preprocess_weather(weather_raw)
 
-    weather_daily["station_id"] = pd.to_numeric(
-        weather_daily["station_id"], errors="coerce"
-    ).astype("Int64")
+    apply_schema(weather_daily)
     weather_daily["date"] = pd.to_datetime(weather_daily["date"]).dt.normalize()
 
-    out_path = PROC_DIR / "weather_daily.parquet"
-    weather_daily.to_parquet(out_path, index=False)
-    print("saved normalized weather_daily ->", out_path)
+    out_path = write_dataset("weather_daily", weather_daily)
+    log(f"saved normalized weather_daily -> {out_path}", path=str(out_path))
 
     return weather_daily
+
+
+def read_weather_daily(
+        columns: Optional[List[str]] = None,
+        start=None,
+        end=None,
+        station_ids: Optional[List[int]] = None,
+) -> pd.DataFrame:
+    """
+    Read daily weather features (only `columns`, dates in [start, end], `station_ids`).
+
+    Reads the partitioned weather_daily dataset, or weather_daily.parquet
+    written by older runs.
+    """
+    df = read_dataset("weather_daily", columns=columns, start=start, end=end, station_ids=station_ids)
+    if columns is None:
+        df = df[[c for c in DAILY_COLS if c in df.columns]]
+    if {"station_id", "date"}.issubset(df.columns):
+        df = df.sort_values(["station_id", "date"]).reset_index(drop=True)
+    return df
@@ -0,0 +1,470 @@
+"""
+Concurrent KMA ASOS observation fetcher (asyncio, stdlib only).
+
+    export KMA_API_KEY=...                      # API hub authKey (never stored in files)
+    python -m src.core.weather_fetch --start 2020-01-01 --end 2021-12-31 --stations 104 105 \
+        --concurrency 8 --rate 10
+
+    # offline, against the mock server
+    python -m src.benchmarks.mock_kma_server --port 8766 &
+    python -m src.core.weather_fetch --base-url http://127.0.0.1:8766 --start 2020-01-01 --end 2020-12-31
+
+The request range is split into (station, period) tasks: one month per
+request for hourly data (kma_sfctm3), one year for daily data (kma_sfcdd3).
+`concurrency` workers share
+
+- a keep-alive HTTP/1.1 connection pool (`HttpPool`, at most `concurrency`
+  sockets, reused across requests),
+- a token-bucket rate limit (`rate` requests/s, `burst`),
+- retries with exponential backoff + jitter on connection errors, timeouts,
+  429 (honoring Retry-After) and 5xx; other 4xx fail the task.
+
+Each response (typ01 text: `#` comment / header lines, comma-separated rows)
+is written as one CSV with a header row into the raw layout:
+
+    hourly -> WEATHER_RAW_DIR/asos_hourly_<stn>_<YYYYMM>.csv   (read by load_weather_raw /
+              weather_incremental like the hand-copied CSVs)
+    daily  -> WEATHER_RAW_DIR/daily/asos_daily_<stn>_<YYYY>.csv
+
+Files are written tmp -> rename, and every finished task is recorded in a
+checkpoint (WEATHER_FETCH_CHECKPOINT), so an interrupted run resumes with
+the remaining tasks only.
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import ssl
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import pandas as pd
+
+from src.config.paths import WEATHER_FETCH_CHECKPOINT, WEATHER_RAW_DIR, ensure_dirs
+from src.core.telemetry import count_written, instrument, log
+
+
+DEFAULT_BASE_URL = "https://apihub.kma.go.kr"
+ENDPOINTS = {
+    "hourly": "/api/typ01/url/kma_sfctm3.php",
+    "daily": "/api/typ01/url/kma_sfcdd3.php",
+}
+CHECKPOINT_VERSION = 1
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_BACKOFF_S = 30.0
+
+
+class FetchError(Exception):
+    """A request that failed for good (non-retryable status or retries exhausted)."""
+
+
+# --- HTTP ------------------------------------------------------------------
+
+class HttpPool:
+    """
+    Minimal HTTP/1.1 client over asyncio streams with a keep-alive connection pool.
+
+    At most `size` connections are open; idle ones are reused by the next
+    request. keepalive=False opens a new connection per request (baseline).
+    """
+
+    def __init__(self, base_url: str, size: int = 8, timeout: float = 30.0, keepalive: bool = True):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if url.scheme == "https" else None
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.keepalive = keepalive
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.opened = 0
+        self.requests = 0
+
+    async def _connect(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def get(self, path: str, params: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """GET prefix + path ? params -> (status, lower-cased headers, body)."""
+        target = f"{self.prefix}{path}?{urlencode(params)}"
+        async with self._slots:
+            reader, writer = await self._connect()
+            try:
+                status, headers, body = await asyncio.wait_for(self._roundtrip(reader, writer, target), self.timeout)
+            except BaseException:
+                writer.close()
+                raise
+            self.requests += 1
+            if self.keepalive and headers.get("connection", "").lower() != "close":
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, headers, body
+
+    async def _roundtrip(self, reader, writer, target: str):
+        writer.write((
+            f"GET {target} HTTP/1.1\r\nHost: {self.host}\r\nAccept-Encoding: identity\r\n"
+            f"Connection: {'keep-alive' if self.keepalive else 'close'}\r\n\r\n"
+        ).encode("ascii"))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        status = int(status_line.split()[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = line.decode("latin-1").partition(":")
+            headers[k.strip().lower()] = v.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            parts = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(parts)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            headers["connection"] = "close"
+        return status, headers, body
+
+    async def close(self) -> None:
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class RateLimiter:
+    """Token bucket: `rate` acquisitions per second on average, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# --- tasks / parsing -------------------------------------------------------
+
+@dataclass(frozen=True)
+class FetchTask:
+    kind: str   # "hourly" | "daily"
+    stn: int
+    tm1: str
+    tm2: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}:{self.stn}:{self.tm1}:{self.tm2}"
+
+    @property
+    def out_path(self) -> Path:
+        if self.kind == "hourly":
+            return WEATHER_RAW_DIR / f"asos_hourly_{self.stn}_{self.tm1[:6]}.csv"
+        return WEATHER_RAW_DIR / "daily" / f"asos_daily_{self.stn}_{self.tm1[:4]}.csv"
+
+
+def plan_tasks(stations: Sequence[int], start, end, kind: str = "hourly") -> List[FetchTask]:
+    """(station, month) tasks for hourly data, (station, year) for daily, clipped to [start, end]."""
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    if end < start:
+        raise ValueError(f"end {end.date()} is before start {start.date()}")
+    freq = "MS" if kind == "hourly" else "YS"
+    period_starts = pd.date_range(start.to_period("M" if kind == "hourly" else "Y").start_time, end, freq=freq)
+    tasks = []
+    for p0 in period_starts:
+        p1 = (p0 + (pd.offsets.MonthEnd(0) if kind == "hourly" else pd.offsets.YearEnd(0)))
+        lo, hi = max(p0, start), min(p1, end)
+        tm1, tm2 = (lo.strftime("%Y%m%d0000"), hi.strftime("%Y%m%d2300")) if kind == "hourly" \
+            else (lo.strftime("%Y%m%d"), hi.strftime("%Y%m%d"))
+        tasks.extend(FetchTask(kind, int(stn), tm1, tm2) for stn in stations)
+    return tasks
+
+
+_SPLIT = re.compile(r"[,\s]+")
+# typ01 시각 컬럼명 -> raw CSV / load_weather_raw 의 TM
+TIME_COLUMNS = {"YYMMDDHHMI": "TM", "YYMMDD": "TM"}
+
+
+def _comment_header(comments: List[str]) -> str:
+    """Column-name line among the `#` lines before the data (see `to_csv_text`)."""
+    with_stn = [c for c in comments if "STN" in _SPLIT.split(c.upper())]
+    if with_stn:
+        return with_stn[0]
+    # 구분선 (----) / START 표시 / 빈 줄로 나뉜 마지막 블록의 첫 줄
+    block: List[str] = []
+    for c in comments:
+        if not c or set(c) <= set("-=") or c.upper().startswith(("START", "7777")):
+            block = []
+        else:
+            block.append(c)
+    if not block:
+        raise FetchError("response has no column header")
+    return block[0]
+
+
+def to_csv_text(body: str) -> Tuple[str, int]:
+    """
+    typ01 response -> (CSV text with one header row, data row count).
+
+    The header is the first non-comment line if it is not numeric, else a
+    `#` line before the data: KMA writes a column-name line (`YYMMDDHHMI STN
+    WD ...`) followed by a units line (`KST ID 16 m/s ...`), so the line with
+    an `STN` column is used, falling back to the first line of the last
+    comment block. The time column is renamed to TM (TIME_COLUMNS).
+    Whitespace-separated rows are converted to commas.
+    """
+    comments, data = [], []
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            if not data:
+                comments.append(line.lstrip("#").strip())
+            continue
+        data.append(line if "," in line else ",".join(_SPLIT.split(line)))
+    if not data:
+        return "", 0
+    if not data[0].split(",")[0].lstrip("-").replace(".", "").isdigit():
+        header, data = data[0], data[1:]
+    else:
+        header = _comment_header(comments)
+    header = ",".join(TIME_COLUMNS.get(c, c) for c in _SPLIT.split(header.strip(", ")))
+    return "\n".join([header] + data) + "\n", len(data)
+
+
+# --- checkpoint ------------------------------------------------------------
+
+def load_checkpoint(path=None) -> dict:
+    path = Path(path or WEATHER_FETCH_CHECKPOINT)
+    if not path.exists():
+        return {"version": CHECKPOINT_VERSION, "done": {}, "failed": {}}
+    ckpt = json.loads(path.read_text(encoding="utf-8"))
+    if ckpt.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported fetch checkpoint version: {ckpt.get('version')}")
+    return ckpt
+
+
+def save_checkpoint(ckpt: dict, path=None) -> None:
+    path = Path(path or WEATHER_FETCH_CHECKPOINT)
+    ensure_dirs(path.parent)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(ckpt, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _write_csv(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # *.csv glob 에 잡히지 않는 이름으로 쓰고 rename
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    count_written(path)
+
+
+# --- fetch -----------------------------------------------------------------
+
+async def _fetch_one(pool: HttpPool, limiter: RateLimiter, task: FetchTask, auth_key: str,
+                     retries: int, stats: dict) -> dict:
+    params = {"stn": str(task.stn), "tm1": task.tm1, "tm2": task.tm2, "help": "0", "disp": "1"}
+    if auth_key:
+        params["authKey"] = auth_key
+    for attempt in range(retries + 1):
+        await limiter.acquire()
+        delay = None
+        try:
+            status, headers, body = await pool.get(ENDPOINTS[task.kind], params)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+            if attempt == retries:
+                raise FetchError(f"{task.key}: {type(e).__name__}: {e}") from e
+        else:
+            if status == 200:
+                text, rows = to_csv_text(body.decode("utf-8", errors="replace"))
+                if rows:
+                    await asyncio.to_thread(_write_csv, task.out_path, text)
+                stats["bytes"] += len(body)
+                return {"file": task.out_path.name if rows else None, "rows": rows, "attempts": attempt + 1,
+                        "fetched_at": datetime.now().isoformat(timespec="seconds")}
+            if status not in RETRY_STATUS or attempt == retries:
+                raise FetchError(f"{task.key}: HTTP {status}: {body[:200].decode('utf-8', errors='replace')}")
+            if headers.get("retry-after", "").isdigit():
+                delay = float(headers["retry-after"])
+        stats["retries"] += 1
+        if delay is None:
+            delay = min(MAX_BACKOFF_S, 0.5 * 2 ** attempt) * (0.5 + random.random())
+        await asyncio.sleep(delay)
+    raise FetchError(f"{task.key}: retries exhausted")
+
+
+async def fetch_tasks(
+        tasks: Sequence[FetchTask],
+        base_url: str = DEFAULT_BASE_URL,
+        auth_key: str = "",
+        concurrency: int = 8,
+        rate: float = 10.0,
+        burst: Optional[int] = None,
+        retries: int = 4,
+        timeout: float = 30.0,
+        keepalive: bool = True,
+        checkpoint_path=None,
+        checkpoint_every: int = 20,
+) -> dict:
+    """Run `tasks` (skipping those already in the checkpoint) and return a summary."""
+    ckpt = load_checkpoint(checkpoint_path)
+    todo = [t for t in tasks
+            if t.key not in ckpt["done"]
+            or (ckpt["done"][t.key]["file"] and not t.out_path.exists())]
+    skipped = len(tasks) - len(todo)
+
+    pool = HttpPool(base_url, size=concurrency, timeout=timeout, keepalive=keepalive)
+    limiter = RateLimiter(rate, burst)
+    queue: "asyncio.Queue[FetchTask]" = asyncio.Queue()
+    for t in todo:
+        queue.put_nowait(t)
+    stats = {"bytes": 0, "retries": 0, "rows": 0, "done": 0, "failed": 0}
+    since_save = 0
+
+    async def worker():
+        nonlocal since_save
+        while True:
+            try:
+                task = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                res = await _fetch_one(pool, limiter, task, auth_key, retries, stats)
+            except FetchError as e:
+                ckpt["failed"][task.key] = {"error": str(e), "at": datetime.now().isoformat(timespec="seconds")}
+                stats["failed"] += 1
+                log(f"[fetch] FAILED {e}", task=task.key)
+            else:
+                ckpt["done"][task.key] = res
+                ckpt["failed"].pop(task.key, None)
+                stats["done"] += 1
+                stats["rows"] += res["rows"]
+            since_save += 1
+            if since_save >= checkpoint_every:
+                since_save = 0
+                save_checkpoint(ckpt, checkpoint_path)
+
+    t0 = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(todo))))))
+    finally:
+        # 중단 (Ctrl-C / 예외) 되어도 끝난 task 는 기록 -> 다음 실행에서 이어서
+        save_checkpoint(ckpt, checkpoint_path)
+        await pool.close()
+    elapsed = time.perf_counter() - t0
+
+    summary = {
+        "tasks": len(tasks),
+        "skipped": skipped,
+        "done": stats["done"],
+        "failed": stats["failed"],
+        "rows": stats["rows"],
+        "retries": stats["retries"],
+        "connections": pool.opened,
+        "requests": pool.requests,
+        "seconds": round(elapsed, 3),
+        "req_per_s": round(pool.requests / elapsed, 1) if elapsed > 0 else None,
+        "mb": round(stats["bytes"] / 2**20, 2),
+    }
+    log(f"[fetch] summary: {summary}", **summary)
+    return summary
+
+
+@instrument()
+def fetch_observations(
+        start,
+        end,
+        stations: Optional[Sequence[int]] = None,
+        kind: str = "hourly",
+        base_url: Optional[str] = None,
+        concurrency: int = 8,
+        rate: float = 10.0,
+        retries: int = 4,
+        keepalive: bool = True,
+        checkpoint_path=None,
+) -> dict:
+    """
+    Fetch `kind` observations of `stations` (default: weather_daily.TARGET_STATIONS)
+    for [start, end] into WEATHER_RAW_DIR. base_url / auth key default to the
+    KMA_API_URL / KMA_API_KEY environment variables.
+    """
+    if kind not in ENDPOINTS:
+        raise ValueError(f"Unknown kind {kind!r} (expected one of {list(ENDPOINTS)})")
+    if stations is None:
+        from src.core.weather_daily import TARGET_STATIONS
+
+        stations = TARGET_STATIONS
+    base_url = base_url or os.environ.get("KMA_API_URL", DEFAULT_BASE_URL)
+    auth_key = os.environ.get("KMA_API_KEY", "")
+    if not auth_key and base_url == DEFAULT_BASE_URL:
+        raise ValueError("KMA_API_KEY is not set (required for the KMA API hub)")
+
+    ensure_dirs(WEATHER_RAW_DIR)
+    tasks = plan_tasks(stations, start, end, kind)
+    log(f"[fetch] {len(tasks)} {kind} requests ({len(stations)} stations) from {base_url}, "
+        f"concurrency={concurrency} rate={rate:g}/s")
+    return asyncio.run(fetch_tasks(
+        tasks, base_url, auth_key, concurrency=concurrency, rate=rate, retries=retries,
+        keepalive=keepalive, checkpoint_path=checkpoint_path,
+    ))
+
+
+def parse_args():
+    parser = ArgumentParser(description="Fetch KMA ASOS observations concurrently into data/raw/weather.")
+    parser.add_argument("--start", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--stations", type=int, nargs="*", default=None, help="default: TARGET_STATIONS")
+    parser.add_argument("--kind", choices=list(ENDPOINTS), default="hourly")
+    parser.add_argument("--base-url", default=None, help="default: $KMA_API_URL or the KMA API hub")
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel requests / pooled connections")
+    parser.add_argument("--rate", type=float, default=10.0, help="max requests per second (0 = unlimited)")
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--no-keepalive", action="store_true", help="new connection per request")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    fetch_observations(
+        args.start, args.end, args.stations, args.kind, args.base_url,
+        concurrency=args.concurrency, rate=args.rate, retries=args.retries, keepalive=not args.no_keepalive,
+    )
@@ -0,0 +1,239 @@
+"""
+Incremental weather ingest.
+
+A manifest (WEATHER_MANIFEST_PATH) records every ingested raw CSV with
+size / mtime / sha256. Only new or changed files are parsed; each file is
+reduced to daily partial stats (kept in WEATHER_PARTIALS_DIR) and only the
+(station_id, year, month) partitions of WEATHER_DAILY_DIR they touch are
+rebuilt from the partials of the files overlapping them.
+"""
+import glob
+import hashlib
+import json
+import os
+from argparse import ArgumentParser
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from src.config.paths import (
+    WEATHER_DAILY_DIR,
+    WEATHER_MANIFEST_PATH,
+    WEATHER_PARTIALS_DIR,
+    WEATHER_RAW_DIR,
+)
+from src.core.datasets import DATASETS, remove_partitions, write_partitions
+from src.core.telemetry import instrument, log
+from src.core.weather_daily import (
+    stream_file_partials,
+    combine_partials,
+    finalize_partials,
+)
+
+
+MANIFEST_VERSION = 1
+PARTITION_COLS = list(DATASETS["weather_daily"].partition_cols)
+
+PartitionKey = Tuple[int, int, int]
+
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_manifest(path=WEATHER_MANIFEST_PATH) -> dict:
+    if not os.path.exists(path):
+        return {"version": MANIFEST_VERSION, "files": {}}
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported weather manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def save_manifest(manifest: dict, path=WEATHER_MANIFEST_PATH) -> None:
+    os.makedirs(os.path.dirname(str(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _partition_keys(stats: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({
+        "station_id": stats["station_id"].astype("int64"),
+        "year": stats["date"].dt.year.astype("int32"),
+        "month": stats["date"].dt.month.astype("int32"),
+    })
+
+
+def _partials_paths(name: str) -> Tuple[str, str]:
+    return (
+        str(WEATHER_PARTIALS_DIR / f"{name}.stats.parquet"),
+        str(WEATHER_PARTIALS_DIR / f"{name}.sky.parquet"),
+    )
+
+
+def _save_file_partials(name: str, stats: pd.DataFrame, sky_counts: Optional[pd.DataFrame]) -> None:
+    WEATHER_PARTIALS_DIR.mkdir(parents=True, exist_ok=True)
+    stats_path, sky_path = _partials_paths(name)
+    stats.to_parquet(stats_path, index=False)
+    if sky_counts is not None:
+        sky_counts.to_parquet(sky_path, index=False)
+    elif os.path.exists(sky_path):
+        os.remove(sky_path)
+
+
+def _delete_file_partials(name: str) -> None:
+    for p in _partials_paths(name):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def _load_file_partials(name: str, keys: Set[PartitionKey]):
+    """Load one file's partials restricted to the given partitions."""
+    stats_path, sky_path = _partials_paths(name)
+
+    def _restrict(df: pd.DataFrame) -> pd.DataFrame:
+        pk = _partition_keys(df)
+        mask = pd.Series(list(zip(pk["station_id"], pk["year"], pk["month"])), index=df.index).isin(keys)
+        return df[mask]
+
+    stats = _restrict(pd.read_parquet(stats_path))
+    sky_counts = _restrict(pd.read_parquet(sky_path)) if os.path.exists(sky_path) else None
+    return stats, sky_counts
+
+
+def _scan_raw_files(manifest: dict) -> Tuple[List[Tuple[str, str]], Dict[str, dict]]:
+    """Return ([(changed path, sha256)], refreshed manifest entries for unchanged files)."""
+    known = manifest["files"]
+    changed, unchanged = [], {}
+    for p in sorted(glob.glob(os.path.join(str(WEATHER_RAW_DIR), "*.csv"))):
+        name = os.path.basename(p)
+        st = os.stat(p)
+        entry = known.get(name)
+        if entry and entry["size"] == st.st_size and entry["mtime"] == st.st_mtime:
+            unchanged[name] = entry
+            continue
+
+        digest = file_sha256(p)
+        if entry and entry["sha256"] == digest:
+            # touch 만 된 파일: 다시 파싱하지 않고 mtime 만 갱신
+            unchanged[name] = dict(entry, size=st.st_size, mtime=st.st_mtime)
+            continue
+
+        changed.append((p, digest))
+    return changed, unchanged
+
+
+@instrument()
+def update_weather_daily(chunksize: int = 200_000) -> dict:
+    """
+    Ingest only new/changed raw weather CSVs and rebuild the affected partitions.
+
+    Returns a summary dict (changed/removed files, rebuilt partitions).
+    """
+    manifest = load_manifest()
+    old_files = manifest["files"]
+
+    changed_paths, new_files = _scan_raw_files(manifest)
+    changed_names = {os.path.basename(p) for p, _ in changed_paths}
+    removed_names = set(old_files) - set(new_files) - changed_names
+
+    affected: Set[PartitionKey] = set()
+    for name in changed_names | removed_names:
+        if name in old_files:
+            affected.update(tuple(k) for k in old_files[name]["partitions"])
+
+    for name in removed_names:
+        _delete_file_partials(name)
+        log(f"[incremental] removed: {name}", file=name)
+
+    for p, digest in changed_paths:
+        name = os.path.basename(p)
+        st = os.stat(p)
+        res = stream_file_partials(p, chunksize=chunksize)
+        keys: List[PartitionKey] = []
+        if res["partials"]:
+            stats, sky_counts = combine_partials(*zip(*res["partials"]))
+            _save_file_partials(name, stats, sky_counts)
+            keys = sorted(set(map(tuple, _partition_keys(stats).itertuples(index=False))))
+        else:
+            _delete_file_partials(name)
+        keys = [tuple(int(v) for v in k) for k in keys]
+        affected.update(keys)
+
+        new_files[name] = {
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+            "sha256": digest,
+            "has_target_hours": res["has_target_hours"],
+            "partitions": [list(k) for k in keys],
+            "ingested_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        log(f"[incremental] ingested: {name} rows={res['rows_raw']} partitions={len(keys)}",
+            file=name, rows_raw=res["rows_raw"], partitions=len(keys))
+
+    # 00/12시 fallback 여부가 전체 기준으로 바뀌면 모든 partition 을 다시 만든다
+    def _use_target(files: dict) -> bool:
+        return any(e["has_target_hours"] for e in files.values())
+
+    use_target = _use_target(new_files)
+    if old_files and use_target != _use_target(old_files):
+        for entry in list(old_files.values()) + list(new_files.values()):
+            affected.update(tuple(k) for k in entry["partitions"])
+
+    _rebuild_partitions(affected, new_files, use_target)
+
+    manifest["files"] = new_files
+    save_manifest(manifest)
+
+    summary = {
+        "changed_files": sorted(changed_names),
+        "removed_files": sorted(removed_names),
+        "rebuilt_partitions": len(affected),
+    }
+    log(f"[incremental] summary: {summary}", **summary)
+    return summary
+
+
+def _rebuild_partitions(affected: Set[PartitionKey], files: dict, use_target: bool) -> None:
+    if not affected:
+        return
+
+    stats_list, sky_list = [], []
+    for name, entry in files.items():
+        if entry["has_target_hours"] != use_target:
+            continue
+        overlap = affected.intersection(tuple(k) for k in entry["partitions"])
+        if not overlap:
+            continue
+        stats, sky_counts = _load_file_partials(name, overlap)
+        stats_list.append(stats)
+        sky_list.append(sky_counts)
+
+    written = []
+    if stats_list:
+        stats, sky_counts = combine_partials(stats_list, sky_list)
+        daily = finalize_partials(stats, sky_counts)
+        daily = daily.assign(year=daily["date"].dt.year, month=daily["date"].dt.month)
+        written = write_partitions(daily, WEATHER_DAILY_DIR, PARTITION_COLS)
+
+    # 더 이상 데이터가 없는 partition 만 삭제 (나머지는 write_partitions 가 교체)
+    remove_partitions(WEATHER_DAILY_DIR, PARTITION_COLS, affected - set(written))
+
+
+def parse_args():
+    parser = ArgumentParser(description="Incrementally ingest new/changed raw weather CSVs.")
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    update_weather_daily(chunksize=args.chunksize)
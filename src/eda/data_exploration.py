@@ -1,21 +1,15 @@
-import glob
-import os
-
 import geopandas as gpd
 import pandas as pd
 
 from src.config.paths import FIRE_RAW_DIR
 from src.core.fire_events import normalize_fire_events
+from src.core.fire_store import load_fires
 from src.core.weather_daily import normalize_weather_daily
 
 
-def load_fire_shapefile():
-    shp_candidates = glob.glob(os.path.join(str(FIRE_RAW_DIR), "*.shp"))
-    assert len(shp_candidates) == 1, f"*.shp가 1개가 아닙니다: {shp_candidates}"
-    fire_shp = shp_candidates[0]
-    print("FIRE_SHP:", fire_shp)
-
-    fires = gpd.read_file(fire_shp)
+def load_fire_shapefile(years=None):
+    # 원본 shapefile 대신 fire_store (GeoParquet) 에서 읽기 (강원 데이터셋만, years 주면 해당 연도 partition 만)
+    fires = load_fires(years=years, datasets=[FIRE_RAW_DIR.name]).drop(columns=["year"], errors="ignore")
     print("rows, cols:", fires.shape)
     print("CRS:", fires.crs)
     print("bounds:", fires.total_bounds)
@@ -1,6 +1,6 @@
 import geopandas as gpd
 
-from src.config.paths import FIRE_RAW_DIR
+from src.core.fire_store import load_fires
 
 """
 [EDA / INSPECTION SCRIPT]
@@ -13,16 +13,14 @@ from src.config.paths import FIRE_RAW_DIR
 ※ 데이터 변경 시 검증용으로만 사용
 """
 
-def load_gangneung_fires():
-    shp_path = FIRE_RAW_DIR / "TB_FFAS_FF_OCCRR_42.shp"
-    gdf = gpd.read_file(shp_path)
+def load_gangneung_fires(years=None):
+    # 시군구 필터를 parquet 읽기에 push-down (강릉시가 없는 파일 / row group 은 건너뜀)
+    gangneung = load_fires(years=years, sgng=["강릉시"])
 
-    print("rows, cols:", gdf.shape)
-    print("CRS:", gdf.crs)
-    print("bounds:", gdf.total_bounds)
-    print("columns:", list(gdf.columns))
-
-    gangneung = gdf[gdf["SGNG_NM"] == "강릉시"].copy()
+    print("rows, cols:", gangneung.shape)
+    print("CRS:", gangneung.crs)
+    print("bounds:", gangneung.total_bounds)
+    print("columns:", list(gangneung.columns))
     print("Gangneung rows:", len(gangneung))
     return gangneung
 
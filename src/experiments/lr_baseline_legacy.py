@@ -2,18 +2,17 @@ import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, roc_auc_score
-from src.config.paths import PROC_DIR
+from src.core.feature_cache import load_feature_matrix
 
 import numpy as np
 
 def run_lr_baseline():
 
-    df = pd.read_parquet(PROC_DIR / "weather_labeled.parquet")
-
     # Feature & Label 선택
     feature_cols = ["TA", "TMN", "TMX", "RN", "DTR"]
-    X = df[feature_cols]
-    y = df["fire_label"]
+    fm = load_feature_matrix("weather_labeled", feature_cols)
+    X = fm.frame()
+    y = fm.y
 
     # Train/Test 분할
     # X_train, X_test, y_train, y_test = train_test_split(
@@ -21,16 +20,13 @@ def run_lr_baseline():
     # )
 
     #time split
-    df["date"] = pd.to_datetime(df["date"])
-
     # 연도기준 분할은 test의 개수가 너무 적어질 것 같다..
-    train_df = df[df["date"].dt.year < 2021]
-    test_df  = df[df["date"].dt.year >= 2021]
+    lo = fm.date_index("2021-01-01")  # 캐시 행은 날짜순
 
-    X_train = train_df[feature_cols]
-    y_train = train_df["fire_label"]
-    X_test  = test_df[feature_cols]
-    y_test  = test_df["fire_label"]
+    X_train = fm.frame(slice(0, lo))
+    y_train = fm.y[:lo]
+    X_test  = fm.frame(slice(lo, None))
+    y_test  = fm.y[lo:]
 
 
     # Logistic Regression + 클래스 불균형 보정
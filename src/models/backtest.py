@@ -0,0 +1,180 @@
+"""
+Rolling-origin (expanding window) backtest + hyperparameter grid for the base LR.
+
+    python -m src.models.backtest --folds 6 --test-days 60 --C 0.01 0.1 1 10 --workers 4
+
+The date-sorted X / y / day arrays come from the feature-matrix cache
+(src.core.feature_cache); worker processes open them with mmap_mode="r",
+so every (fold, config) task slices the same pages instead of re-reading
+parquet. Because rows are date-sorted, a fold's train/test sets are
+contiguous row ranges.
+
+Folds whose train or test window has a single class are reported as
+skipped instead of failing the run (the reason evaluate.py's __main__ pins
+holdout_days=240). Results: one row per (fold, config) with metrics, wall
+time and peak traced memory, written to PROC_DIR/backtest_results.csv.
+"""
+import itertools
+import os
+import resource
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.config.paths import PROC_DIR, ensure_dirs
+from src.core.feature_cache import load_feature_matrix
+from src.core.telemetry import instrument, log
+from src.models.evaluate import FEATURES
+
+
+RESULTS_NAME = "backtest_results.csv"
+
+# worker 프로세스별 memmap (initializer 에서 한 번만 연다)
+_MATRIX: Dict[str, np.ndarray] = {}
+
+
+def _open_matrix(matrix_dir: str) -> None:
+    for name in ("X", "y", "day"):
+        _MATRIX[name] = np.load(os.path.join(matrix_dir, f"{name}.npy"), mmap_mode="r")
+
+
+def rolling_folds(
+        first_day: int,
+        last_day: int,
+        n_folds: int,
+        test_days: int,
+        min_train_days: int = 180,
+) -> List[Dict[str, int]]:
+    """
+    Expanding-window folds ending at the last day: fold k tests
+    [cutoff_k, cutoff_k + test_days) and trains on everything before cutoff_k.
+    """
+    folds = []
+    for k in range(n_folds):
+        cutoff = last_day + 1 - test_days * (n_folds - k)
+        if cutoff - first_day < min_train_days:
+            continue
+        folds.append({"fold": k, "cutoff": cutoff, "test_end": cutoff + test_days})
+    return folds
+
+
+def _run_task(fold: Dict[str, int], config: Dict) -> Dict:
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import average_precision_score, roc_auc_score
+
+    X, y, day = _MATRIX["X"], _MATRIX["y"], _MATRIX["day"]
+    lo = int(np.searchsorted(day, fold["cutoff"], side="left"))
+    hi = int(np.searchsorted(day, fold["test_end"], side="left"))
+    row = {
+        **fold,
+        **config,
+        "cutoff": str(pd.Timestamp("1970-01-01") + pd.Timedelta(days=fold["cutoff"])),
+        "train_rows": lo,
+        "test_rows": hi - lo,
+        "train_positive": int(y[:lo].sum()),
+        "test_positive": int(y[lo:hi].sum()),
+        "status": "ok",
+        "roc_auc": np.nan,
+        "pr_auc": np.nan,
+    }
+    if len(np.unique(y[:lo])) < 2 or len(np.unique(y[lo:hi])) < 2:
+        row["status"] = "skipped_single_class"
+        return row
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    model = LogisticRegression(C=config["C"], class_weight=config["class_weight"], max_iter=500)
+    model.fit(X[:lo], y[:lo])
+    prob = model.predict_proba(X[lo:hi])[:, 1]
+    row["roc_auc"] = roc_auc_score(y[lo:hi], prob)
+    row["pr_auc"] = average_precision_score(y[lo:hi], prob)
+    row["wall_s"] = time.perf_counter() - t0
+    row["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    # Linux ru_maxrss 단위는 KB (worker 프로세스 누적 최대값)
+    row["worker_maxrss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    row["pid"] = os.getpid()
+    return row
+
+
+@instrument()
+def run_backtest(
+        n_folds: int = 6,
+        test_days: int = 60,
+        min_train_days: int = 180,
+        Cs: Sequence[float] = (0.01, 0.1, 1.0, 10.0),
+        class_weights: Sequence[Optional[str]] = ("balanced", None),
+        workers: int = 4,
+        save: bool = True,
+) -> pd.DataFrame:
+    t0 = time.perf_counter()
+    fm = load_feature_matrix("weather_labeled", FEATURES)
+    if len(fm) == 0:
+        raise ValueError("No rows available after dropping missing feature/label values.")
+    folds = rolling_folds(int(fm.day[0]), int(fm.day[-1]), n_folds, test_days, min_train_days)
+    configs = [{"C": c, "class_weight": w} for c, w in itertools.product(Cs, class_weights)]
+    tasks = list(itertools.product(folds, configs))
+    log(f"[backtest] rows={len(fm)} folds={len(folds)} configs={len(configs)} tasks={len(tasks)}",
+        folds=len(folds), configs=len(configs), tasks=len(tasks))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_open_matrix, initargs=(str(fm.path),)) as pool:
+        rows = list(pool.map(_run_task, *zip(*tasks))) if tasks else []
+
+    results = pd.DataFrame(rows)
+    if results.empty:
+        raise ValueError("No backtest folds (history shorter than min_train_days + test window?)")
+    results["class_weight"] = results["class_weight"].fillna("none")
+    log(f"[backtest] {len(results)} tasks in {time.perf_counter() - t0:.1f}s")
+
+    ok = results[results["status"] == "ok"]
+    skipped = results.loc[results["status"] != "ok", "fold"].unique()
+    if len(skipped):
+        log(f"[backtest] folds skipped (single class): {sorted(skipped.tolist())}",
+            skipped_folds=sorted(skipped.tolist()))
+    if not ok.empty:
+        summary = (
+            ok.groupby(["C", "class_weight"])
+            .agg(folds=("fold", "nunique"), roc_auc=("roc_auc", "mean"), pr_auc=("pr_auc", "mean"),
+                 pr_auc_std=("pr_auc", "std"), wall_s=("wall_s", "mean"))
+            .sort_values("pr_auc", ascending=False)
+        )
+        print(summary.to_string())
+
+    if save:
+        ensure_dirs(PROC_DIR)
+        out = PROC_DIR / RESULTS_NAME
+        results.to_csv(out, index=False)
+        log(f"saved -> {out}", path=str(out))
+    return results
+
+
+def _class_weight_arg(v: str) -> Optional[str]:
+    return None if v.lower() == "none" else v
+
+
+def parse_args():
+    parser = ArgumentParser(description="Rolling-origin backtest + hyperparameter grid for the base LR.")
+    parser.add_argument("--folds", type=int, default=6)
+    parser.add_argument("--test-days", type=int, default=60)
+    parser.add_argument("--min-train-days", type=int, default=180)
+    parser.add_argument("--C", type=float, nargs="+", default=[0.01, 0.1, 1.0, 10.0])
+    parser.add_argument("--class-weight", type=_class_weight_arg, nargs="+", default=["balanced", None])
+    parser.add_argument("--workers", type=int, default=4)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_backtest(
+        n_folds=args.folds,
+        test_days=args.test_days,
+        min_train_days=args.min_train_days,
+        Cs=args.C,
+        class_weights=args.class_weight,
+        workers=args.workers,
+    )
@@ -0,0 +1,220 @@
+"""
+Compiled (NumPy-only) scoring artifact for the base model.
+
+    python -m src.models.compiled_model            # export from base_lr.joblib + parity check
+
+The trained sklearn model (LogisticRegression, or the StandardScaler +
+SGDClassifier pipeline from train_incremental) is reduced to one linear
+function: feature order, coefficients, intercept and the risk thresholds.
+A StandardScaler in front is folded into the coefficients:
+
+    w' = w / scale,   b' = b - sum(w * mean / scale)
+
+The artifact is a small versioned JSON file (base_lr.compiled.json) next to
+base_lr.joblib. Scoring it is one matmul + sigmoid and needs only numpy, so
+cold starts skip importing sklearn / joblib and unpickling the estimator.
+`evaluate.save_artifacts` writes it together with the joblib model.
+"""
+import json
+import os
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+from src.config.paths import MODEL_DIR
+
+COMPILED_NAME = "base_lr.compiled.json"
+ARTIFACT_FORMAT = "firecast-linear"
+ARTIFACT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CompiledModel:
+    """Linear model p = sigmoid(X @ coef + intercept) over `features` (in that order)."""
+
+    features: List[str]
+    coef: np.ndarray          # float64, (n_features,)
+    intercept: float
+    risk_thresholds: List[float]
+    risk_levels: List[str]
+    source: dict
+
+    def decision_function(self, X) -> np.ndarray:
+        if hasattr(X, "columns"):
+            X = X[self.features].to_numpy(dtype="float64", na_value=np.nan)
+        X = np.asarray(X, dtype="float64")
+        if X.ndim != 2 or X.shape[1] != len(self.features):
+            raise ValueError(f"Expected {len(self.features)} features {self.features}, got shape {X.shape}")
+        return X @ self.coef + self.intercept
+
+    def predict_prob(self, X) -> np.ndarray:
+        """P(fire) per row (1-D)."""
+        z = self.decision_function(X)
+        # exp overflow 없이: z >= 0 이면 1/(1+e^-z), 아니면 e^z/(1+e^z)
+        e = np.exp(-np.abs(z))
+        return np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e))
+
+    def predict_proba(self, X) -> np.ndarray:
+        """sklearn-compatible (n, 2) [P(0), P(1)], so score_rows works unchanged."""
+        p = self.predict_prob(X)
+        return np.column_stack([1.0 - p, p])
+
+    def risk(self, probs) -> np.ndarray:
+        idx = np.searchsorted(self.risk_thresholds, np.asarray(probs, dtype="float64"), side="left")
+        return np.asarray(self.risk_levels, dtype=object)[idx]
+
+    def to_dict(self) -> dict:
+        return {
+            "format": ARTIFACT_FORMAT,
+            "version": ARTIFACT_VERSION,
+            "features": list(self.features),
+            "coef": [float(c) for c in self.coef],
+            "intercept": float(self.intercept),
+            "risk_thresholds": list(self.risk_thresholds),
+            "risk_levels": list(self.risk_levels),
+            "source": self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "CompiledModel":
+        if d.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"Not a compiled base model artifact (format={d.get('format')!r})")
+        if d.get("version") != ARTIFACT_VERSION:
+            raise ValueError(f"Unsupported compiled model version: {d.get('version')}")
+        coef = np.asarray(d["coef"], dtype="float64")
+        if len(coef) != len(d["features"]):
+            raise ValueError("Compiled model: coef / features length mismatch")
+        return cls(
+            features=list(d["features"]),
+            coef=coef,
+            intercept=float(d["intercept"]),
+            risk_thresholds=[float(t) for t in d["risk_thresholds"]],
+            risk_levels=list(d["risk_levels"]),
+            source=d.get("source", {}),
+        )
+
+
+def _linear_step(est):
+    """(coef 1-D, intercept) of a fitted binary linear classifier."""
+    if not hasattr(est, "coef_") or not hasattr(est, "intercept_"):
+        raise TypeError(f"Cannot compile {type(est).__name__}: not a linear classifier")
+    classes = list(getattr(est, "classes_", [0, 1]))
+    if len(classes) != 2 or est.coef_.shape[0] != 1:
+        raise TypeError(f"Cannot compile {type(est).__name__}: expected a binary classifier, classes={classes}")
+    if classes[1] != 1:
+        raise TypeError(f"Cannot compile: positive class must be 1, classes={classes}")
+    return np.asarray(est.coef_[0], dtype="float64"), float(est.intercept_[0])
+
+
+def _fold_scaler(scaler, coef: np.ndarray, intercept: float):
+    """StandardScaler -> linear: w·((x - mean) / scale) + b == (w / scale)·x + (b - w·mean / scale)."""
+    scale = getattr(scaler, "scale_", None)
+    mean = getattr(scaler, "mean_", None)
+    if not hasattr(scaler, "with_mean"):
+        raise TypeError(f"Cannot compile pipeline step {type(scaler).__name__} (only StandardScaler)")
+    w = coef / scale if scaler.with_std and scale is not None else coef
+    if scaler.with_mean and mean is not None:
+        intercept = intercept - float(np.dot(w, mean))
+    return w, intercept
+
+
+def compile_model(
+        model,
+        features: List[str],
+        risk_thresholds: Optional[List[float]] = None,
+        risk_levels: Optional[List[str]] = None,
+        source: Optional[dict] = None,
+) -> CompiledModel:
+    """
+    Reduce a fitted LogisticRegression / SGDClassifier (optionally behind a
+    StandardScaler) to a CompiledModel. Risk buckets default to
+    predict_daily_base.RISK_THRESHOLDS / RISK_LEVELS.
+    """
+    from src.models.predict_daily_base import RISK_LEVELS, RISK_THRESHOLDS
+
+    steps = [est for _, est in model.steps] if hasattr(model, "steps") else [model]
+    coef, intercept = _linear_step(steps[-1])
+    for pre in reversed(steps[:-1]):
+        coef, intercept = _fold_scaler(pre, coef, intercept)
+
+    fitted_names = getattr(steps[0], "feature_names_in_", None)
+    if fitted_names is not None and list(fitted_names) != list(features):
+        raise ValueError(f"Model was fitted on {list(fitted_names)}, not {list(features)}")
+    if len(coef) != len(features):
+        raise ValueError(f"Model has {len(coef)} coefficients for {len(features)} features")
+
+    return CompiledModel(
+        features=list(features),
+        coef=coef,
+        intercept=intercept,
+        risk_thresholds=list(risk_thresholds or RISK_THRESHOLDS),
+        risk_levels=list(risk_levels or RISK_LEVELS),
+        source={"estimator": " -> ".join(type(s).__name__ for s in steps), **(source or {})},
+    )
+
+
+def save_compiled(compiled: CompiledModel, path=None):
+    path = MODEL_DIR / COMPILED_NAME if path is None else path
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(compiled.to_dict(), f, ensure_ascii=False, indent=2)
+    # 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 tmp -> replace
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_compiled(path=None) -> CompiledModel:
+    path = MODEL_DIR / COMPILED_NAME if path is None else path
+    with open(path, encoding="utf-8") as f:
+        return CompiledModel.from_dict(json.load(f))
+
+
+def parity(model, compiled: CompiledModel, X) -> float:
+    """max |predict_proba(X)[:, 1] - compiled.predict_prob(X)| (X: DataFrame with compiled.features)."""
+    expected = model.predict_proba(X[compiled.features])[:, 1]
+    return float(np.max(np.abs(expected - compiled.predict_prob(X)))) if len(expected) else 0.0
+
+
+def export_from_joblib(check_rows: int = 100_000, tol: float = 1e-6) -> CompiledModel:
+    """Compile MODEL_DIR/base_lr.joblib (features from its meta) and check parity on weather_labeled."""
+    import joblib
+
+    from src.core.schema import feature_frame
+    from src.core.telemetry import log
+    from src.models.evaluate import FEATURES, META_NAME, MODEL_NAME
+    from src.models.predict_daily_base import load_feature_rows
+
+    model = joblib.load(MODEL_DIR / MODEL_NAME)
+    meta_path = MODEL_DIR / META_NAME
+    meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+    compiled = compile_model(
+        model,
+        meta.get("features", FEATURES),
+        source={"model_name": MODEL_NAME, "trained_at": meta.get("trained_at"),
+                "compiled_at": datetime.now().isoformat(timespec="seconds")},
+    )
+
+    X = feature_frame(load_feature_rows(None, None).head(check_rows), compiled.features)
+    err = parity(model, compiled, X)
+    log(f"[compiled] parity vs predict_proba on {len(X):,} rows: max abs diff {err:.2e}", max_abs_diff=err)
+    if err > tol:
+        raise ValueError(f"Compiled model differs from predict_proba by {err:.2e} (> {tol:.0e})")
+    out = save_compiled(compiled)
+    log(f"saved -> {out}", path=str(out))
+    return compiled
+
+
+def parse_args():
+    parser = ArgumentParser(description="Export base_lr.joblib to the NumPy-only compiled artifact.")
+    parser.add_argument("--check-rows", type=int, default=100_000, help="weather_labeled rows for the parity check")
+    # sklearn 은 float32 feature 를 float32 로 계산하므로 (compiled 는 float64) ~1e-7 차이는 정상
+    parser.add_argument("--tol", type=float, default=1e-6)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    export_from_joblib(check_rows=args.check_rows, tol=args.tol)
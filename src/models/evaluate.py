@@ -3,11 +3,16 @@ from argparse import ArgumentParser
 from datetime import datetime
 
 import joblib
+import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import average_precision_score, roc_auc_score
 
-from src.config.paths import MODEL_DIR, PROC_DIR
+from src.config.paths import MODEL_DIR, ensure_dirs
+from src.core.datasets import dataset_path
+from src.core.feature_cache import load_feature_matrix
+from src.core.telemetry import count_written, instrument, log
+from src.models.compiled_model import COMPILED_NAME, compile_model, parity, save_compiled
 
 
 FEATURES = [
@@ -20,6 +25,7 @@ FEATURES = [
     "SKY",
 ]
 LABEL = "fire_label"
+WEIGHT = "sample_weight"  # training_sample 의 negative sampling 역가중치
 
 MODEL_NAME = "base_lr.joblib"
 META_NAME = "base_lr_meta.json"
@@ -34,69 +40,67 @@ def time_split_holdout(df: pd.DataFrame, holdout_days: int = 90):
     return train_df, test_df, cutoff
 
 
-def train_and_save(holdout_days: int = 90):
+@instrument()
+def train_and_save(holdout_days: int = 90, dataset: str = "weather_labeled"):
+    """
+    dataset: "weather_labeled" (전체) 또는 "training_sample" (negative sampling).
+    sample_weight 컬럼이 있으면 학습과 holdout 지표 모두 그 가중치로 계산.
+    """
     if holdout_days <= 0:
         raise ValueError("holdout_days must be > 0")
 
-    df = pd.read_parquet(PROC_DIR / "weather_labeled.parquet")
-    df["date"] = pd.to_datetime(df["date"])
-
-    required_cols = FEATURES + [LABEL, "date"]
-    missing_cols = [c for c in required_cols if c not in df.columns]
-    if missing_cols:
-        raise KeyError(f"Missing required columns in weather_labeled.parquet: {missing_cols}")
-
-    # Numeric safety for model input.
-    for col in FEATURES:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    df = df.dropna(subset=FEATURES + [LABEL])
-    if df.empty:
+    # 정제된 X / y / date (memmap 캐시, 데이터나 FEATURES 가 바뀌면 다시 생성)
+    fm = load_feature_matrix(dataset, FEATURES)
+    if len(fm) == 0:
         raise ValueError("No rows available after dropping missing feature/label values.")
+    weighted = fm.weight is not None
 
-    train_df, test_df, cutoff = time_split_holdout(df, holdout_days=holdout_days)
-    if train_df.empty or test_df.empty:
+    # 행이 날짜순이라 holdout 은 연속 구간
+    cutoff = pd.Timestamp(fm.dates[-1]) - pd.Timedelta(days=holdout_days)
+    lo = fm.date_index(cutoff)
+    train_rows, test_rows = slice(0, lo), slice(lo, len(fm))
+    if lo == 0 or lo == len(fm):
         raise ValueError(
-            f"Invalid split (holdout_days={holdout_days}): train_rows={len(train_df)}, test_rows={len(test_df)}"
+            f"Invalid split (holdout_days={holdout_days}): train_rows={lo}, test_rows={len(fm) - lo}"
         )
 
-    X_train = train_df[FEATURES]
-    y_train = train_df[LABEL]
-    X_test = test_df[FEATURES]
-    y_test = test_df[LABEL]
-    if y_train.nunique() < 2:
+    X_train = fm.frame(train_rows)
+    y_train = fm.y[train_rows]
+    X_test = fm.frame(test_rows)
+    y_test = fm.y[test_rows]
+    if len(np.unique(y_train)) < 2:
         raise ValueError("Training labels have only one class. Cannot train LogisticRegression.")
-    if y_test.nunique() < 2:
+    if len(np.unique(y_test)) < 2:
         raise ValueError(
             "Test labels have only one class for the selected holdout window "
-            f"(holdout_days={holdout_days}, test_rows={len(test_df)}, positives={int(y_test.sum())}). "
+            f"(holdout_days={holdout_days}, test_rows={len(y_test)}, positives={int(y_test.sum())}). "
             "Choose a different holdout window with both classes."
         )
 
+    w_train = fm.weight[train_rows] if weighted else None
+    w_test = fm.weight[test_rows] if weighted else None
+
     model = LogisticRegression(class_weight="balanced", max_iter=500)
-    model.fit(X_train, y_train)
+    model.fit(X_train, y_train, sample_weight=w_train)
 
     y_prob = model.predict_proba(X_test)[:, 1]
-    roc = roc_auc_score(y_test, y_prob)
-    pr = average_precision_score(y_test, y_prob)
-
-    MODEL_DIR.mkdir(parents=True, exist_ok=True)
-
-    model_path = MODEL_DIR / MODEL_NAME
-    joblib.dump(model, model_path)
+    roc = roc_auc_score(y_test, y_prob, sample_weight=w_test)
+    pr = average_precision_score(y_test, y_prob, sample_weight=w_test)
 
     meta = {
         "model_name": MODEL_NAME,
         "trained_at": datetime.now().isoformat(timespec="seconds"),
-        "data_file": str(PROC_DIR / "weather_labeled.parquet"),
+        "data_file": str(dataset_path(dataset)),
+        "sample_weighted": weighted,
+        "feature_cache": fm.path.name,
         "features": FEATURES,
         "label": LABEL,
         "split": {
             "type": "time_holdout",
             "holdout_days": holdout_days,
             "cutoff": str(cutoff.date()),
-            "train_rows": int(len(train_df)),
-            "test_rows": int(len(test_df)),
+            "train_rows": int(len(y_train)),
+            "test_rows": int(len(y_test)),
             "train_positive": int(y_train.sum()),
             "test_positive": int(y_test.sum()),
         },
@@ -106,18 +110,49 @@ def train_and_save(holdout_days: int = 90):
         },
     }
 
+    save_artifacts(model, meta, check_X=X_test)
+    return model
+
+
+def save_artifacts(model, meta: dict, check_X=None) -> None:
+    """
+    MODEL_DIR 에 모델 (joblib) + compiled artifact + meta (json) 저장 후 요약 출력.
+
+    check_X (feature frame) 가 있으면 compiled 점수와 predict_proba 의 최대 차이를 meta 에 기록.
+    """
+    ensure_dirs(MODEL_DIR)
+
+    model_path = MODEL_DIR / MODEL_NAME
+    joblib.dump(model, model_path)
+
+    # joblib 다음에 써야 load_model(auto) 가 최신 compiled 로 판단
+    try:
+        compiled = compile_model(
+            model, meta["features"],
+            source={"model_name": meta["model_name"], "trained_at": meta["trained_at"]},
+        )
+    except TypeError as e:
+        log(f"[WARN] compiled artifact not written: {e}")
+    else:
+        meta["compiled"] = {"artifact": COMPILED_NAME, "estimator": compiled.source["estimator"]}
+        if check_X is not None:
+            meta["compiled"]["parity_max_abs_diff"] = parity(model, compiled, check_X)
+        count_written(save_compiled(compiled))
+
     meta_path = MODEL_DIR / META_NAME
     meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    count_written(model_path)
+    count_written(meta_path)
 
-    print(f"Model saved: {model_path}")
-    print(f"Meta saved : {meta_path}")
-    print(f"Holdout cutoff date: {cutoff.date()}")
-    print(f"Train rows / positives: {len(train_df)} / {int(y_train.sum())}")
-    print(f"Test rows  / positives: {len(test_df)} / {int(y_test.sum())}")
-    print(f"Quick ROC-AUC: {roc}")
-    print(f"Quick PR-AUC : {pr}")
-
-    return model
+    split = meta["split"]
+    metrics = meta["quick_metrics_on_holdout"]
+    log(f"Model saved: {model_path}", path=str(model_path))
+    log(f"Meta saved : {meta_path}", path=str(meta_path))
+    log(f"Holdout cutoff date: {split['cutoff']}", **split)
+    log(f"Train rows / positives: {split['train_rows']} / {split['train_positive']}")
+    log(f"Test rows  / positives: {split['test_rows']} / {split['test_positive']}")
+    log(f"Quick ROC-AUC: {metrics['roc_auc']}", **metrics)
+    log(f"Quick PR-AUC : {metrics['pr_auc']}")
 
 
 def parse_args():
@@ -128,10 +163,16 @@ def parse_args():
         default=90,
         help="Number of most-recent days used as test holdout (default: 90)",
     )
+    parser.add_argument(
+        "--dataset",
+        choices=["weather_labeled", "training_sample"],
+        default="weather_labeled",
+        help="training_sample = negative-sampled set from src.core.training_set (weighted)",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
     # train_and_save(holdout_days=args.holdout_days)
-    train_and_save(holdout_days=240)
+    train_and_save(holdout_days=240, dataset=args.dataset)
@@ -0,0 +1,129 @@
+"""
+Batch prediction over a date range (or the whole labeled history).
+
+    python -m src.models.predict_batch --start 2021-03-01 --end 2021-05-31
+
+The model is loaded once; weather_labeled is scanned one year/month
+partition at a time, scored in one predict_proba call per month, bucketed
+with `risk_levels`, and written to the base_predictions dataset
+(year/month partitions, only the scored months are replaced).
+"""
+import time
+from argparse import ArgumentParser
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from src.core.datasets import (
+    DATASETS,
+    PART_FILE,
+    dataset_path,
+    list_partitions,
+    partition_dir,
+    write_partitions,
+)
+from src.core.telemetry import instrument, log
+from src.models.predict_daily_base import SCORERS, load_feature_rows, load_model, score_rows
+
+
+def _months_in_range(start, end) -> List[Tuple[int, int]]:
+    """(year, month) 목록: 범위가 없으면 weather_labeled 에 있는 모든 월."""
+    if start is None or end is None:
+        on_disk = [(y, m) for y, m in list_partitions("weather_labeled")]
+        if not on_disk:
+            return [None]  # 단일 파일 (partition 이전 형식): 한 번에 처리
+        lo = (pd.Timestamp(start).year, pd.Timestamp(start).month) if start is not None else on_disk[0]
+        hi = (pd.Timestamp(end).year, pd.Timestamp(end).month) if end is not None else on_disk[-1]
+        return [ym for ym in on_disk if lo <= ym <= hi]
+
+    months = pd.period_range(pd.Timestamp(start), pd.Timestamp(end), freq="M")
+    return [(p.year, p.month) for p in months]
+
+
+def _save_month(scored: pd.DataFrame, root, partition_cols: List[str], lo, hi) -> None:
+    """월 partition 교체. 범위가 월 일부만 덮으면 범위 밖 기존 예측은 유지."""
+    dates = scored["date"]
+    out = scored.assign(year=dates.dt.year, month=dates.dt.month)
+
+    for (y, m), _ in out.groupby(["year", "month"]):
+        existing = partition_dir(root, partition_cols, (y, m)) / PART_FILE
+        if existing.exists():
+            old = pd.read_parquet(existing)
+            keep = pd.Series(False, index=old.index)
+            if lo is not None:
+                keep |= old["date"] < lo
+            if hi is not None:
+                keep |= old["date"] > hi
+            old = old[keep]
+            if not old.empty:
+                out = pd.concat([out, old.assign(year=y, month=m)], ignore_index=True)
+
+    out = out.sort_values(["date"] + [c for c in ["station_id"] if c in out.columns])
+    write_partitions(out, root, partition_cols)
+
+
+@instrument()
+def predict_range(
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        save: bool = True,
+        scorer: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Score every station x date in [start, end] (inclusive; None = open-ended).
+
+    Returns the predictions; with save=True also writes them to
+    PROC_DIR/base_predictions. scorer: see `predict_daily_base.load_model`.
+    """
+    model = load_model(scorer)
+    start_ts = pd.Timestamp(start).normalize() if start is not None else None
+    end_ts = pd.Timestamp(end).normalize() if end is not None else None
+
+    spec = DATASETS["base_predictions"]
+    out_root = dataset_path("base_predictions")
+    results = []
+    n_rows = 0
+    t0 = time.perf_counter()
+    for ym in _months_in_range(start_ts, end_ts):
+        if ym is None:
+            lo, hi = start_ts, end_ts
+        else:
+            month_start = pd.Timestamp(year=ym[0], month=ym[1], day=1)
+            month_end = month_start + pd.offsets.MonthEnd(0)
+            lo = max(month_start, start_ts) if start_ts is not None else month_start
+            hi = min(month_end, end_ts) if end_ts is not None else month_end
+
+        rows = load_feature_rows(lo, hi)
+        if rows.empty:
+            continue
+
+        scored = score_rows(model, rows)
+        n_rows += len(scored)
+        results.append(scored)
+        if save:
+            _save_month(scored, out_root, list(spec.partition_cols), lo, hi)
+
+    elapsed = time.perf_counter() - t0
+    if not results:
+        raise ValueError(f"No valid data between {start} and {end} in weather_labeled")
+
+    result = pd.concat(results, ignore_index=True)
+    log(f"scored rows: {n_rows}  elapsed: {elapsed:.2f}s  throughput: {n_rows / elapsed:,.0f} rows/s",
+        rows_per_s=round(n_rows / elapsed))
+    if save:
+        log(f"saved predictions -> {dataset_path('base_predictions')}", path=str(dataset_path("base_predictions")))
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser(description="Batch base-model prediction over a date range.")
+    parser.add_argument("--start", default=None, help="YYYY-MM-DD (default: first labeled date)")
+    parser.add_argument("--end", default=None, help="YYYY-MM-DD (default: last labeled date)")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--scorer", choices=SCORERS, default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    predict_range(args.start, args.end, save=not args.no_save, scorer=args.scorer)
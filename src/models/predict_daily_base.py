@@ -1,7 +1,14 @@
-import joblib
+import os
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
-from src.config.paths import MODEL_DIR, PROC_DIR
+from src.config.paths import MODEL_DIR, PROC_DIR, ensure_dirs
+from src.core.feature_cache import load_feature_matrix
+from src.core.schema import feature_frame
+from src.core.telemetry import count_read, count_written, instrument, log
+from src.models.compiled_model import COMPILED_NAME, CompiledModel, load_compiled
 
 
 FEATURES = [
@@ -14,6 +21,12 @@ FEATURES = [
     "SKY",
 ]
 MODEL_NAME = "base_lr.joblib"
+# auto: base_lr.compiled.json 이 joblib 보다 오래되지 않았으면 NumPy scorer, 아니면 sklearn
+SCORERS = ("auto", "compiled", "sklearn")
+
+# p <= 0.4 LOW, <= 0.6 MODERATE, <= 0.8 HIGH, 그 외 EXTREME
+RISK_THRESHOLDS = [0.4, 0.6, 0.8]
+RISK_LEVELS = ["LOW", "MODERATE", "HIGH", "EXTREME"]
 
 
 def risk_level_from_prob(p: float) -> str:
@@ -26,33 +39,60 @@ def risk_level_from_prob(p: float) -> str:
     return "EXTREME"
 
 
-def predict_for_date(target_date: str, save: bool = False):
+def risk_levels(probs) -> np.ndarray:
+    """Vectorized `risk_level_from_prob` (bucket edges are inclusive on the right)."""
+    idx = np.searchsorted(RISK_THRESHOLDS, np.asarray(probs, dtype="float64"), side="left")
+    return np.asarray(RISK_LEVELS, dtype=object)[idx]
+
+
+def _compiled_is_current() -> bool:
+    compiled_path = MODEL_DIR / COMPILED_NAME
+    if not compiled_path.exists():
+        return False
+    model_path = MODEL_DIR / MODEL_NAME
+    return not model_path.exists() or os.path.getmtime(compiled_path) >= os.path.getmtime(model_path)
+
+
+def load_model(scorer: Optional[str] = None):
+    """
+    scorer: "compiled" (NumPy-only artifact), "sklearn" (joblib) or "auto"
+    (default, or FIRECAST_SCORER). Both expose predict_proba.
+    """
+    scorer = scorer or os.environ.get("FIRECAST_SCORER", "auto")
+    if scorer not in SCORERS:
+        raise ValueError(f"Unknown scorer {scorer!r} (expected one of {SCORERS})")
+    if scorer == "compiled" or (scorer == "auto" and _compiled_is_current()):
+        count_read(MODEL_DIR / COMPILED_NAME)
+        return load_compiled()
+
     model_path = MODEL_DIR / MODEL_NAME
     if not model_path.exists():
         raise FileNotFoundError(
             f"Model file not found: {model_path}\n"
             f"Run `python -m src.models.evaluate` first."
         )
+    import joblib  # scoring 경로에서만 필요 (import 비용 지연)
 
-    model = joblib.load(model_path)
-
-    df = pd.read_parquet(PROC_DIR / "weather_labeled.parquet")
-    df["date"] = pd.to_datetime(df["date"])
+    count_read(model_path)
+    return joblib.load(model_path)
 
-    for col in FEATURES:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    target_dt = pd.to_datetime(target_date)
+def load_feature_rows(start, end) -> pd.DataFrame:
+    """weather_labeled 의 [start, end] 날짜 (None = 제한 없음) 예측용 행 (feature-matrix 캐시에서, 날짜순)."""
+    fm = load_feature_matrix("weather_labeled", FEATURES, extra=["lat", "lon"])
+    rows = fm.rows_between(start, end)
+    return pd.concat([fm.keys_frame(rows), fm.frame(rows)], axis=1)
 
-    day_df = df[df["date"].dt.date == target_dt.date()].copy()
-    day_df = day_df.dropna(subset=FEATURES)
-    if day_df.empty:
-        raise ValueError(f"No valid data for date={target_date} in weather_labeled.parquet")
 
-    X = day_df[FEATURES]
+def score_rows(model, day_df: pd.DataFrame) -> pd.DataFrame:
+    """base_prob / risk_level 계산 후 출력 컬럼만 정리."""
+    day_df = day_df.copy()
+    X = feature_frame(day_df, FEATURES)
     day_df["base_prob"] = model.predict_proba(X)[:, 1]
-    day_df["risk_level"] = day_df["base_prob"].apply(risk_level_from_prob)
+    if isinstance(model, CompiledModel):
+        day_df["risk_level"] = model.risk(day_df["base_prob"])
+    else:
+        day_df["risk_level"] = risk_levels(day_df["base_prob"])
 
     cols = []
     for c in ["station_id", "date", "base_prob", "risk_level", "lat", "lon"]:
@@ -61,15 +101,88 @@ def predict_for_date(target_date: str, save: bool = False):
     if not cols:
         cols = ["date", "base_prob", "risk_level"]
 
-    result = day_df[cols].sort_values(cols[0]).reset_index(drop=True)
+    return day_df[cols].sort_values(cols[0]).reset_index(drop=True)
+
+
+@instrument()
+def predict_for_date(target_date: str, save: bool = False, scorer: Optional[str] = None):
+    model = load_model(scorer)
+
+    target_dt = pd.to_datetime(target_date)
+
+    # 필요한 컬럼 + 해당 날짜 partition 만 읽기
+    day_df = load_feature_rows(target_dt, target_dt)
+    if day_df.empty:
+        raise ValueError(f"No valid data for date={target_date} in weather_labeled")
+
+    result = score_rows(model, day_df)
 
     if save:
+        ensure_dirs(PROC_DIR)
         out_path = PROC_DIR / f"base_predictions_{target_dt.date()}.parquet"
         result.to_parquet(out_path, index=False)
-        print(f"Saved predictions: {out_path}")
+        count_written(out_path)
+        log(f"Saved predictions: {out_path}", path=str(out_path))
 
     return result
 
 
+@instrument()
+def predict_grid_for_date(
+        target_date: str,
+        cell_m: int = 1000,
+        k: int = 3,
+        power: float = 2.0,
+        stations: str = "gangneung",
+        save: bool = False,
+        scorer: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    base_prob / risk_level for every cell of the `cell_m` label grid on one date.
+
+    Cell weather is the IDW of the k nearest stations with data that day
+    (`interpolation.iter_idw_weather`) instead of a single station's row;
+    cells without any station value are left out.
+    """
+    from src.core.datasets import read_dataset
+    from src.core.fire_events import station_registry
+    from src.core.grid_labels import GridLabelCube, grid_labels_path
+    from src.core.interpolation import iter_idw_weather
+
+    path = grid_labels_path(cell_m)
+    if not path.exists():
+        raise FileNotFoundError(f"Grid labels not found: {path}\nRun `python -m src label --cell-m {cell_m}` first.")
+    grid = GridLabelCube.load(path).grid
+    target_dt = pd.to_datetime(target_date).normalize()
+    weather = read_dataset("weather_daily", start=target_dt, end=target_dt)
+    if weather.empty:
+        raise ValueError(f"No weather_daily rows for date={target_date}")
+
+    cells = np.arange(grid.n_cells, dtype="int64")
+    x, y = grid.cell_centers(cells)
+    (_, values), = iter_idw_weather(weather, station_registry(stations), x, y, grid.crs, k=k, power=power)
+    lon, lat = grid.cell_centers_lonlat(cells)
+    day_df = pd.DataFrame({"cell_id": cells, "date": target_dt, "lon": lon, "lat": lat})
+    for f, v in values.items():
+        day_df[f] = v[:, 0]
+    day_df = day_df.dropna(subset=FEATURES).reset_index(drop=True)
+
+    model = load_model(scorer)
+    day_df["base_prob"] = model.predict_proba(feature_frame(day_df, FEATURES))[:, 1]
+    if isinstance(model, CompiledModel):
+        day_df["risk_level"] = model.risk(day_df["base_prob"])
+    else:
+        day_df["risk_level"] = risk_levels(day_df["base_prob"])
+    result = day_df[["cell_id", "date", "base_prob", "risk_level", "lat", "lon"]]
+
+    if save:
+        ensure_dirs(PROC_DIR)
+        out_path = PROC_DIR / f"grid_predictions_{cell_m}m_{target_dt.date()}.parquet"
+        result.to_parquet(out_path, index=False)
+        count_written(out_path)
+        log(f"Saved predictions: {out_path}", path=str(out_path))
+    return result
+
+
 if __name__ == "__main__":
     print(predict_for_date("2021-03-25", save=False).head())
@@ -0,0 +1,209 @@
+"""
+Long-lived local scoring service for the base model.
+
+    python -m src.models.scoring_service --port 8765
+
+GET /predict?date=2021-03-25[&station_id=104]  -> risk per station (JSON)
+GET /health                                     -> model / cache status
+
+The model is loaded once and reloaded when base_lr_meta.json changes.
+Feature rows are cached per year/month partition of weather_labeled in an
+LRU; the cache is dropped when the dataset is rewritten.
+"""
+import json
+import os
+import threading
+import time
+from argparse import ArgumentParser
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from src.config.paths import MODEL_DIR
+from src.core.datasets import dataset_path
+from src.models.evaluate import META_NAME
+from src.models.predict_daily_base import (
+    MODEL_NAME,
+    load_feature_rows,
+    load_model,
+    score_rows,
+)
+
+
+def _stat_key(path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_ino
+
+
+class ScoringState:
+    """
+    Model + LRU cache of monthly partitions, shared by request threads.
+
+    Each cached month holds its feature rows scored with the current model,
+    split by date, so a request is a dict lookup plus an optional station filter.
+    """
+
+    def __init__(self, cache_months: int = 24):
+        self.cache_months = cache_months
+        self._lock = threading.Lock()
+        self._model = None
+        self._model_key = None
+        # (year, month) -> (model_key, {date: (scored rows, JSON records)})
+        self._months: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+        self._data_key = None
+        self.model_loads = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def model(self):
+        """현재 모델과 그 key (meta 파일이 바뀌었으면 다시 로드)."""
+        meta_key = _stat_key(MODEL_DIR / META_NAME) or _stat_key(MODEL_DIR / MODEL_NAME)
+        with self._lock:
+            if self._model is None or meta_key != self._model_key:
+                self._model = load_model()
+                self._model_key = meta_key
+                self.model_loads += 1
+            return self._model, self._model_key
+
+    def month_predictions(self, year: int, month: int) -> Dict[pd.Timestamp, Tuple[pd.DataFrame, List[dict]]]:
+        """해당 월 전체를 현재 모델로 점수 매긴 결과 (날짜별, LRU 캐시)."""
+        model, model_key = self.model()
+        data_key = _stat_key(dataset_path("weather_labeled"))
+        key = (year, month)
+        with self._lock:
+            if data_key != self._data_key:
+                self._months.clear()
+                self._data_key = data_key
+            cached = self._months.get(key)
+            if cached is not None and cached[0] == model_key:
+                self._months.move_to_end(key)
+                self.cache_hits += 1
+                return cached[1]
+
+        start = pd.Timestamp(year=year, month=month, day=1)
+        rows = load_feature_rows(start, start + pd.offsets.MonthEnd(0))
+        by_date = {}
+        if not rows.empty:
+            scored = score_rows(model, rows)
+            for d, g in scored.groupby("date", sort=False):
+                g = g.reset_index(drop=True)
+                records = json.loads(g.drop(columns=["date"]).to_json(orient="records", double_precision=15))
+                by_date[d] = (g, records)
+
+        with self._lock:
+            self.cache_misses += 1
+            self._months[key] = (model_key, by_date)
+            self._months.move_to_end(key)
+            while len(self._months) > self.cache_months:
+                self._months.popitem(last=False)
+        return by_date
+
+    def _day(self, target_date) -> Tuple[pd.DataFrame, List[dict]]:
+        target_dt = pd.to_datetime(target_date).normalize()
+        day = self.month_predictions(target_dt.year, target_dt.month).get(target_dt)
+        if day is None:
+            raise ValueError(f"No valid data for date={target_dt.date()} in weather_labeled")
+        return day
+
+    def predict(self, target_date, station_ids: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """predict_for_date 와 같은 형태의 DataFrame."""
+        day_df, _ = self._day(target_date)
+        if station_ids is not None:
+            day_df = day_df[day_df["station_id"].isin(station_ids)].reset_index(drop=True)
+        return day_df
+
+    def predict_records(self, target_date, station_ids: Optional[Sequence[int]] = None) -> List[dict]:
+        """HTTP 응답용 (date 제외) 레코드 리스트."""
+        _, records = self._day(target_date)
+        if station_ids is not None:
+            wanted = set(station_ids)
+            records = [r for r in records if r.get("station_id") in wanted]
+        return records
+
+    def status(self) -> dict:
+        return {
+            "model_loads": self.model_loads,
+            "cached_months": [f"{y}-{m:02d}" for y, m in self._months],
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+def make_handler(state: ScoringState):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # header/body 분리 write 시 delayed-ACK 지연 방지
+
+        def _send(self, code: int, payload) -> None:
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/health":
+                self._send(200, state.status())
+                return
+            if url.path != "/predict" or "date" not in query:
+                self._send(404, {"error": "use /predict?date=YYYY-MM-DD[&station_id=...]"})
+                return
+
+            t0 = time.perf_counter()
+            try:
+                station_ids = [int(s) for s in query["station_id"]] if "station_id" in query else None
+                records = state.predict_records(query["date"][0], station_ids)
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+                return
+            except FileNotFoundError as e:
+                self._send(503, {"error": str(e)})
+                return
+
+            self._send(200, {
+                "date": query["date"][0],
+                "predictions": records,
+                "elapsed_ms": (time.perf_counter() - t0) * 1000,
+            })
+
+        def log_message(self, format, *args):
+            pass
+
+    return ScoringHandler
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8765, cache_months: int = 24) -> ThreadingHTTPServer:
+    state = ScoringState(cache_months=cache_months)
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.state = state
+    return server
+
+
+def parse_args():
+    parser = ArgumentParser(description="Serve base model risk predictions over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-months", type=int, default=24)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    server = make_server(args.host, args.port, args.cache_months)
+    server.state.model()  # 첫 요청 전에 모델 로드
+    print(f"scoring service on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
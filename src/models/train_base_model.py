@@ -1,8 +1,7 @@
-import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, roc_auc_score
 
-from src.config.paths import PROC_DIR
+from src.core.feature_cache import load_feature_matrix
 
 
 FEATURES = [
@@ -17,22 +16,13 @@ FEATURES = [
 
 
 def run_lr_baseline():
-    df = pd.read_parquet(PROC_DIR / "weather_labeled.parquet")
-    df["date"] = pd.to_datetime(df["date"])
+    fm = load_feature_matrix("weather_labeled", FEATURES)
+    lo = fm.date_index("2021-01-01")  # 행이 날짜순: 2021 이전 = train
 
-    for col in FEATURES:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    df = df.dropna(subset=FEATURES + ["fire_label"])
-
-    train_df = df[df["date"].dt.year < 2021]
-    test_df = df[df["date"].dt.year >= 2021]
-
-    X_train = train_df[FEATURES]
-    y_train = train_df["fire_label"]
-    X_test = test_df[FEATURES]
-    y_test = test_df["fire_label"]
+    X_train = fm.frame(slice(0, lo))
+    y_train = fm.y[:lo]
+    X_test = fm.frame(slice(lo, None))
+    y_test = fm.y[lo:]
 
     model = LogisticRegression(class_weight="balanced", max_iter=500)
     model.fit(X_train, y_train)
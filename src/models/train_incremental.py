@@ -0,0 +1,212 @@
+"""
+Out-of-core training of the base model.
+
+Same FEATURES, label, balanced class weights and time holdout as
+`evaluate.train_and_save`, but weather_labeled is streamed one year/month
+partition at a time through a StandardScaler + SGDClassifier(log_loss)
+pipeline using partial_fit. Memory depends on the largest partition (plus
+the holdout predictions), not on how many years or stations are stored.
+
+    python -m src.models.train_incremental --holdout-days 240 --epochs 5
+
+Writes the same artifacts as evaluate.py (base_lr.joblib, base_lr_meta.json);
+the saved pipeline exposes predict_proba, so predict_daily_base is unchanged.
+"""
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime
+from typing import Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import average_precision_score, roc_auc_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.core.datasets import dataset_columns, dataset_path, iter_partitions, list_partitions
+from src.core.schema import feature_frame
+from src.core.telemetry import instrument, log
+from src.models.evaluate import FEATURES, LABEL, MODEL_NAME, WEIGHT, save_artifacts
+
+
+def _iter_clean(dataset: str, columns, keys=None) -> Iterator[pd.DataFrame]:
+    """Partitions with numeric features, missing feature/label rows dropped."""
+    for _, part in iter_partitions(dataset, columns=columns, keys=keys):
+        if not pd.api.types.is_datetime64_any_dtype(part["date"]):
+            part["date"] = pd.to_datetime(part["date"])
+        for col in FEATURES:
+            if not pd.api.types.is_numeric_dtype(part[col]):
+                part[col] = pd.to_numeric(part[col], errors="coerce")
+        part = part.dropna(subset=FEATURES + [LABEL])
+        if not part.empty:
+            yield part
+
+
+def _holdout_cutoff(dataset: str, holdout_days: int) -> pd.Timestamp:
+    """Latest date in the dataset (only the last year/month partition is read) - holdout_days."""
+    last = list_partitions(dataset)[-1]
+    _, part = next(iter_partitions(dataset, columns=["date"], keys=[last]))
+    return pd.to_datetime(part["date"]).max() - pd.Timedelta(days=holdout_days)
+
+
+def _split(part: pd.DataFrame, cutoff: pd.Timestamp) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    is_test = (part["date"] >= cutoff).to_numpy()
+    return part[~is_test], part[is_test]
+
+
+@instrument()
+def train_incremental(
+        holdout_days: int = 90,
+        dataset: str = "weather_labeled",
+        epochs: int = 5,
+        alpha: float = 1e-4,
+        seed: int = 0,
+):
+    if holdout_days <= 0:
+        raise ValueError("holdout_days must be > 0")
+
+    required_cols = FEATURES + [LABEL, "date"]
+    available_cols = dataset_columns(dataset)
+    missing_cols = [c for c in required_cols if c not in available_cols]
+    if missing_cols:
+        raise KeyError(f"Missing required columns in {dataset}: {missing_cols}")
+    weighted = WEIGHT in available_cols
+    if weighted:
+        required_cols.append(WEIGHT)
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    cutoff = _holdout_cutoff(dataset, holdout_days)
+
+    # 1) pass: scaler 통계 + class count (balanced weight 계산용)
+    scaler = StandardScaler()
+    counts = np.zeros(2)
+    n_train = n_test = train_pos = test_pos = 0
+    for part in _iter_clean(dataset, required_cols):
+        train, test = _split(part, cutoff)
+        n_test += len(test)
+        test_pos += int(test[LABEL].sum())
+        if train.empty:
+            continue
+        w = train[WEIGHT].to_numpy() if weighted else None
+        scaler.partial_fit(train[FEATURES].astype("float64"), sample_weight=w)
+        y = train[LABEL].to_numpy(dtype="int64")
+        counts += np.bincount(y, weights=w, minlength=2)[:2]
+        n_train += len(train)
+        train_pos += int(y.sum())
+
+    if n_train == 0 or n_test == 0:
+        raise ValueError(
+            f"Invalid split (holdout_days={holdout_days}): train_rows={n_train}, test_rows={n_test}"
+        )
+    if (counts == 0).any():
+        raise ValueError("Training labels have only one class. Cannot train the model.")
+    if test_pos == 0 or test_pos == n_test:
+        raise ValueError(
+            "Test labels have only one class for the selected holdout window "
+            f"(holdout_days={holdout_days}, test_rows={n_test}, positives={test_pos}). "
+            "Choose a different holdout window with both classes."
+        )
+    # sklearn "balanced": n / (n_classes * n_c)
+    class_weight = {c: float(counts.sum() / (2 * counts[c])) for c in (0, 1)}
+
+    # 2) epochs: partition 순서 / partition 내부 행 순서를 섞어 partial_fit
+    # average=True (ASGD): 평균 가중치라 partition 순서에 덜 민감하고 batch LR 해에 가까움
+    clf = SGDClassifier(
+        loss="log_loss", alpha=alpha, average=True, class_weight=class_weight, random_state=seed
+    )
+    rng = np.random.default_rng(seed)
+    keys = list_partitions(dataset)
+    for epoch in range(epochs):
+        order = [keys[i] for i in rng.permutation(len(keys))]
+        for part in _iter_clean(dataset, required_cols, keys=order):
+            train, _ = _split(part, cutoff)
+            if train.empty:
+                continue
+            train = train.iloc[rng.permutation(len(train))]
+            X = scaler.transform(train[FEATURES].astype("float64"))
+            w = train[WEIGHT].to_numpy() if weighted else None
+            clf.partial_fit(X, train[LABEL].to_numpy(dtype="int64"), classes=[0, 1], sample_weight=w)
+
+    model = Pipeline([("scaler", scaler), ("clf", clf)])
+
+    # 3) holdout 평가 (holdout 구간 예측만 메모리에 유지)
+    y_test, y_prob, w_test = [], [], []
+    for part in _iter_clean(dataset, required_cols):
+        _, test = _split(part, cutoff)
+        if test.empty:
+            continue
+        X_test = feature_frame(test, FEATURES)
+        y_test.append(test[LABEL].to_numpy())
+        y_prob.append(model.predict_proba(X_test)[:, 1])
+        if weighted:
+            w_test.append(test[WEIGHT].to_numpy())
+    y_test, y_prob = np.concatenate(y_test), np.concatenate(y_prob)
+    w_test = np.concatenate(w_test) if weighted else None
+    roc = roc_auc_score(y_test, y_prob, sample_weight=w_test)
+    pr = average_precision_score(y_test, y_prob, sample_weight=w_test)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - t0
+
+    meta = {
+        "model_name": MODEL_NAME,
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+        "data_file": str(dataset_path(dataset)),
+        "sample_weighted": weighted,
+        "features": FEATURES,
+        "label": LABEL,
+        "trainer": {
+            "type": "sgd_log_loss_incremental",
+            "averaged": True,
+            "epochs": epochs,
+            "alpha": alpha,
+            "class_weight": class_weight,
+            "partitions": len(keys),
+            "peak_traced_mb": round(peak / 1e6, 1),
+            "elapsed_s": round(elapsed, 2),
+        },
+        "split": {
+            "type": "time_holdout",
+            "holdout_days": holdout_days,
+            "cutoff": str(cutoff.date()),
+            "train_rows": int(n_train),
+            "test_rows": int(n_test),
+            "train_positive": int(train_pos),
+            "test_positive": int(test_pos),
+        },
+        "quick_metrics_on_holdout": {
+            "roc_auc": roc,
+            "pr_auc": pr,
+        },
+    }
+    # compiled artifact parity 는 마지막 holdout partition 으로 확인
+    save_artifacts(model, meta, check_X=X_test)
+    log(f"[train_incremental] {len(keys)} partitions x {epochs} epochs in {elapsed:.1f}s, "
+        f"peak traced memory {peak / 1e6:.1f} MB", partitions=len(keys), epochs=epochs,
+        peak_traced_mb=round(peak / 1e6, 1))
+    return model
+
+
+def parse_args():
+    parser = ArgumentParser(description="Out-of-core (partial_fit) training of the base model.")
+    parser.add_argument("--holdout-days", type=int, default=240)
+    parser.add_argument("--dataset", choices=["weather_labeled", "training_sample"], default="weather_labeled")
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--alpha", type=float, default=1e-4)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    train_incremental(
+        holdout_days=args.holdout_days,
+        dataset=args.dataset,
+        epochs=args.epochs,
+        alpha=args.alpha,
+        seed=args.seed,
+    )
@@ -1,9 +1,12 @@
 # src/pipelines/build_fire_events.py
-from src.core.fire_events import normalize_fire_events
+from src.core.fire_events import ingest_fire_events
+from src.core.telemetry import instrument
 
 
-def main():
-    normalize_fire_events()
+@instrument("pipelines.build_fire_events")
+def main(workers=None, stations="gangneung"):
+    # 전체 시도 shapefile -> fire_store -> 관측소 매칭 -> fire_events (process pool)
+    ingest_fire_events(workers=workers, stations=stations)
 
 
 if __name__ == "__main__":
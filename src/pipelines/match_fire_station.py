@@ -1,33 +1,23 @@
-import glob
-import os
-
-import geopandas as gpd
-
-from src.config.paths import FIRE_RAW_DIR, PROC_DIR
+from src.config.paths import FIRE_RAW_DIR, PROC_DIR, ensure_dirs
+from src.core.fire_store import load_fires
+from src.core.telemetry import count_written, instrument, log
 from src.core.stations import (
     WeatherStationRegistry,
     attach_nearest_station,
 )
 
+YEARS = [2020, 2021]
 
-def load_filtered_fires():
-    shp_list = glob.glob(os.path.join(str(FIRE_RAW_DIR), "*.shp"))
-    assert len(shp_list) == 1, f"*.shp 파일이 1개가 아닙니다: {shp_list}"
-    fire_shp = shp_list[0]
-    print("FIRE_SHP:", fire_shp)
-
-    fires = gpd.read_file(fire_shp)
-    print("fires.shape:", fires.shape)
-    print("fires.crs:", fires.crs)
 
-    fires["YEAR"] = fires["OCCRR_DTM"].astype(str).str[:4]
-    fires = fires[fires["YEAR"].isin(["2020", "2021"])].copy()
-    fires = fires.drop(columns=["YEAR"])
-
-    print("filtered fires.shape:", fires.shape)
+def load_filtered_fires(years=YEARS):
+    # 연도 필터는 fire_store partition 단위로 push-down (shapefile 전체를 읽지 않음)
+    # 강릉 관측소 레지스트리용이라 강원 데이터셋만 (전국은 fire_events.ingest_fire_events)
+    fires = load_fires(years=years, datasets=[FIRE_RAW_DIR.name]).drop(columns=["year"], errors="ignore")
+    log(f"filtered fires: {len(fires):,} rows x {fires.shape[1]} columns, crs {fires.crs}")
     return fires
 
 
+@instrument("pipelines.match_fire_station")
 def main():
     fires = load_filtered_fires()
 
@@ -38,20 +28,22 @@ def main():
         distance_col="dist_m",
     )
 
-    print("result shape:", fires_with_station.shape)
-    print("[station_id counts]")
-    print(fires_with_station["station_id"].value_counts())
-
-    print("\n[distance stats (m)]")
-    print(fires_with_station["dist_m"].describe())
+    counts = fires_with_station["station_id"].value_counts()
+    dist = fires_with_station["dist_m"].describe()
+    log(f"[station_id counts] {counts.to_dict()}", station_counts={str(k): int(v) for k, v in counts.items()})
+    log(f"[distance stats (m)] mean {dist['mean']:.0f}, max {dist['max']:.0f}",
+        dist_m={k: float(v) for k, v in dist.items()})
 
+    ensure_dirs(PROC_DIR)
     out_parquet = PROC_DIR / "fires_with_manual_station.parquet"
     fires_with_station.to_parquet(out_parquet, index=False)
-    print("saved parquet ->", out_parquet)
+    count_written(out_parquet)
+    log(f"saved parquet -> {out_parquet}", path=str(out_parquet))
 
     out_shp = PROC_DIR / "fires_with_manual_station.shp"
     fires_with_station.to_file(out_shp)
-    print("saved shapefile ->", out_shp)
+    count_written(out_shp)
+    log(f"saved shapefile -> {out_shp}", path=str(out_shp))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
+from argparse import ArgumentParser
+
 import geopandas as gpd
 import pandas as pd
 
-from src.config.paths import PROC_DIR
+from src.config.paths import PROC_DIR, ensure_dirs
+from src.core.interpolation import attach_idw_weather
+from src.core.telemetry import count_written, instrument, log
 from src.core.weather_daily import (
-    normalize_weather_daily,
+    read_weather_daily,
     build_past_n_days_features,
 )
 
@@ -11,8 +15,7 @@ from src.core.weather_daily import (
 def load_fires_with_station() -> gpd.GeoDataFrame:
     fire_proc_path = PROC_DIR / "fires_with_manual_station.parquet"
     fires = gpd.read_parquet(fire_proc_path)
-    print("fires shape:", fires.shape)
-    print("fires columns:", list(fires.columns))
+    log(f"fires: {len(fires):,} rows x {fires.shape[1]} columns", columns=list(fires.columns))
 
     # fire_date 생성
     if "OCCRR_DATE" in fires.columns:
@@ -50,27 +53,52 @@ def merge_fire_weather(
     return merged
 
 
-def main():
+@instrument("pipelines.merge_fire_weather")
+def main(weather: str = "station", k: int = 3, stations: str = "gangneung"):
+    """
+    weather="station": 매칭된 관측소 1곳의 일별 기상 조인 (기존)
+    weather="idw": k개 최근접 관측소 IDW 기상을 산불 위치 / fire_date 기준으로 붙이기
+    """
     fires = load_fires_with_station()
 
-    weather_daily = normalize_weather_daily()
+    # weather_daily 는 weather 단계에서 만든 결과를 읽기만 (raw CSV 재파싱 X)
+    weather_daily = read_weather_daily()
+
+    if weather == "idw":
+        from src.core.fire_events import station_registry
 
-    merged = merge_fire_weather(fires, weather_daily)
+        merged = attach_idw_weather(fires, weather_daily, station_registry(stations), k=k, date_col="fire_date")
+    elif weather == "station":
+        merged = merge_fire_weather(fires, weather_daily)
+    else:
+        raise ValueError(f"Unknown weather mode {weather!r} (expected 'station' or 'idw')")
 
+    ensure_dirs(PROC_DIR)
     out_parquet = PROC_DIR / "fire_weather_merged.parquet"
     out_csv = PROC_DIR / "fire_weather_merged.csv"
     merged.to_parquet(out_parquet, index=False)
     merged.to_csv(out_csv, index=False)
-    print("saved ->", out_parquet)
-    print("saved ->", out_csv)
+    count_written(out_parquet)
+    count_written(out_csv)
+    log(f"saved -> {out_parquet}", path=str(out_parquet))
+    log(f"saved -> {out_csv}", path=str(out_csv))
 
     # 과거 n일 피처 생성
     weather_features_3d = build_past_n_days_features(
         weather_daily,   # 이미 date 컬럼 있음
         n_days=3,
     )
-    print("weather_features_3d shape:", weather_features_3d.shape)
+    log(f"weather_features_3d: {len(weather_features_3d):,} rows x {weather_features_3d.shape[1]} columns")
+
+
+def parse_args():
+    parser = ArgumentParser(description="Join daily weather to matched fires (nearest station or IDW).")
+    parser.add_argument("--weather", choices=["station", "idw"], default="station")
+    parser.add_argument("--k", type=int, default=3, help="IDW: nearest stations per fire")
+    parser.add_argument("--stations", choices=["gangneung", "national"], default="gangneung")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(args.weather, args.k, args.stations)
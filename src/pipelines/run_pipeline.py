@@ -0,0 +1,324 @@
+"""
+Content-addressed DAG runner for the pipeline stages.
+
+    python -m src.pipelines.run_pipeline [--stages labels train] [--force] [--workers 4]
+
+Each stage declares its input/output paths. Its fingerprint is the sha256
+of its input contents and of the source of every `src.*` module the stage
+function can reach through imports (found statically, function-level
+imports included). A stage is
+skipped when the fingerprint matches the last successful run and its
+outputs still have the recorded contents. Stages whose upstream stages are
+done run concurrently in a process pool (e.g. fire matching and weather
+normalization). File hashes are cached by (size, mtime) in the state file
+so unchanged inputs are not re-read.
+"""
+import ast
+import hashlib
+import importlib
+import json
+import os
+import time
+from argparse import ArgumentParser
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.config.paths import (
+    FIRE_RAW_ROOT, FIRE_STORE_DIR, MODEL_DIR, PROC_DIR, ROOT, WEATHER_RAW_DIR,
+)
+from src.core.telemetry import log, run_id
+
+
+STATE_PATH = PROC_DIR / ".pipeline_state.json"
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    func: str  # "module:function"
+    inputs: Tuple[Path, ...]
+    outputs: Tuple[Path, ...]
+    kwargs: Tuple[Tuple[str, object], ...] = ()
+
+
+def default_stages() -> List[Stage]:
+    fires_matched = PROC_DIR / "fires_with_manual_station.parquet"
+    return [
+        # 산불 store 변환은 한 stage 에서만: match / fire_events 가 동시에 변환(rmtree)하지 않도록
+        Stage(
+            "fire_store",
+            "src.core.fire_store:ensure_fire_store",
+            inputs=(FIRE_RAW_ROOT,),
+            outputs=(FIRE_STORE_DIR,),
+        ),
+        Stage(
+            "match_fire_station",
+            "src.pipelines.match_fire_station:main",
+            inputs=(FIRE_STORE_DIR,),
+            outputs=(fires_matched,),
+        ),
+        Stage(
+            "fire_events",
+            "src.pipelines.build_fire_events:main",
+            # 기본 station set (강릉 2곳) 은 메타 CSV 를 읽지 않음
+            inputs=(FIRE_STORE_DIR,),
+            outputs=(PROC_DIR / "fire_events",),
+        ),
+        Stage(
+            "weather_daily",
+            "src.core.weather_daily:normalize_weather_daily",
+            inputs=(WEATHER_RAW_DIR,),
+            outputs=(PROC_DIR / "weather_daily",),
+        ),
+        Stage(
+            "merge_fire_weather",
+            "src.pipelines.merge_fire_weather:main",
+            inputs=(fires_matched, PROC_DIR / "weather_daily"),
+            outputs=(PROC_DIR / "fire_weather_merged.parquet",),
+        ),
+        Stage(
+            "labels",
+            "src.core.labeling:build_labels",
+            inputs=(PROC_DIR / "fire_events", PROC_DIR / "weather_daily"),
+            outputs=(PROC_DIR / "weather_labeled",),
+        ),
+        Stage(
+            "grid_labels",
+            "src.core.grid_labels:main",
+            inputs=(PROC_DIR / "fire_events",),
+            outputs=(PROC_DIR / "grid_labels_1000m.parquet",),
+            kwargs=(("cell_m", 1000),),
+        ),
+        Stage(
+            "train",
+            "src.models.evaluate:train_and_save",
+            inputs=(PROC_DIR / "weather_labeled",),
+            outputs=(MODEL_DIR / "base_lr.joblib", MODEL_DIR / "base_lr_meta.json",
+                     MODEL_DIR / "base_lr.compiled.json"),
+            kwargs=(("holdout_days", 240),),  # evaluate.py __main__ 과 동일
+        ),
+    ]
+
+
+def upstream(stage: Stage, stages: Sequence[Stage]) -> List[str]:
+    """Stages producing any of `stage`'s inputs."""
+    return [s.name for s in stages if s is not stage and set(s.outputs) & set(stage.inputs)]
+
+
+# --- fingerprints ---------------------------------------------------------
+
+class Hasher:
+    """sha256 of files/directories, cached by (size, mtime_ns)."""
+
+    def __init__(self, cache: Optional[dict] = None):
+        self.cache = cache if cache is not None else {}
+
+    def file(self, path: Path) -> str:
+        st = path.stat()
+        key = str(path)
+        cached = self.cache.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        self.cache[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def path(self, path: Path) -> Optional[str]:
+        """Content hash of a file or directory tree (hidden/tmp files ignored); None if missing."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        if path.is_file():
+            return self.file(path)
+        h = hashlib.sha256()
+        for p in sorted(path.rglob("*")):
+            rel = p.relative_to(path)
+            if p.is_dir() or any(part.startswith(".") for part in rel.parts):
+                continue
+            h.update(f"{rel.as_posix()}:{self.file(p)}\n".encode())
+        return h.hexdigest()
+
+    def code(self, module: str) -> str:
+        return self.file(module_path(module))
+
+
+def module_path(module: str) -> Optional[Path]:
+    """`src.x.y` -> source file under ROOT (package -> __init__.py); None if not a src module."""
+    parts = module.split(".")
+    if parts[0] != "src":
+        return None
+    base = ROOT.joinpath(*parts[1:])
+    for p in (base.with_suffix(".py"), base / "__init__.py"):
+        if p.is_file():
+            return p
+    return None
+
+
+def code_modules(root: str) -> List[str]:
+    """`root` and every src module it imports, transitively (static scan, incl. imports inside functions)."""
+    seen, todo = set(), [root]
+    while todo:
+        module = todo.pop()
+        path = module_path(module)
+        if module in seen or path is None:
+            continue
+        seen.add(module)
+        # 상위 package __init__ 도 import 시 실행됨
+        todo.extend(".".join(module.split(".")[:i]) for i in range(2, module.count(".") + 1))
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Import):
+                todo.extend(a.name for a in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                todo.append(node.module)
+                # from src.core import fire_store 형태
+                todo.extend(f"{node.module}.{a.name}" for a in node.names)
+    return sorted(seen)
+
+
+def stage_fingerprint(stage: Stage, hasher: Hasher) -> str:
+    h = hashlib.sha256(f"{stage.name}|{stage.func}|{stage.kwargs!r}\n".encode())
+    for module in code_modules(stage.func.split(":")[0]):
+        h.update(f"code {module}:{hasher.code(module)}\n".encode())
+    for p in stage.inputs:
+        h.update(f"input {p}:{hasher.path(p)}\n".encode())
+    return h.hexdigest()
+
+
+def load_state() -> dict:
+    if STATE_PATH.exists():
+        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    return {"stages": {}, "hash_cache": {}}
+
+
+def save_state(state: dict) -> None:
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, STATE_PATH)
+
+
+def is_up_to_date(stage: Stage, fingerprint: str, state: dict, hasher: Hasher) -> bool:
+    rec = state["stages"].get(stage.name)
+    if not rec or rec["fingerprint"] != fingerprint:
+        return False
+    return all(hasher.path(p) == rec["outputs"].get(str(p)) for p in stage.outputs)
+
+
+# --- execution ------------------------------------------------------------
+
+def _run_stage(func: str, kwargs: dict) -> float:
+    """Process-pool entry point: import and run `module:function` (result discarded)."""
+    module, name = func.split(":")
+    t0 = time.perf_counter()
+    getattr(importlib.import_module(module), name)(**kwargs)
+    return time.perf_counter() - t0
+
+
+def run_pipeline(
+        only: Optional[Sequence[str]] = None,
+        force: bool = False,
+        workers: int = 4,
+        dry_run: bool = False,
+) -> Dict[str, str]:
+    """
+    Run stages in dependency order, skipping up-to-date ones.
+
+    only: restrict to these stages (their upstream stages are still checked).
+    Returns {stage: "ran" | "skipped" | "failed" | "blocked" | "would-run"}.
+    """
+    stages = default_stages()
+    by_name = {s.name: s for s in stages}
+    deps = {s.name: upstream(s, stages) for s in stages}
+
+    if only:
+        wanted = set()
+        todo = list(only)
+        while todo:
+            name = todo.pop()
+            if name not in by_name:
+                raise KeyError(f"Unknown stage: {name} (choose from {list(by_name)})")
+            if name not in wanted:
+                wanted.add(name)
+                todo.extend(deps[name])
+        stages = [s for s in stages if s.name in wanted]
+
+    # 자식 프로세스의 telemetry 가 같은 run_id 로 묶이도록 (FIRECAST_RUN_ID 로 상속)
+    log(f"[pipeline] run_id={run_id()}")
+    state = load_state()
+    hasher = Hasher(state.setdefault("hash_cache", {}))
+    status: Dict[str, str] = {}
+    running = {}
+
+    def _ready(s: Stage) -> bool:
+        return s.name not in status and s.name not in running.values() and all(
+            status.get(d) in ("ran", "skipped", "would-run") for d in deps[s.name] if d in by_name
+        )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while len(status) < len(stages):
+            for s in stages:
+                if s.name in status or s.name in running.values():
+                    continue
+                if any(status.get(d) in ("failed", "blocked") for d in deps[s.name]):
+                    status[s.name] = "blocked"
+                    continue
+                if not _ready(s):
+                    continue
+
+                fp = stage_fingerprint(s, hasher)
+                if not force and is_up_to_date(s, fp, state, hasher):
+                    status[s.name] = "skipped"
+                    log(f"[pipeline] {s.name}: up to date, skipped")
+                elif dry_run:
+                    status[s.name] = "would-run"
+                    log(f"[pipeline] {s.name}: would run")
+                else:
+                    log(f"[pipeline] {s.name}: running")
+                    running[pool.submit(_run_stage, s.func, dict(s.kwargs))] = s.name
+                    state["stages"][s.name] = {"fingerprint": fp, "outputs": None}
+
+            if not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                try:
+                    elapsed = fut.result()
+                except Exception as e:
+                    status[name] = "failed"
+                    state["stages"].pop(name, None)
+                    log(f"[pipeline] {name}: FAILED ({type(e).__name__}: {e})")
+                    continue
+                status[name] = "ran"
+                rec = state["stages"][name]
+                rec["outputs"] = {str(p): hasher.path(p) for p in by_name[name].outputs}
+                rec["elapsed_s"] = round(elapsed, 3)
+                log(f"[pipeline] {name}: done in {elapsed:.1f}s")
+            save_state(state)
+
+    if not dry_run:
+        save_state(state)
+    failed = [n for n, st in status.items() if st in ("failed", "blocked")]
+    if failed:
+        raise RuntimeError(f"Pipeline stages failed/blocked: {failed}")
+    return status
+
+
+def parse_args():
+    parser = ArgumentParser(description="Run pipeline stages, skipping up-to-date ones.")
+    parser.add_argument("--stages", nargs="*", default=None, help="only these stages (+ their upstream)")
+    parser.add_argument("--force", action="store_true", help="run even if up to date")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--dry-run", action="store_true")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_pipeline(args.stages, force=args.force, workers=args.workers, dry_run=args.dry_run)
@@ -0,0 +1,298 @@
+"""
+Near-real-time watch mode: hourly observation files -> running daily state -> rescoring.
+
+    python -m src.pipelines.watch_hourly --interval 5        # poll WEATHER_HOURLY_DIR
+    python -m src.pipelines.watch_hourly --once              # process what is there, then exit
+
+New CSVs in WEATHER_HOURLY_DIR (same columns as the raw weather CSVs; any
+number of stations / hours per file) are cleaned with `clean_hourly_weather`
+and reduced with `daily_partials`. The result is merged into a per-station
+running state for the recent days (sum / count of TA, POP, WD_sin, WD_cos,
+TA min / max, is_precip max, SKY counts) with `combine_partials`, so a new
+hour touches only its (station_id, date) rows and history is never
+re-aggregated. Observations already seen (station_id, obs_datetime) are
+skipped, so re-delivered files do not double count.
+
+Only the affected (station_id, date) pairs are finalized (`finalize_partials`)
+and rescored with the base model; the latest risk per station goes to
+NOWCAST_DIR/nowcast_<date>.parquet. The state (WATCH_STATE_DIR) keeps
+`keep_days` days and survives restarts. weather_daily is not written: the
+batch ingest of the raw CSVs stays the system of record.
+"""
+import json
+import os
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from src.config.paths import MODEL_DIR, NOWCAST_DIR, WATCH_STATE_DIR, WEATHER_HOURLY_DIR, ensure_dirs
+from src.core.telemetry import count_read, count_written, instrument, log
+from src.core.weather_daily import (
+    TARGET_HOURS,
+    clean_hourly_weather,
+    combine_partials,
+    daily_partials,
+    detect_csv_encoding,
+    finalize_partials,
+    resolve_weather_columns,
+)
+from src.models.predict_daily_base import FEATURES, MODEL_NAME, load_model, score_rows
+
+
+STATE_VERSION = 1
+KEYS = ["station_id", "date"]
+KEEP_DAYS = 3
+# 아직 쓰는 중인 파일을 읽지 않도록: 마지막 수정 후 이 시간(초)이 지난 파일만 처리
+SETTLE_S = 1.0
+
+
+def _stat_key(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+@dataclass
+class WatchState:
+    """Running daily partials of the recent days + which files / observations were consumed."""
+
+    stats: Optional[pd.DataFrame] = None
+    sky_counts: Optional[pd.DataFrame] = None
+    seen: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(
+        {"station_id": pd.Series(dtype="int64"), "obs_datetime": pd.Series(dtype="datetime64[ns]")}))
+    files: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, state_dir=None) -> "WatchState":
+        state_dir = Path(state_dir or WATCH_STATE_DIR)
+        meta_path = state_dir / "state.json"
+        if not meta_path.exists():
+            return cls()
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != STATE_VERSION:
+            log(f"[watch] state version {meta.get('version')} != {STATE_VERSION}, starting fresh")
+            return cls()
+
+        def read(name):
+            path = state_dir / f"{name}.parquet"
+            return pd.read_parquet(path) if path.exists() else None
+
+        state = cls(stats=read("stats"), sky_counts=read("sky_counts"), files=meta["files"])
+        seen = read("seen")
+        if seen is not None:
+            state.seen = seen
+        return state
+
+    def save(self, state_dir=None) -> None:
+        state_dir = Path(state_dir or WATCH_STATE_DIR)
+        ensure_dirs(state_dir)
+        for name in ("stats", "sky_counts", "seen"):
+            df = getattr(self, name)
+            if df is not None:
+                _write_parquet(df, state_dir / f"{name}.parquet")
+        # state.json 을 마지막에: 중간에 죽으면 이 배치의 파일은 다음 실행에서 다시 처리 (seen 으로 중복 제외)
+        tmp = state_dir / ".state.json.tmp"
+        tmp.write_text(json.dumps({"version": STATE_VERSION, "files": self.files}), encoding="utf-8")
+        os.replace(tmp, state_dir / "state.json")
+
+    def new_files(self, watch_dir=None, settle_s: float = SETTLE_S) -> List[str]:
+        """CSV files in watch_dir that are new or changed since they were consumed (and not being written)."""
+        watch_dir = Path(watch_dir or WEATHER_HOURLY_DIR)
+        now = time.time()
+        out = []
+        for p in sorted(watch_dir.glob("*.csv")):
+            if p.name.startswith("."):
+                continue
+            st = p.stat()
+            if now - st.st_mtime < settle_s:
+                continue
+            if self.files.get(p.name) != [st.st_size, st.st_mtime_ns]:
+                out.append(str(p))
+        return out
+
+    def add(self, hourly: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge cleaned hourly rows into the running partials.
+
+        Returns the (station_id, date) pairs that changed. Rows whose
+        (station_id, obs_datetime) is already in the state are ignored.
+        """
+        hourly = hourly.drop_duplicates(["station_id", "obs_datetime"], keep="last")
+        seen = hourly[["station_id", "obs_datetime"]].merge(
+            self.seen, on=["station_id", "obs_datetime"], how="left", indicator=True)["_merge"]
+        hourly = hourly[(seen == "left_only").to_numpy()]
+        if hourly.empty:
+            return pd.DataFrame(columns=KEYS)
+
+        stats, sky_counts = daily_partials(hourly)
+        if self.stats is not None:
+            stats, sky_counts = combine_partials([self.stats, stats], [self.sky_counts, sky_counts])
+        self.stats, self.sky_counts = stats, sky_counts
+        self.seen = pd.concat([self.seen, hourly[["station_id", "obs_datetime"]]], ignore_index=True)
+        return hourly[KEYS].drop_duplicates().reset_index(drop=True)
+
+    def prune(self, keep_days: int = KEEP_DAYS) -> None:
+        """Drop days older than the newest `keep_days` days."""
+        if self.stats is None or self.stats.empty:
+            return
+        cutoff = self.stats["date"].max() - pd.Timedelta(days=keep_days - 1)
+        self.stats = self.stats[self.stats["date"] >= cutoff].reset_index(drop=True)
+        if self.sky_counts is not None:
+            self.sky_counts = self.sky_counts[self.sky_counts["date"] >= cutoff].reset_index(drop=True)
+        self.seen = self.seen[self.seen["obs_datetime"] >= cutoff].reset_index(drop=True)
+
+    def daily(self, keys: pd.DataFrame) -> pd.DataFrame:
+        """Current daily features (weather_daily schema) of the given (station_id, date) pairs."""
+        stats = self.stats.merge(keys, on=KEYS)
+        sky = self.sky_counts.merge(keys, on=KEYS) if self.sky_counts is not None else None
+        daily = finalize_partials(stats, sky)
+        return daily.merge(stats[KEYS + ["n_obs"]].astype({"station_id": daily["station_id"].dtype}), on=KEYS)
+
+
+def read_hourly_file(path: str, hours: Optional[Sequence[int]] = TARGET_HOURS) -> pd.DataFrame:
+    """One hourly CSV -> cleaned rows (TARGET_STATIONS, `hours` only; None = every hour)."""
+    encoding = detect_csv_encoding(path)
+    count_read(path)
+    header = pd.read_csv(path, nrows=0, encoding=encoding)
+    col_map = resolve_weather_columns(header.columns)
+    str_cols = [col_map[c] for c in ["obs_datetime", "SKY"] if c in col_map]
+    raw = pd.read_csv(path, encoding=encoding, usecols=list(col_map.values()),
+                      dtype={c: "string" for c in str_cols})
+    weather = clean_hourly_weather(raw, col_map)
+    if hours is not None:
+        weather = weather[weather["hour"].isin(hours)]
+    return weather
+
+
+def write_nowcast(scored: pd.DataFrame, out_dir=None) -> List[Path]:
+    """Upsert the latest risk per station into NOWCAST_DIR/nowcast_<date>.parquet."""
+    out_dir = Path(out_dir or NOWCAST_DIR)
+    ensure_dirs(out_dir)
+    written = []
+    for date, rows in scored.groupby("date", sort=True):
+        path = out_dir / f"nowcast_{pd.Timestamp(date).date()}.parquet"
+        if path.exists():
+            old = pd.read_parquet(path)
+            rows = pd.concat([old[~old["station_id"].isin(rows["station_id"])], rows], ignore_index=True)
+        _write_parquet(rows.sort_values("station_id").reset_index(drop=True), path)
+        count_written(path)
+        written.append(path)
+    return written
+
+
+@instrument()
+def process_files(state: WatchState, model, paths: Sequence[str],
+                  hours: Optional[Sequence[int]] = TARGET_HOURS, keep_days: int = KEEP_DAYS) -> dict:
+    """Consume `paths` into `state`, rescore the affected station-days and write the nowcast."""
+    t0 = time.perf_counter()
+    parts = [read_hourly_file(p, hours) for p in paths]
+    hourly = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    affected = state.add(hourly) if not hourly.empty else pd.DataFrame(columns=KEYS)
+    state.prune(keep_days)
+    # 보관 기간보다 오래된 날짜의 늦은 관측은 점수 대상에서 제외
+    if state.stats is not None and not affected.empty:
+        affected = affected[affected["date"] >= state.stats["date"].min()]
+
+    scored = pd.DataFrame()
+    skipped = 0
+    if not affected.empty:
+        daily = state.daily(affected)
+        complete = daily[FEATURES].notna().all(axis=1)
+        skipped = int((~complete).sum())
+        daily = daily[complete]
+        if not daily.empty:
+            scored = score_rows(model, daily).merge(daily[KEYS + ["n_obs"]], on=KEYS, how="left")
+            scored["updated_at"] = pd.Timestamp(datetime.now()).floor("s")
+            write_nowcast(scored)
+
+    for p in paths:
+        state.files[os.path.basename(p)] = _stat_key(p)
+    state.save()
+    summary = {
+        "files": len(paths),
+        "rows": len(hourly),
+        "station_days": len(affected),
+        "rescored": len(scored),
+        "incomplete": skipped,
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+    log(f"[watch] {summary['files']} files, {summary['rows']} obs -> "
+        f"{summary['rescored']} station-days rescored in {summary['seconds']:.3f}s"
+        + (f" ({skipped} incomplete)" if skipped else ""), **summary)
+    return dict(summary, scored=scored)
+
+
+def _model_key():
+    for name in ("base_lr_meta.json", MODEL_NAME):
+        path = MODEL_DIR / name
+        if path.exists():
+            return _stat_key(str(path))
+    return None
+
+
+def watch(
+        interval: float = 5.0,
+        once: bool = False,
+        scorer: Optional[str] = None,
+        hours: Optional[Sequence[int]] = TARGET_HOURS,
+        keep_days: int = KEEP_DAYS,
+        watch_dir=None,
+) -> Optional[dict]:
+    """
+    Poll `watch_dir` (default WEATHER_HOURLY_DIR) every `interval` seconds.
+
+    The model is loaded once and reloaded when it is retrained. once=True
+    processes the files present now and returns the summary.
+    """
+    watch_dir = Path(watch_dir or WEATHER_HOURLY_DIR)
+    ensure_dirs(watch_dir)
+    state = WatchState.load()
+    model, model_key = None, None
+    log(f"[watch] {watch_dir} every {interval:g}s (hours={list(hours) if hours else 'all'}, "
+        f"{len(state.files)} files already consumed)")
+    try:
+        while True:
+            paths = state.new_files(watch_dir, settle_s=0.0 if once else SETTLE_S)
+            summary = None
+            if paths:
+                key = _model_key()
+                if model is None or key != model_key:
+                    model, model_key = load_model(scorer), key
+                summary = process_files(state, model, paths, hours, keep_days)
+            if once:
+                return summary
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        log("[watch] stopped")
+    return None
+
+
+def parse_args():
+    parser = ArgumentParser(description="Watch hourly observation files, update daily state, rescore.")
+    parser.add_argument("--interval", type=float, default=5.0, help="poll interval (s)")
+    parser.add_argument("--once", action="store_true", help="process current files and exit")
+    parser.add_argument("--all-hours", action="store_true", help="aggregate every hour, not only 00/12")
+    parser.add_argument("--keep-days", type=int, default=KEEP_DAYS)
+    parser.add_argument("--scorer", choices=["auto", "compiled", "sklearn"], default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    watch(
+        interval=args.interval,
+        once=args.once,
+        scorer=args.scorer,
+        hours=None if args.all_hours else TARGET_HOURS,
+        keep_days=args.keep_days,
+    )
@@ -1,22 +1,27 @@
 # src/validation/validate_fire_weather.py
 from pathlib import Path
 import pandas as pd
+import pyarrow.parquet as pq
 from src.config.paths import PROC_DIR
+from src.core.datasets import dataset_exists, dataset_path, read_dataset
 
 
 def validate_fire_weather():
-    fire_path = PROC_DIR / "fire_events.parquet"
     merged_path = PROC_DIR / "fire_weather_merged.parquet"
 
-    if not fire_path.exists():
-        print(f"[ERROR] {fire_path} 가 없습니다. 먼저 fire_events 파이프라인을 실행하세요.")
+    if not dataset_exists("fire_events"):
+        print(f"[ERROR] {dataset_path('fire_events')} 가 없습니다. 먼저 fire_events 파이프라인을 실행하세요.")
         return
     if not merged_path.exists():
         print(f"[ERROR] {merged_path} 가 없습니다. 먼저 merge_fire_weather 파이프라인을 실행하세요.")
         return
 
-    fires = pd.read_parquet(fire_path)
-    merged = pd.read_parquet(merged_path)
+    # 검증에 필요한 컬럼만 읽기
+    fires = read_dataset("fire_events", columns=["fire_id"])
+    merged_cols = pq.read_schema(merged_path).names
+    weather_cols = [c for c in ["TA", "TMN", "TMX", "RN"] if c in merged_cols]
+    read_cols = [c for c in ["fire_date", "date", "station_id"] if c in merged_cols] + weather_cols
+    merged = pd.read_parquet(merged_path, columns=read_cols)
 
     print("fires rows:", len(fires))
     print("merged rows:", len(merged))
@@ -27,7 +32,6 @@ def validate_fire_weather():
         print("[WARN] Row count mismatch!")
 
     # 기상 Null 비율
-    weather_cols = [c for c in ["TA", "TMN", "TMX", "RN"] if c in merged.columns]
     print("\n[Null ratio for weather columns]")
     print(merged[weather_cols].isna().mean())
 